@@ -3,32 +3,33 @@
 Script to extract data from GBoS-National-Accounts.xlsx and generate datasets from 2004 to 2021
 """
 
-import pandas as pd
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import csv
 from pathlib import Path
 import numpy as np
 from datetime import datetime
 
+from seed.excel_ingest import ExcelSheetCache
+
 
-def read_excel_data():
+def read_excel_data(use_cache=True):
     """Read and extract data from the Excel file"""
     try:
         # Read the Excel file
         excel_file = "external_data/GBoS-National-Accounts.xlsx"
 
-        # Get all sheet names
-        xl = pd.ExcelFile(excel_file)
-        print(f"Available sheets: {xl.sheet_names}")
-
-        # Read all sheets
-        all_data = {}
-        for sheet_name in xl.sheet_names:
-            try:
-                df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                all_data[sheet_name] = df
-                print(f"Successfully read sheet: {sheet_name} with shape {df.shape}")
-            except Exception as e:
-                print(f"Error reading sheet {sheet_name}: {e}")
+        # Parse the workbook once; later runs load the cached sheets
+        cache = ExcelSheetCache(excel_file)
+        if not use_cache:
+            cache.invalidate()
+        all_data = cache.load()
+        print(f"Available sheets: {list(all_data.keys())}")
+
+        for sheet_name, df in all_data.items():
+            print(f"Successfully read sheet: {sheet_name} with shape {df.shape}")
 
         return all_data
     except Exception as e:
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Run data loading, training and prediction with memory profiling on and print
+the per-stage peak/delta report and the top allocation sites
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+
+from seed.model import SeedModel
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile memory use of the training pipeline")
+    parser.add_argument("--first-year", type=int, default=2001, help="First year of data to load")
+    parser.add_argument("--last-year", type=int, default=2021, help="Last year of data to load")
+    parser.add_argument("--top", type=int, default=3, help="Allocation sites shown per stage")
+    parser.add_argument("--report", default=None, help="Also write the stage table to this CSV file")
+    args = parser.parse_args()
+
+    model = SeedModel()
+    profiler = model.profile_memory(top_n=max(args.top, 10))
+    try:
+        data = model.load_real_data(years=range(args.first_year, args.last_year + 1))
+        model.train_models(data)
+        model.predict(data)
+    finally:
+        profiler.stop()
+
+    print("\n=== Memory Profile ===")
+    print(profiler.format_report(top_n=args.top))
+    if args.report:
+        profiler.report().to_csv(args.report, index=False)
+        print(f"\nStage report saved to {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,22 +7,50 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from seed.model import GambiaCropPredictor
+from seed.model import SeedModel
+from seed.main import load_saved_model
 import argparse
+import json
+import math
+import signal
+import socketserver
 from datetime import datetime
+from pathlib import Path
+import pandas as pd
 
+DEFAULT_MODEL_PATH = "seed_model.pkl"
+READ_SIZE = 1 << 16
 
-def run_single_year_prediction(year, crop=None):
+
+def load_or_train_model(model_path=DEFAULT_MODEL_PATH, distill=False):
+    """
+    Load the saved model if it was trained on the current data, otherwise
+    train a new one and save it to model_path. With distill=True the model
+    also gets (and saves) students for its random-forest targets.
+    """
+    model = SeedModel()
+    model_path = Path(model_path)
+    if model_path.exists() and load_saved_model(model, model_path):
+        if distill and not model.students and model.distill():
+            model.save_model(model_path)
+        return model
+
+    model = SeedModel()
+    real_data = model.load_real_data()
+    model.train_models(real_data, distill=distill)
+    model.save_model(model_path)
+    return model
+
+
+def run_single_year_prediction(year, crop=None, model_path=DEFAULT_MODEL_PATH):
     """
     Run predictions for a single year
     """
     print(f"🌾 Running predictions for year {year}")
     print("=" * 50)
     
-    # Initialize and train model
-    model = GambiaCropPredictor()
-    real_data = model.load_real_data()
-    model.train_models(real_data)
+    # Load the saved model, or train one
+    model = load_or_train_model(model_path)
     
     # Define crops to predict
     if crop:
@@ -116,16 +144,14 @@ def run_single_year_prediction(year, crop=None):
                 print(f"{crop_name:<12} {'ERROR':<15} {'ERROR':<15} {'ERROR':<15}")
 
 
-def run_rainfall_analysis(year):
+def run_rainfall_analysis(year, model_path=DEFAULT_MODEL_PATH):
     """
     Run rainfall impact analysis for a specific year
     """
     print(f"🌧️  Rainfall impact analysis for year {year}")
     print("=" * 50)
     
-    model = GambiaCropPredictor()
-    real_data = model.load_real_data()
-    model.train_models(real_data)
+    model = load_or_train_model(model_path)
     
     rainfall_levels = [400, 600, 800, 1000, 1200, 1400]
     crops = ["Rice", "Millet", "Groundnuts"]
@@ -159,21 +185,169 @@ def run_rainfall_analysis(year):
                 print(f"{rainfall:<15} {crop:<12} {'ERROR':<15} {'ERROR':<15} {'ERROR':<15}")
 
 
+def parse_request(model, request):
+    """
+    (model inputs, None) for a request that provides a crop and a finite
+    value for every numeric input, otherwise (None, error)
+    """
+    inputs = {"crop": request.get("crop")}
+    if inputs["crop"] is None:
+        return None, "missing input 'crop'"
+    for feature in model.raw_input_features():
+        value = request.get(feature)
+        if value is None:
+            return None, f"missing input '{feature}'"
+        try:
+            # bool is an int subclass, but true/false is not a measurement
+            number = float("nan") if isinstance(value, bool) else float(value)
+        except (TypeError, ValueError):
+            number = float("nan")
+        if not math.isfinite(number):
+            return None, f"invalid {feature}: {json.dumps(value)}"
+        inputs[feature] = number
+    return inputs, None
+
+
+def encode_response(response):
+    """One strict JSON line; non-finite predictions become an error response"""
+    try:
+        return json.dumps(response, allow_nan=False) + "\n"
+    except ValueError:
+        error = {"id": response.get("id"), "error": "prediction is not a finite number"}
+        return json.dumps(error) + "\n"
+
+
+def predict_requests(model, lines, fast=False):
+    """
+    Answer a batch of JSON-line scenario requests with one predict call.
+    Each request is an object of model inputs with an optional "id"; each
+    response carries the same id and either the predictions or an error.
+    """
+    responses = [None] * len(lines)
+    requests = []
+    for i, line in enumerate(lines):
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            responses[i] = {"id": None, "error": f"invalid JSON: {e}"}
+            continue
+        inputs, error = parse_request(model, request)
+        if error:
+            responses[i] = {"id": request.get("id"), "error": error}
+        else:
+            requests.append((i, request, inputs))
+
+    def respond(i, request, predictions, row):
+        responses[i] = {"id": request.get("id")}
+        for target, values in predictions.items():
+            responses[i][target] = float(values[row])
+
+    if requests:
+        inputs = pd.DataFrame([inputs for _, _, inputs in requests])
+        try:
+            predictions = model.predict(inputs, fast=fast)
+            for row, (i, request, _) in enumerate(requests):
+                respond(i, request, predictions, row)
+        except Exception:
+            # Isolate the bad requests instead of failing the whole batch
+            for i, request, inputs in requests:
+                try:
+                    respond(i, request, model.predict(pd.DataFrame([inputs]), fast=fast), 0)
+                except Exception as e:
+                    responses[i] = {"id": request.get("id"), "error": str(e)}
+
+    return [encode_response(response) for response in responses]
+
+
+def serve_stream(model, read, write, fast=False):
+    """
+    Read newline-delimited requests via read() (bytes, b"" at end of input)
+    and write responses via write(). Every complete line that has arrived
+    by the time a read returns is answered as one batch.
+    """
+    pending = b""
+    while True:
+        chunk = read()
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split(b"\n")
+        lines = [line for line in lines if line.strip()]
+        if lines:
+            write("".join(predict_requests(model, lines, fast)).encode())
+
+    if pending.strip():
+        write("".join(predict_requests(model, [pending], fast)).encode())
+
+
+def serve_stdin(model, fast=False):
+    """JSONL daemon on stdin/stdout"""
+    stdin, stdout = sys.stdin.fileno(), sys.stdout.buffer
+
+    def write(payload):
+        stdout.write(payload)
+        stdout.flush()
+
+    serve_stream(model, lambda: os.read(stdin, READ_SIZE), write, fast)
+
+
+def serve_socket(model, socket_path, fast=False):
+    """JSONL daemon on a Unix socket; one thread per connection"""
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            serve_stream(
+                model, lambda: self.request.recv(READ_SIZE), self.request.sendall, fast
+            )
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    # Shut down (and remove the socket) on SIGTERM as well as Ctrl-C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    with Server(socket_path, Handler) as server:
+        print(f"Serving predictions on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
 def main():
     """
     Main function with command line arguments
     """
     parser = argparse.ArgumentParser(description="Run crop predictions for specific years")
-    parser.add_argument("year", type=int, help="Year to predict for")
+    parser.add_argument("year", type=int, nargs="?", help="Year to predict for")
     parser.add_argument("--crop", type=str, help="Specific crop to predict (optional)")
     parser.add_argument("--rainfall", action="store_true", help="Run rainfall impact analysis")
+    parser.add_argument("--model", default=DEFAULT_MODEL_PATH, help="Saved model to load (trained and saved if missing or stale)")
+    parser.add_argument("--serve", action="store_true", help="Answer JSON-line scenario requests on stdin until end of input")
+    parser.add_argument("--socket", type=str, help="With --serve, listen on this Unix socket instead of stdin")
+    parser.add_argument("--fast", action="store_true", help="With --serve, answer with the distilled student models where available")
     
     args = parser.parse_args()
     
-    if args.rainfall:
-        run_rainfall_analysis(args.year)
+    if args.serve:
+        # Keep stdout clean for responses: loading/training chatter goes to stderr
+        stdout, sys.stdout = sys.stdout, sys.stderr
+        model = load_or_train_model(args.model, distill=args.fast)
+        sys.stdout = stdout
+        if args.socket:
+            serve_socket(model, args.socket, args.fast)
+        else:
+            serve_stdin(model, args.fast)
+    elif args.year is None:
+        parser.error("year is required unless --serve is given")
+    elif args.rainfall:
+        run_rainfall_analysis(args.year, args.model)
     else:
-        run_single_year_prediction(args.year, args.crop)
+        run_single_year_prediction(args.year, args.crop, args.model)
 
 
 if __name__ == "__main__":
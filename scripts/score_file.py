@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Score a CSV or Parquet file of scenario rows with the saved model, chunk by
+chunk, writing yield, price and production predictions to an output file
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import logging
+
+from seed.file_scoring import score_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-score a CSV/Parquet file of scenarios")
+    parser.add_argument("input", help="CSV or Parquet file with crop and the model's input columns")
+    parser.add_argument("output", help="Output file (.csv, or .parquet with pyarrow installed)")
+    parser.add_argument("--model", default="seed_model.pkl", help="Saved model to score with")
+    parser.add_argument("--rejects", default=None, help="File for rows that cannot be scored (default: <output>.rejects.csv)")
+    parser.add_argument("--chunk-rows", type=int, default=100_000, help="Rows read and scored per chunk")
+    parser.add_argument("--workers", type=int, default=1, help="Scoring processes per chunk")
+    parser.add_argument("--fast", action="store_true", help="Score with the distilled student models where available")
+    parser.add_argument("--quiet", action="store_true", help="Only print the final summary")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="%(asctime)s %(message)s",
+    )
+
+    if not os.path.exists(args.model):
+        print(f"Model not found: {args.model} (run seed/main.py to train and save one)")
+        return 1
+
+    stats = score_file(
+        args.model,
+        args.input,
+        args.output,
+        rejects_path=args.rejects,
+        chunk_rows=args.chunk_rows,
+        n_workers=args.workers,
+        fast=args.fast,
+    )
+    print(f"✅ Scored {args.input}: {stats.summary()}")
+    if stats.rejected:
+        print(f"⚠️  {stats.rejected} rows could not be scored; see the rejects file")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,79 +1,83 @@
 #!/usr/bin/env python3
 """
-Verification script to show summary of all created datasets
+Verification script to check every dataset partition in data/ against the
+content-hash manifest (schema, row count and checksum)
 """
 
+import sys
 import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
 from pathlib import Path
 
+from seed.manifest import DatasetManifest, verify_data_tree
 
-def count_files_in_directory(directory):
-    """Count CSV files in a directory"""
-    if not os.path.exists(directory):
-        return 0
-    return len([f for f in os.listdir(directory) if f.endswith(".csv")])
+CATEGORIES = ["crops", "fisheries", "sales", "livestock", "practices", "tenure"]
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Verify datasets against data/manifest.json")
+    parser.add_argument("--data-dir", default="data", help="Data directory to verify")
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Record the files on disk in the manifest instead of verifying them",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Verification threads")
+    args = parser.parse_args()
+
     print("=== Gambia Agricultural Datasets Verification ===\n")
 
-    data_dir = Path("data")
-    years = [2001, 2002, 2003, 2004]
-    categories = ["crops", "fisheries", "sales", "livestock", "practices", "tenure"]
-
-    total_files = 0
-
-    for year in years:
-        year_dir = data_dir / str(year)
-        if year_dir.exists():
-            file_count = count_files_in_directory(year_dir)
-            total_files += file_count
-            print(f"Year {year}: {file_count} datasets")
-
-            # List the files
-            for category in categories:
-                csv_file = year_dir / f"{category}_{year}.csv"
-                if csv_file.exists():
-                    print(f"  ✓ {category}_{year}.csv")
-                else:
-                    print(f"  ✗ {category}_{year}.csv (missing)")
-            print()
-
-    print(f"Total datasets created: {total_files}")
-    print(f"Expected datasets: {len(years) * len(categories)}")
-
-    if total_files == len(years) * len(categories):
-        print("✓ All datasets successfully created!")
-    else:
-        print("✗ Some datasets are missing")
-
-    # Show summary file
-    summary_file = data_dir / "dataset_summary.txt"
-    if summary_file.exists():
-        print(f"\n✓ Summary file created: {summary_file}")
-        with open(summary_file, "r") as f:
-            content = f.read()
-            print(f"Summary file size: {len(content)} characters")
-
-    print("\n=== Dataset Categories ===")
-    print(
-        "1. Crops: Rice, Millet, Sorghum, Maize, Groundnuts, Cotton, Vegetables, Fruits"
-    )
-    print("2. Fisheries: Fresh Fish, Dried Fish, Smoked Fish, Crustaceans, Molluscs")
-    print("3. Sales: Cereals, Groundnuts, Vegetables, Fish, Livestock, Fruits")
-    print("4. Livestock: Cattle, Sheep, Goats, Poultry, Pigs, Horses, Donkeys")
-    print(
-        "5. Farm Practices: Irrigation, Fertilizer Use, Pesticide Use, Mechanization, Organic Farming"
-    )
-    print(
-        "6. Land Tenure: Owned Land, Rented Land, Communal Land, Leased Land, Inherited Land"
-    )
+    data_dir = Path(args.data_dir)
+    manifest = DatasetManifest.load(data_dir)
+
+    if args.update:
+        rescanned = manifest.refresh(max_workers=args.workers)
+        manifest.save()
+        print(f"Recorded {len(rescanned)} partitions in {manifest.path}")
+        return 0
 
-    print("\n=== Data Sources ===")
-    print("• FAO Agricultural Census Report 2001/2002")
-    print("• GBOS (Gambia Bureau of Statistics) Data")
-    print("• Years covered: 2001, 2002, 2003, 2004")
+    # Without a baseline there is nothing to verify against; building one
+    # here would accept whatever is on disk
+    if not manifest.partitions:
+        print(f"✗ No manifest found at {manifest.path}")
+        print("  Run with --update to record the current files as the known-good baseline")
+        return 1
+
+    start = time.perf_counter()
+    results = verify_data_tree(manifest, max_workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    by_year = {}
+    for result in results:
+        year, category = result["key"].split("/")
+        by_year.setdefault(year, {})[category] = result
+
+    failures = 0
+    for year, categories in sorted(by_year.items()):
+        print(f"Year {year}: {len(categories)} datasets")
+        for category in CATEGORIES + sorted(set(categories) - set(CATEGORIES)):
+            result = categories.get(category)
+            if result is None:
+                failures += 1
+                print(f"  ✗ {category}_{year}.csv (missing)")
+            elif result["problems"]:
+                failures += 1
+                print(f"  ✗ {category}_{year}.csv ({'; '.join(result['problems'])})")
+            else:
+                print(f"  ✓ {category}_{year}.csv")
+        print()
+
+    print(f"Verified {len(results)} datasets across {len(by_year)} years in {elapsed * 1000:.1f} ms")
+    if failures:
+        print(f"✗ {failures} datasets failed verification")
+        return 1
+
+    print("✓ All datasets match the manifest!")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Rolling-origin (walk-forward) backtesting over the yearly history
+
+For every origin year Y the models are trained on all years before Y and
+evaluated on year Y, e.g. 2015 from 2001-2014, 2016 from 2001-2015, ...
+Random forest and gradient boosting chains are warm-started: each origin
+keeps the previous origin's trees and adds a few more fitted on the grown
+history, instead of refitting from scratch. Other estimators are refitted
+per origin, with the independent origins run in parallel.
+"""
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
+
+from seed.model import SeedModel
+from seed.selection import candidate_models
+
+WARM_START_ESTIMATORS = (RandomForestRegressor, GradientBoostingRegressor)
+
+ERROR_COLUMNS = [
+    "year",
+    "crop",
+    "target",
+    "actual",
+    "predicted",
+    "error",
+    "abs_error",
+    "abs_pct_error",
+]
+
+
+def rolling_origins(years, first_origin=None, min_train_years=5):
+    """Origin years with at least min_train_years of history before them"""
+    years = np.unique(years)
+    earliest = years[0] + min_train_years
+    if first_origin is not None:
+        earliest = max(earliest, first_origin)
+    return [int(year) for year in years if year >= earliest]
+
+
+def _fit_predict(estimator, X, y, years, origin):
+    """Cold fit on years before origin; predict origin"""
+    train, test = years < origin, years == origin
+    scaler = StandardScaler().fit(X[train])
+    fitted = clone(estimator).fit(scaler.transform(X[train]), y[train])
+    return origin, fitted.predict(scaler.transform(X[test]))
+
+
+def _warm_chain(estimator, X, y, years, origins, increment):
+    """
+    Walk forward through origins with one warm-started ensemble: every step
+    keeps the fitted trees and adds `increment` more on the grown history.
+    """
+    model = clone(estimator).set_params(warm_start=True)
+    # Trees do not depend on feature scale, so one scaler serves the chain
+    scaler = StandardScaler().fit(X[years < origins[0]])
+
+    results = []
+    for step, origin in enumerate(origins):
+        train, test = years < origin, years == origin
+        if step > 0:
+            model.set_params(n_estimators=model.n_estimators + increment)
+        model.fit(scaler.transform(X[train]), y[train])
+        results.append((origin, model.predict(scaler.transform(X[test]))))
+    return results
+
+
+def backtest(
+    df=None,
+    estimators=None,
+    first_origin=None,
+    min_train_years=5,
+    warm_start=True,
+    warm_start_increment=20,
+    n_jobs=-1,
+    random_state=42,
+):
+    """
+    Rolling-origin backtest of every target. Returns a per-year, per-crop,
+    per-target error table with columns year, crop, target, actual,
+    predicted, error, abs_error and abs_pct_error.
+
+    df defaults to SeedModel().load_real_data(). estimators maps target to an
+    unfitted estimator (default: gradient boosting for every target).
+    """
+    prep = SeedModel()
+    if df is None:
+        df = prep.load_real_data()
+    df = df.reset_index(drop=True)
+    targets = prep.build_targets(df)
+    X = prep.prepare_features(df.copy()).to_numpy(dtype=np.float64)
+    years = df["year"].to_numpy()
+    crops = df["crop"].to_numpy()
+
+    if estimators is None:
+        default = candidate_models(random_state)["Gradient Boosting"]
+        estimators = {target: default for target in targets}
+
+    origins = rolling_origins(years, first_origin, min_train_years)
+    if not origins:
+        raise ValueError("Not enough years of history to backtest")
+
+    # Warm chains are sequential within a target but independent across
+    # targets; every other (target, origin) fit is independent
+    jobs, keys = [], []
+    for target, estimator in estimators.items():
+        y = np.asarray(targets[target], dtype=np.float64)
+        if warm_start and isinstance(estimator, WARM_START_ESTIMATORS):
+            jobs.append(
+                delayed(_warm_chain)(estimator, X, y, years, origins, warm_start_increment)
+            )
+            keys.append((target, True))
+        else:
+            for origin in origins:
+                jobs.append(delayed(_fit_predict)(estimator, X, y, years, origin))
+                keys.append((target, False))
+
+    outputs = Parallel(n_jobs=n_jobs)(jobs)
+
+    frames = []
+    for (target, chained), output in zip(keys, outputs):
+        y = np.asarray(targets[target], dtype=np.float64)
+        for origin, predicted in output if chained else [output]:
+            test = years == origin
+            actual = y[test]
+            error = predicted - actual
+            with np.errstate(divide="ignore", invalid="ignore"):
+                abs_pct_error = np.abs(error) / np.abs(actual) * 100
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "year": origin,
+                        "crop": crops[test],
+                        "target": target,
+                        "actual": actual,
+                        "predicted": predicted,
+                        "error": error,
+                        "abs_error": np.abs(error),
+                        "abs_pct_error": abs_pct_error,
+                    }
+                )
+            )
+
+    return (
+        pd.concat(frames, ignore_index=True)[ERROR_COLUMNS]
+        .sort_values(["target", "year", "crop"], ignore_index=True)
+    )
+
+
+def backtest_summary(errors):
+    """MAE, RMSE and MAPE per target and forecast year"""
+    grouped = errors.groupby(["target", "year"])
+    return pd.DataFrame(
+        {
+            "mae": grouped["abs_error"].mean(),
+            "rmse": np.sqrt(grouped["error"].agg(lambda e: np.mean(e**2))),
+            "mape": grouped["abs_pct_error"].mean(),
+        }
+    ).reset_index()
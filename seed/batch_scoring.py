@@ -0,0 +1,158 @@
+"""
+Parallel offline scoring with a process pool and shared-memory buffers
+
+The feature matrix is copied once into a multiprocessing.shared_memory
+block and each worker process scores a contiguous slice of it, writing its
+predictions into a shared output block. Only buffer names and row ranges
+are sent to the workers, never the rows themselves. Every worker loads the
+saved model once, memory-mapped, so the tree arrays are shared as well.
+Workers predict through SeedModel.predict_features, like SeedModel.predict;
+drift monitoring and memory profiling of the parent's model apply to each
+scored batch.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from seed.model import SeedModel
+
+# Model loaded by each worker process
+_worker_model = None
+
+
+def _init_worker(model_path):
+    """Load the model once per worker process"""
+    global _worker_model
+    _worker_model = SeedModel()
+    _worker_model.load_model(model_path, mmap_mode="r")
+
+
+def _score_slice(input_name, input_shape, output_name, output_shape, start, stop, fast):
+    """Score rows [start, stop) of the shared input into the shared output"""
+    # track=False: the parent owns (and unlinks) both blocks
+    input_shm = shared_memory.SharedMemory(name=input_name, track=False)
+    output_shm = shared_memory.SharedMemory(name=output_name, track=False)
+    try:
+        X = np.ndarray(input_shape, dtype=np.float64, buffer=input_shm.buf)[start:stop]
+        output = np.ndarray(output_shape, dtype=np.float64, buffer=output_shm.buf)
+        predictions = _worker_model.predict_features(X, fast=fast)
+        for t, target in enumerate(_worker_model.models):
+            output[t, start:stop] = predictions[target]
+        # Views must be released before the blocks can be closed
+        del X, output
+    finally:
+        input_shm.close()
+        output_shm.close()
+    return stop - start
+
+
+class BatchScorer:
+    """
+    Scores large batches across a pool of worker processes. Use as a context
+    manager, or call close() when done, to shut the pool down. fast=True
+    scores with the distilled students where the model has them.
+    """
+
+    def __init__(self, model_path, n_workers=None, chunk_rows=50_000, fast=False):
+        self.model_path = str(model_path)
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.chunk_rows = chunk_rows
+        self.fast = fast
+
+        # The parent only builds feature matrices; workers do the scoring
+        self.model = SeedModel()
+        self.model.load_model(self.model_path, mmap_mode="r")
+        self.targets = list(self.model.models)
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                # Forking a process that may already run BLAS/OpenMP threads
+                # can deadlock; spawned workers start clean
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.model_path,),
+            )
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def score(self, input_data):
+        """
+        Predict every target for input_data (raw scenario rows, as accepted by
+        SeedModel.predict). Returns {target: array} aligned with the input.
+        """
+        with self.model._stage("batch_score"):
+            X = self.model.build_feature_matrix(input_data)
+            if self.model.drift_monitor is not None:
+                self.model.drift_monitor.update(X)
+            return self.score_matrix(X.to_numpy(dtype=np.float64))
+
+    def score_matrix(self, X):
+        """
+        Predict every target for an unscaled model feature matrix (columns
+        in model.feature_names order). Returns {target: array}.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        n_rows = len(X)
+        if n_rows == 0:
+            return {target: np.empty(0) for target in self.targets}
+
+        input_shm = shared_memory.SharedMemory(create=True, size=X.nbytes)
+        output_shape = (len(self.targets), n_rows)
+        output_shm = shared_memory.SharedMemory(
+            create=True, size=int(np.prod(output_shape)) * 8
+        )
+        try:
+            shared_input = np.ndarray(X.shape, dtype=np.float64, buffer=input_shm.buf)
+            shared_input[:] = X
+            del shared_input
+            output = np.ndarray(output_shape, dtype=np.float64, buffer=output_shm.buf)
+
+            # At least one slice per worker, at most chunk_rows rows each
+            chunk = min(self.chunk_rows, -(-n_rows // self.n_workers))
+            futures = [
+                self._pool().submit(
+                    _score_slice,
+                    input_shm.name,
+                    X.shape,
+                    output_shm.name,
+                    output_shape,
+                    start,
+                    min(start + chunk, n_rows),
+                    self.fast,
+                )
+                for start in range(0, n_rows, chunk)
+            ]
+            for future in futures:
+                future.result()
+
+            results = {target: output[t].copy() for t, target in enumerate(self.targets)}
+            del output
+            return results
+        finally:
+            input_shm.close()
+            input_shm.unlink()
+            output_shm.close()
+            output_shm.unlink()
+
+
+def score_in_parallel(model_path, input_data, n_workers=None, fast=False):
+    """One-off parallel scoring of input_data with the model saved at model_path"""
+    with BatchScorer(model_path, n_workers=n_workers, fast=fast) as scorer:
+        return scorer.score(input_data)
@@ -0,0 +1,10 @@
+"""
+Optional dependencies, detected once for the whole package
+"""
+
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
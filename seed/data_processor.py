@@ -3,6 +3,11 @@ from pathlib import Path
 from typing import Dict
 import logging
 
+from seed.dataset_writer import ParallelDatasetWriter, WriteStats
+from seed.manifest import DatasetManifest
+from seed.regions import split_annual_datasets, write_regional_datasets
+from seed.summary import summarize_datasets
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -13,9 +18,10 @@ class GambiaAgriculturalDataProcessor:
     Processor for agricultural data from The Gambia, including crops, fish, and sales data.
     """
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", max_workers: int = None):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self.max_workers = max_workers
 
         # Data sources
         self.fao_report_url = "https://openknowledge.fao.org/server/api/core/bitstreams/66fb4207-d8b7-46bf-ac07-a8c70e6715a2/content"
@@ -235,101 +241,80 @@ class GambiaAgriculturalDataProcessor:
 
         return annual_datasets
 
-    def save_datasets(self, annual_datasets: Dict[int, Dict[str, pd.DataFrame]]):
+    def save_datasets(
+        self,
+        annual_datasets: Dict[int, Dict[str, pd.DataFrame]],
+        manifest: DatasetManifest = None,
+    ) -> WriteStats:
         """
         Save datasets to CSV files organized by year.
+        Partitions are written concurrently and atomically; returns throughput stats.
+        When a manifest is given, partitions whose content is unchanged are skipped.
         """
         logger.info("Saving datasets to files...")
 
-        for year, categories in annual_datasets.items():
-            year_dir = self.data_dir / str(year)
-            year_dir.mkdir(exist_ok=True)
+        writer = ParallelDatasetWriter(self.data_dir, max_workers=self.max_workers)
+        return writer.write(annual_datasets, manifest=manifest)
+
+    def create_regional_datasets(
+        self, annual_datasets: Dict[int, Dict[str, pd.DataFrame]]
+    ) -> Dict[str, Dict[int, Dict[str, pd.DataFrame]]]:
+        """
+        Split the national datasets across the LGAs: {region: {year: {category: df}}}.
+        Additive metrics are apportioned so the regions sum to the national totals.
+        """
+        logger.info("Creating regional datasets...")
+        return split_annual_datasets(annual_datasets)
 
-            for category, df in categories.items():
-                filename = f"{category}_{year}.csv"
-                filepath = year_dir / filename
-                df.to_csv(filepath, index=False)
-                logger.info(f"Saved {filepath}")
+    def save_regional_datasets(
+        self, regional_datasets: Dict[str, Dict[int, Dict[str, pd.DataFrame]]]
+    ) -> Dict[str, WriteStats]:
+        """
+        Save regional datasets to data/synthetic_regions/<Region>/<year>/ with a manifest
+        per region, skipping partitions that are unchanged.
+        """
+        logger.info("Saving regional datasets to files...")
+        return write_regional_datasets(
+            regional_datasets, self.data_dir, max_workers=self.max_workers
+        )
 
     def create_summary_report(
         self, annual_datasets: Dict[int, Dict[str, pd.DataFrame]]
     ):
         """
         Create a summary report of all agricultural data.
+        Covers every category with per-year totals and item counts.
         """
         logger.info("Creating summary report...")
 
-        summary_data = []
-
-        for year, categories in annual_datasets.items():
-            for category, df in categories.items():
-                if "crops" in category:
-                    total_area = df["area_hectares"].sum()
-                    total_production = df["production_tons"].sum()
-                    summary_data.append(
-                        {
-                            "year": year,
-                            "category": "crops",
-                            "total_area_hectares": total_area,
-                            "total_production_tons": total_production,
-                            "num_crops": len(df),
-                        }
-                    )
-                elif "fisheries" in category:
-                    total_production = df["production_tons"].sum()
-                    total_value = df["value_million_dalasi"].sum()
-                    summary_data.append(
-                        {
-                            "year": year,
-                            "category": "fisheries",
-                            "total_production_tons": total_production,
-                            "total_value_million_dalasi": total_value,
-                            "num_fish_types": len(df),
-                        }
-                    )
-                elif "sales" in category:
-                    total_quantity = df["quantity_sold_tons"].sum()
-                    total_value = df["value_million_dalasi"].sum()
-                    summary_data.append(
-                        {
-                            "year": year,
-                            "category": "sales",
-                            "total_quantity_sold_tons": total_quantity,
-                            "total_value_million_dalasi": total_value,
-                            "num_product_categories": len(df),
-                        }
-                    )
-                elif "livestock" in category:
-                    total_population = df["population"].sum()
-                    total_value = df["value_million_dalasi"].sum()
-                    summary_data.append(
-                        {
-                            "year": year,
-                            "category": "livestock",
-                            "total_population": total_population,
-                            "total_value_million_dalasi": total_value,
-                            "num_animal_types": len(df),
-                        }
-                    )
-
-        summary_df = pd.DataFrame(summary_data)
+        summary_df = summarize_datasets(annual_datasets)
         summary_filepath = self.data_dir / "agricultural_summary.csv"
         summary_df.to_csv(summary_filepath, index=False)
         logger.info(f"Saved summary report to {summary_filepath}")
 
         return summary_df
 
-    def process_all_data(self):
+    def process_all_data(self, regional: bool = False):
         """
         Main method to process all agricultural data and create datasets.
+        With regional=True the datasets are also saved per region under data/synthetic_regions/
         """
         logger.info("Starting agricultural data processing...")
 
         # Create annual datasets
         annual_datasets = self.create_annual_datasets()
 
-        # Save datasets
-        self.save_datasets(annual_datasets)
+        # Save datasets, skipping partitions that are already up to date
+        manifest = DatasetManifest.load(self.data_dir)
+        previous_digests = manifest.year_digests()
+        manifest.refresh()
+        self.save_datasets(annual_datasets, manifest=manifest)
+        manifest.save()
+        logger.info(f"Years changed: {manifest.changed_years(previous_digests)}")
+
+        # Optionally split into the per-region layout as well
+        if regional:
+            self.save_regional_datasets(self.create_regional_datasets(annual_datasets))
 
         # Create summary report
         summary_df = self.create_summary_report(annual_datasets)
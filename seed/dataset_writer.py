@@ -0,0 +1,158 @@
+"""
+Parallel, atomic writer for the year/category dataset partitions in data/
+"""
+
+import os
+import time
+import hashlib
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PartitionWrite:
+    """
+    Result of writing a single data/YYYY/category_YYYY.csv partition.
+    """
+
+    year: int
+    category: str
+    path: Path
+    n_bytes: int
+    sha256: str = ""
+    rows: int = 0
+    skipped: bool = False
+
+
+@dataclass
+class WriteStats:
+    """
+    Throughput summary for one ParallelDatasetWriter.write() call.
+    """
+
+    files: int = 0
+    skipped: int = 0
+    bytes_written: int = 0
+    seconds: float = 0.0
+    partitions: List[PartitionWrite] = field(default_factory=list)
+
+    @property
+    def mb_per_second(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.bytes_written / 1e6 / self.seconds
+
+    @property
+    def files_per_second(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.files / self.seconds
+
+    def summary(self) -> str:
+        return (
+            f"{self.files} files ({self.skipped} unchanged), "
+            f"{self.bytes_written / 1024:.1f} KiB in "
+            f"{self.seconds:.3f}s ({self.mb_per_second:.2f} MB/s, "
+            f"{self.files_per_second:.1f} files/s)"
+        )
+
+
+def atomic_write_bytes(filepath: Path, payload: bytes):
+    """
+    Write bytes to filepath through a temporary file in the same directory
+    followed by a rename, so readers only ever see complete files.
+    """
+    filepath = Path(filepath)
+    # mkstemp creates files as 0600; keep the mode of the file being replaced
+    mode = filepath.stat().st_mode & 0o777 if filepath.exists() else 0o644
+    fd, tmp_name = tempfile.mkstemp(
+        dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, filepath)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+class ParallelDatasetWriter:
+    """
+    Serializes and writes year/category partitions concurrently on a bounded
+    thread pool. Each partition is written atomically (temp file + rename).
+    """
+
+    def __init__(self, data_dir: str = "data", max_workers: int = None):
+        self.data_dir = Path(data_dir)
+        if max_workers is None:
+            max_workers = min(8, (os.cpu_count() or 1) + 4)
+        self.max_workers = max_workers
+
+    def partition_path(self, year: int, category: str) -> Path:
+        return self.data_dir / str(year) / f"{category}_{year}.csv"
+
+    def write(
+        self, annual_datasets: Dict[int, Dict[str, pd.DataFrame]], manifest=None
+    ) -> WriteStats:
+        """
+        Write every partition in annual_datasets and return throughput stats.
+        With a DatasetManifest, partitions whose serialized content matches
+        the manifest entry are left untouched and written ones are recorded.
+        """
+        jobs = [
+            (year, category, df)
+            for year, categories in annual_datasets.items()
+            for category, df in categories.items()
+        ]
+
+        # Create year directories up front so workers never race on mkdir
+        for year in annual_datasets:
+            (self.data_dir / str(year)).mkdir(parents=True, exist_ok=True)
+
+        stats = WriteStats()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(
+                lambda job: self._write_partition(*job, manifest=manifest), jobs
+            )
+            for result, (_, _, df) in zip(results, jobs):
+                stats.partitions.append(result)
+                if result.skipped:
+                    stats.skipped += 1
+                    continue
+                stats.files += 1
+                stats.bytes_written += result.n_bytes
+                if manifest is not None:
+                    manifest.record_frame(result, df)
+        stats.seconds = time.perf_counter() - start
+
+        logger.info(f"Wrote {stats.summary()} to {self.data_dir}")
+        return stats
+
+    def _write_partition(
+        self, year: int, category: str, df: pd.DataFrame, manifest=None
+    ) -> PartitionWrite:
+        filepath = self.partition_path(year, category)
+        payload = df.to_csv(index=False).encode("utf-8")
+        sha256 = hashlib.sha256(payload).hexdigest()
+
+        if manifest is not None and manifest.is_current(year, category, filepath, sha256):
+            logger.debug(f"Unchanged {filepath}")
+            return PartitionWrite(
+                year, category, filepath, len(payload), sha256, len(df), skipped=True
+            )
+
+        atomic_write_bytes(filepath, payload)
+        logger.debug(f"Saved {filepath}")
+        return PartitionWrite(year, category, filepath, len(payload), sha256, len(df))
@@ -0,0 +1,102 @@
+"""
+Distillation of large tree ensembles into compact student models
+
+The teacher (e.g. a 100-tree random forest) labels dense synthetic samples
+drawn from its own input domain: training rows jittered within each crop's
+spread and clipped to the observed ranges, with the engineered features
+recomputed. A shallow gradient-boosted student is fitted to those labels,
+in the teacher's scaled feature space, and its fidelity is measured as the
+R² of student against teacher on a fresh synthetic sample.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.metrics import r2_score
+
+from seed.packed_trees import source_class
+
+# Teachers worth distilling: the large fully grown forests
+DISTILLABLE_ESTIMATORS = (RandomForestRegressor,)
+
+
+def is_distillable(estimator):
+    """True for fitted or loaded (packed) teachers worth distilling"""
+    return issubclass(source_class(estimator), DISTILLABLE_ESTIMATORS)
+
+DEFAULT_STUDENT_PARAMS = {
+    "n_estimators": 60,
+    "max_depth": 4,
+    "learning_rate": 0.15,
+    "subsample": 0.8,
+}
+
+
+def sample_input_domain(model, n_samples, jitter=0.5, random_state=0):
+    """
+    Synthetic model feature rows resembling the training data: random
+    training rows with each raw input perturbed by jitter x its per-crop
+    standard deviation, clipped to the training range.
+    """
+    rng = np.random.default_rng(random_state)
+    training = model.training_features
+    raw = model.raw_input_features()
+
+    rows = rng.integers(len(training), size=n_samples)
+    crops = training["crop_encoded"].to_numpy()[rows]
+    values = training[raw].to_numpy(dtype="float64")[rows]
+
+    spread = training.groupby("crop_encoded")[raw].std(ddof=0).fillna(0.0)
+    noise = rng.standard_normal(values.shape) * spread.loc[crops].to_numpy() * jitter
+    low, high = training[raw].min().to_numpy(), training[raw].max().to_numpy()
+    values = np.clip(values + noise, low, high)
+
+    samples = pd.DataFrame(values, columns=raw)
+    samples["crop_encoded"] = crops
+    model.add_derived_features(samples)
+    return samples[model.feature_names]
+
+
+def _latency(predict, X, repeats=3):
+    """Best-of-repeats milliseconds per 1,000 rows"""
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        predict(X)
+        best = min(best, time.perf_counter() - start)
+    return best / len(X) * 1e6
+
+
+def distill_estimator(
+    teacher,
+    scaler,
+    model,
+    n_samples=10_000,
+    student_params=None,
+    random_state=0,
+):
+    """
+    Fit a compact student to one teacher. Returns (student, report) where
+    report has the student-vs-teacher fidelity R² and both models' latency.
+    """
+    params = {**DEFAULT_STUDENT_PARAMS, **(student_params or {})}
+
+    X_train = scaler.transform(sample_input_domain(model, n_samples, random_state=random_state))
+    X_check = scaler.transform(
+        sample_input_domain(model, max(n_samples // 4, 1000), random_state=random_state + 1)
+    )
+
+    student = GradientBoostingRegressor(random_state=random_state, **params)
+    student.fit(X_train, teacher.predict(X_train))
+
+    teacher_check = teacher.predict(X_check)
+    report = {
+        "teacher": source_class(teacher).__name__,
+        "student": f"GradientBoosting({params['n_estimators']}x depth {params['max_depth']})",
+        "fidelity_r2": r2_score(teacher_check, student.predict(X_check)),
+        "teacher_ms_per_1k": _latency(teacher.predict, X_check),
+        "student_ms_per_1k": _latency(student.predict, X_check),
+    }
+    return student, report
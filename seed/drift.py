@@ -0,0 +1,195 @@
+"""
+Streaming input drift monitoring against training-time statistics
+
+At training time a DriftReference records, per raw input feature, the mean,
+standard deviation, range and the proportions of the training rows in ten
+fixed equal-frequency bins (plus an underflow and an overflow bin for
+values outside the training range). It is stored in the model artifact.
+
+A DriftMonitor then scores every predicted batch against it, keeping only
+running Welford moments and fixed bin counts per feature, so memory stays
+constant however many rows stream through. Per batch and cumulatively it
+reports:
+
+- mean_shift: |mean - training mean| in training standard deviations
+- psi: population stability index of the binned distribution
+- out_of_range: share of values outside the training range
+"""
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Conventional PSI reading: < 0.1 stable, 0.1-0.25 moderate, > 0.25 major shift
+PSI_ALERT = 0.25
+MEAN_SHIFT_ALERT = 3.0
+OUT_OF_RANGE_ALERT = 0.05
+# Fewer rows than this are too few for a meaningful PSI; it is reported but
+# does not flag drift on its own
+PSI_MIN_ROWS = 100
+
+# Floor on bin proportions so empty bins do not make the PSI infinite
+PSI_EPSILON = 1e-4
+
+REPORT_COLUMNS = [
+    "feature",
+    "n",
+    "mean",
+    "reference_mean",
+    "std",
+    "mean_shift",
+    "psi",
+    "out_of_range",
+    "drifted",
+]
+
+
+def bin_counts(X, edges):
+    """
+    (n_features, n_edges + 1) counts of X's columns in the bins defined by
+    each feature's row of edges; the first and last bins hold values below
+    the first and above the last edge
+    """
+    counts = np.empty((X.shape[1], edges.shape[1] + 1), dtype=np.int64)
+    for j in range(X.shape[1]):
+        bins = np.searchsorted(edges[j], X[:, j], side="right")
+        # A value equal to the top edge is in range: the last inner bin
+        bins[X[:, j] == edges[j, -1]] = edges.shape[1] - 1
+        counts[j] = np.bincount(bins, minlength=edges.shape[1] + 1)
+    return counts
+
+
+def population_stability_index(counts, reference_proportions):
+    """PSI of each row of counts against the reference bin proportions"""
+    totals = counts.sum(axis=1, keepdims=True)
+    actual = np.maximum(counts / np.maximum(totals, 1), PSI_EPSILON)
+    expected = np.maximum(reference_proportions, PSI_EPSILON)
+    return ((actual - expected) * np.log(actual / expected)).sum(axis=1)
+
+
+@dataclass
+class DriftReference:
+    """
+    Training-time statistics of the monitored features.
+    """
+
+    features: list
+    mean: np.ndarray
+    std: np.ndarray
+    edges: np.ndarray  # (n_features, n_bins + 1), first/last = training min/max
+    proportions: np.ndarray  # (n_features, n_bins + 2) incl. under/overflow
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, n_bins: int = 10) -> "DriftReference":
+        X = df.to_numpy(dtype=np.float64)
+        edges = np.quantile(X, np.linspace(0, 1, n_bins + 1), axis=0).T
+        counts = bin_counts(X, edges)
+        return cls(
+            features=list(df.columns),
+            mean=X.mean(axis=0),
+            std=X.std(axis=0),
+            edges=edges,
+            proportions=counts / len(X),
+        )
+
+
+class RunningStats:
+    """
+    Per-feature count, mean and sum of squared deviations (Welford), merged
+    one batch at a time with Chan et al.'s pairwise update, plus bin counts
+    """
+
+    def __init__(self, n_features, n_bins):
+        self.n = 0
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+        self.counts = np.zeros((n_features, n_bins), dtype=np.int64)
+
+    @property
+    def variance(self):
+        return self.m2 / self.n if self.n else np.zeros_like(self.m2)
+
+    @classmethod
+    def from_batch(cls, X, counts):
+        stats = cls(X.shape[1], counts.shape[1])
+        if len(X):
+            stats.n = len(X)
+            stats.mean = X.mean(axis=0)
+            stats.m2 = ((X - stats.mean) ** 2).sum(axis=0)
+            stats.counts = counts
+        return stats
+
+    def merge(self, other):
+        """Fold another RunningStats into this one"""
+        if other.n == 0:
+            return
+        n_total = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * other.n / n_total
+        self.m2 = self.m2 + other.m2 + delta**2 * self.n * other.n / n_total
+        self.n = n_total
+        self.counts = self.counts + other.counts
+
+
+class DriftMonitor:
+    """
+    Scores batches of model inputs against a DriftReference. update() returns
+    the batch's drift report; summary() the report over everything seen.
+    """
+
+    def __init__(self, reference: DriftReference):
+        self.reference = reference
+        self.running = RunningStats(len(reference.features), reference.edges.shape[1] + 1)
+        self.batches = 0
+        self.last_report = None
+
+    def _report(self, stats: RunningStats):
+        reference = self.reference
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_shift = np.where(
+                reference.std > 0,
+                np.abs(stats.mean - reference.mean) / reference.std,
+                0.0,
+            )
+        psi = population_stability_index(stats.counts, reference.proportions)
+        out_of_range = (stats.counts[:, 0] + stats.counts[:, -1]) / max(stats.n, 1)
+        drifted = (
+            ((psi > PSI_ALERT) & (stats.n >= PSI_MIN_ROWS))
+            | (mean_shift > MEAN_SHIFT_ALERT)
+            | (out_of_range > OUT_OF_RANGE_ALERT)
+        )
+        return pd.DataFrame(
+            {
+                "feature": reference.features,
+                "n": stats.n,
+                "mean": stats.mean,
+                "reference_mean": reference.mean,
+                "std": np.sqrt(stats.variance),
+                "mean_shift": mean_shift,
+                "psi": psi,
+                "out_of_range": out_of_range,
+                "drifted": drifted,
+            },
+            columns=REPORT_COLUMNS,
+        )
+
+    def update(self, X: pd.DataFrame):
+        """Fold a batch of unscaled model inputs in and return its drift report"""
+        X = X[self.reference.features].to_numpy(dtype=np.float64)
+        batch = RunningStats.from_batch(X, bin_counts(X, self.reference.edges))
+        self.running.merge(batch)
+        self.batches += 1
+
+        self.last_report = self._report(batch)
+        drifted = self.last_report.loc[self.last_report["drifted"], "feature"].tolist()
+        if drifted:
+            logger.warning(f"Input drift in batch {self.batches}: {', '.join(drifted)}")
+        return self.last_report
+
+    def summary(self):
+        """Drift report over every row seen so far"""
+        return self._report(self.running)
@@ -4,6 +4,10 @@ import logging
 from typing import Dict
 import json
 
+from seed.dataset_writer import ParallelDatasetWriter, WriteStats, atomic_write_bytes
+from seed.manifest import DatasetManifest
+from seed.regions import split_annual_datasets, write_regional_datasets
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,9 +19,10 @@ class EnhancedGambiaDataProcessor:
     from FAO reports and comprehensive dataset creation.
     """
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", max_workers: int = None):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self.max_workers = max_workers
 
     def create_detailed_crop_data(self) -> Dict[str, pd.DataFrame]:
         """
@@ -609,21 +614,42 @@ class EnhancedGambiaDataProcessor:
 
         return annual_datasets
 
-    def save_datasets(self, annual_datasets: Dict[int, Dict[str, pd.DataFrame]]):
+    def save_datasets(
+        self,
+        annual_datasets: Dict[int, Dict[str, pd.DataFrame]],
+        manifest: DatasetManifest = None,
+    ) -> WriteStats:
         """
         Save datasets to CSV files organized by year and category.
+        Partitions are written concurrently and atomically; returns throughput stats.
+        When a manifest is given, partitions whose content is unchanged are skipped.
         """
         logger.info("Saving datasets to files...")
 
-        for year, categories in annual_datasets.items():
-            year_dir = self.data_dir / str(year)
-            year_dir.mkdir(exist_ok=True)
+        writer = ParallelDatasetWriter(self.data_dir, max_workers=self.max_workers)
+        return writer.write(annual_datasets, manifest=manifest)
+
+    def create_regional_datasets(
+        self, annual_datasets: Dict[int, Dict[str, pd.DataFrame]]
+    ) -> Dict[str, Dict[int, Dict[str, pd.DataFrame]]]:
+        """
+        Split the national datasets across the LGAs: {region: {year: {category: df}}}.
+        Additive metrics are apportioned so the regions sum to the national totals.
+        """
+        logger.info("Creating regional datasets...")
+        return split_annual_datasets(annual_datasets)
 
-            for category, df in categories.items():
-                filename = f"{category}_{year}.csv"
-                filepath = year_dir / filename
-                df.to_csv(filepath, index=False)
-                logger.info(f"Saved {filepath}")
+    def save_regional_datasets(
+        self, regional_datasets: Dict[str, Dict[int, Dict[str, pd.DataFrame]]]
+    ) -> Dict[str, WriteStats]:
+        """
+        Save regional datasets to data/synthetic_regions/<Region>/<year>/ with a manifest
+        per region, skipping partitions that are unchanged.
+        """
+        logger.info("Saving regional datasets to files...")
+        return write_regional_datasets(
+            regional_datasets, self.data_dir, max_workers=self.max_workers
+        )
 
     def create_metadata_file(self, annual_datasets: Dict[int, Dict[str, pd.DataFrame]]):
         """
@@ -636,7 +662,7 @@ class EnhancedGambiaDataProcessor:
                 "title": "Gambia Agricultural Census Data",
                 "description": "Comprehensive agricultural data from The Gambia including crops, fisheries, livestock, sales, farm practices, and land tenure",
                 "source": "FAO Agricultural Census Report 2001/2002 and GBOS Data",
-                "years_covered": list(annual_datasets.keys()),
+                "years_covered": [int(year) for year in annual_datasets.keys()],
                 "total_datasets": sum(
                     len(categories) for categories in annual_datasets.values()
                 ),
@@ -656,23 +682,35 @@ class EnhancedGambiaDataProcessor:
         }
 
         metadata_filepath = self.data_dir / "metadata.json"
-        with open(metadata_filepath, "w") as f:
-            json.dump(metadata, f, indent=2)
-
-        logger.info(f"Saved metadata to {metadata_filepath}")
+        payload = json.dumps(metadata, indent=2).encode("utf-8")
+        if metadata_filepath.exists() and metadata_filepath.read_bytes() == payload:
+            logger.info(f"Metadata unchanged: {metadata_filepath}")
+        else:
+            atomic_write_bytes(metadata_filepath, payload)
+            logger.info(f"Saved metadata to {metadata_filepath}")
         return metadata
 
-    def process_all_data(self):
+    def process_all_data(self, regional: bool = False):
         """
         Main method to process all agricultural data and create comprehensive datasets.
+        With regional=True the datasets are also saved per region under data/synthetic_regions/
         """
         logger.info("Starting comprehensive agricultural data processing...")
 
         # Create comprehensive annual datasets
         annual_datasets = self.create_comprehensive_datasets()
 
-        # Save datasets
-        self.save_datasets(annual_datasets)
+        # Save datasets, skipping partitions that are already up to date
+        manifest = DatasetManifest.load(self.data_dir)
+        previous_digests = manifest.year_digests()
+        manifest.refresh()
+        self.save_datasets(annual_datasets, manifest=manifest)
+        manifest.save()
+        logger.info(f"Years changed: {manifest.changed_years(previous_digests)}")
+
+        # Optionally split into the per-region layout as well
+        if regional:
+            self.save_regional_datasets(self.create_regional_datasets(annual_datasets))
 
         # Create metadata
         metadata = self.create_metadata_file(annual_datasets)
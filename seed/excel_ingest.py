@@ -0,0 +1,178 @@
+"""
+Single-pass, cached ingestion of Excel workbooks such as
+external_data/GBoS-National-Accounts.xlsx
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+from seed.compat import HAS_PYARROW
+from seed.dataset_writer import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(filepath, chunk_size: int = 1 << 20) -> str:
+    """Stream a file through SHA-256 without loading it into memory"""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExcelSheetCache:
+    """
+    Parses a workbook once, fans per-sheet parsing out to a thread pool and
+    caches each sheet as a columnar file (Parquet when pyarrow is available,
+    pickle otherwise). The cache is keyed by the workbook's mtime, size and
+    SHA-256, so unchanged workbooks load straight from the cache.
+    """
+
+    MANIFEST_NAME = "cache.json"
+
+    def __init__(self, excel_file, cache_dir=None, max_workers: int = None):
+        self.excel_file = Path(excel_file)
+        if cache_dir is None:
+            cache_dir = self.excel_file.parent / ".cache" / self.excel_file.stem
+        self.cache_dir = Path(cache_dir)
+        if max_workers is None:
+            max_workers = min(8, (os.cpu_count() or 1) + 4)
+        self.max_workers = max_workers
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.cache_dir / self.MANIFEST_NAME
+
+    def load(self) -> Dict[str, pd.DataFrame]:
+        """
+        Return {sheet_name: DataFrame}, from the cache when the workbook is
+        unchanged and by parsing it otherwise.
+        """
+        start = time.perf_counter()
+        stat = self.excel_file.stat()
+        manifest = self._read_manifest()
+
+        if manifest and self._is_fresh(manifest, stat):
+            sheets = self._load_cached(manifest)
+            source = "cache"
+        else:
+            sheets = self._parse_and_cache(stat)
+            source = "workbook"
+
+        logger.info(
+            f"Loaded {len(sheets)} sheets from {source} "
+            f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+        return sheets
+
+    def invalidate(self):
+        """Drop the cache manifest so the next load reparses the workbook"""
+        if self.manifest_path.exists():
+            self.manifest_path.unlink()
+
+    def _read_manifest(self):
+        if not self.manifest_path.exists():
+            return None
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _is_fresh(self, manifest, stat) -> bool:
+        files_present = all(
+            (self.cache_dir / entry["file"]).exists()
+            for entry in manifest["sheets"].values()
+        )
+        if not files_present:
+            return False
+
+        # Cheap check first: an untouched file keeps its mtime and size
+        if manifest["mtime_ns"] == stat.st_mtime_ns and manifest["size"] == stat.st_size:
+            return True
+
+        # The file was touched; only the content hash decides
+        if manifest["sha256"] != file_sha256(self.excel_file):
+            return False
+        manifest["mtime_ns"] = stat.st_mtime_ns
+        manifest["size"] = stat.st_size
+        self._write_manifest(manifest)
+        return True
+
+    def _load_cached(self, manifest) -> Dict[str, pd.DataFrame]:
+        names = list(manifest["sheets"])
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            frames = executor.map(
+                lambda name: self._read_sheet(manifest["sheets"][name]), names
+            )
+            return dict(zip(names, frames))
+
+    def _parse_and_cache(self, stat) -> Dict[str, pd.DataFrame]:
+        sha256 = file_sha256(self.excel_file)
+
+        # Open (and unzip/parse the shared parts of) the workbook exactly once
+        with pd.ExcelFile(self.excel_file) as xl:
+            names = list(xl.sheet_names)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                frames = list(executor.map(xl.parse, names))
+        sheets = dict(zip(names, frames))
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.invalidate()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            entries = list(
+                executor.map(
+                    lambda item: self._write_sheet(item[0], item[1], item[2]),
+                    [(i, name, sheets[name]) for i, name in enumerate(names)],
+                )
+            )
+
+        manifest = {
+            "workbook": str(self.excel_file),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256,
+            "sheets": dict(zip(names, entries)),
+        }
+        self._write_manifest(manifest)
+        return sheets
+
+    def _write_sheet(self, index: int, name: str, df: pd.DataFrame) -> dict:
+        if HAS_PYARROW:
+            filepath = self.cache_dir / f"sheet_{index}.parquet"
+            try:
+                df.to_parquet(filepath, index=True)
+                return {"file": filepath.name, "format": "parquet"}
+            except (ValueError, TypeError) as e:
+                # Mixed-type object columns or non-string headers
+                logger.debug(f"Parquet cache unavailable for sheet {name}: {e}")
+
+        filepath = self.cache_dir / f"sheet_{index}.pkl"
+        df.to_pickle(filepath)
+        return {"file": filepath.name, "format": "pickle"}
+
+    def _read_sheet(self, entry) -> pd.DataFrame:
+        filepath = self.cache_dir / entry["file"]
+        if entry["format"] == "parquet":
+            return pd.read_parquet(filepath)
+        return pd.read_pickle(filepath)
+
+    def _write_manifest(self, manifest):
+        payload = json.dumps(manifest, indent=2).encode("utf-8")
+        atomic_write_bytes(self.manifest_path, payload)
+
+
+def load_workbook_sheets(excel_file, cache_dir=None, max_workers: int = None):
+    """
+    Convenience wrapper around ExcelSheetCache.load()
+    """
+    return ExcelSheetCache(excel_file, cache_dir, max_workers).load()
@@ -0,0 +1,82 @@
+"""
+Long-format fact table of every dataset in data/ with compact dtypes
+
+Columns: year, category, item, metric, value. The string dimensions are
+pandas categoricals (integer codes) and numerics are downcast, so the full
+history fits in a fraction of the memory of the per-category CSV frames and
+group-bys run on codes rather than Python strings.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from seed.manifest import PARTITION_PATTERN, discover_partitions
+from seed.summary import CATEGORY_ITEM_COLUMNS, LONG_COLUMNS, partition_to_long
+
+DIMENSION_COLUMNS = ["category", "item", "metric"]
+
+
+def compact_long_table(long_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a (year, category, item, metric, value) table to categorical
+    dimensions, a small integer year and float32 values.
+    """
+    long_df = long_df[LONG_COLUMNS].copy()
+    long_df["year"] = pd.to_numeric(long_df["year"], downcast="integer")
+    for col in DIMENSION_COLUMNS:
+        long_df[col] = long_df[col].astype(str).astype("category")
+    long_df["value"] = pd.to_numeric(long_df["value"], downcast="float")
+    return long_df
+
+
+def load_fact_table(
+    data_dir: str = "data", years=None, categories=None, max_workers: int = None
+) -> pd.DataFrame:
+    """
+    Load every data/YYYY/category_YYYY.csv (optionally filtered by years and
+    categories) into one compact long-format fact table.
+    """
+    if years is not None:
+        years = {int(year) for year in years}
+    if categories is None:
+        categories = list(CATEGORY_ITEM_COLUMNS)
+
+    jobs = []
+    for filepath in discover_partitions(Path(data_dir)):
+        match = PARTITION_PATTERN.match(filepath.name)
+        year, category = int(match.group("year")), match.group("category")
+        if category not in categories or (years is not None and year not in years):
+            continue
+        jobs.append((filepath, year, category))
+
+    if not jobs:
+        return compact_long_table(pd.DataFrame(columns=LONG_COLUMNS))
+
+    if max_workers is None:
+        max_workers = min(8, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(
+            executor.map(
+                # Plain reads: dtypes are compacted once on the combined table
+                lambda job: partition_to_long(pd.read_csv(job[0]), job[1], job[2]),
+                jobs,
+            )
+        )
+
+    return compact_long_table(pd.concat(frames, ignore_index=True))
+
+
+def pivot_category(fact_table: pd.DataFrame, category: str) -> pd.DataFrame:
+    """
+    Wide (year, item) x metric view of one category, e.g. the crops history.
+    """
+    subset = fact_table[fact_table["category"] == category]
+    wide = subset.pivot_table(
+        index=["year", "item"], columns="metric", values="value", observed=True
+    )
+    wide.columns = wide.columns.astype(str)
+    wide.columns.name = None
+    return wide.reset_index().rename(columns={"item": CATEGORY_ITEM_COLUMNS[category]})
@@ -0,0 +1,268 @@
+"""
+Chunked bulk scoring of CSV/Parquet files of scenario rows
+
+The input is streamed in fixed-size chunks; each chunk is validated,
+turned into the model feature matrix and predicted for all targets in one
+call, then appended to the output file before the next chunk is read, so
+memory stays bounded by the chunk size whatever the file size. Rows that
+cannot be scored are written, with the reason, to a separate rejects file.
+CSV lines with more fields than the header are rejected the same way: on
+the first one the rest of the file is parsed line by line.
+"""
+
+import csv
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from seed.compat import HAS_PYARROW
+from seed.model import SeedModel
+
+logger = logging.getLogger(__name__)
+
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+
+
+@dataclass
+class ScoreFileStats:
+    """
+    Throughput summary for one score_file() call.
+    """
+
+    rows: int = 0
+    scored: int = 0
+    rejected: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.rows / self.seconds
+
+    def summary(self) -> str:
+        return (
+            f"{self.rows} rows in {self.chunks} chunks ({self.scored} scored, "
+            f"{self.rejected} rejected) in {self.seconds:.2f}s "
+            f"({self.rows_per_second:,.0f} rows/s)"
+        )
+
+
+def input_columns(model: SeedModel):
+    """Raw inputs a scenario row must provide: crop plus the numeric features"""
+    return ["crop"] + model.raw_input_features()
+
+
+def _is_parquet(filepath) -> bool:
+    return Path(filepath).suffix.lower() in PARQUET_SUFFIXES
+
+
+def _read_csv_lines(filepath, chunk_rows: int, skip_rows: int = 0):
+    """
+    Parse a CSV file record by record, yielding (chunk, malformed) like
+    read_chunks after skipping the first skip_rows data rows. A record with
+    more fields than the header is kept as an empty row so row numbers stay
+    aligned; short records are padded with missing values as pandas does.
+    """
+    with open(filepath, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows, malformed = [], {}
+        seen = 0
+        for record in reader:
+            # pandas skips blank lines too
+            if not record:
+                continue
+            seen += 1
+            if seen <= skip_rows:
+                continue
+            if len(record) > len(header):
+                malformed[len(rows)] = (
+                    f"malformed line: expected {len(header)} fields, saw {len(record)}"
+                )
+                record = []
+            padding = [None] * (len(header) - len(record))
+            rows.append([field or None for field in record] + padding)
+            if len(rows) == chunk_rows:
+                yield pd.DataFrame(rows, columns=header, dtype=str), malformed
+                rows, malformed = [], {}
+        if rows:
+            yield pd.DataFrame(rows, columns=header, dtype=str), malformed
+
+
+def read_chunks(filepath, chunk_rows: int):
+    """
+    Yield (chunk, malformed) pairs of at most chunk_rows rows from a CSV or
+    Parquet file. malformed maps the position in the chunk of each CSV line
+    that could not be split into the header's fields to the reason.
+    """
+    if _is_parquet(filepath):
+        if not HAS_PYARROW:
+            raise ImportError("Reading Parquet input requires pyarrow")
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(filepath).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas(), {}
+        return
+
+    # Read everything as text first so one malformed value only rejects
+    # its own row instead of changing the dtype of the whole chunk
+    rows_read = 0
+    try:
+        for chunk in pd.read_csv(filepath, chunksize=chunk_rows, dtype=str):
+            rows_read += len(chunk)
+            yield chunk, {}
+    except pd.errors.ParserError as error:
+        # The C parser cannot skip a bad line and report where it was, so
+        # the rest of the file goes through the slower line-by-line parser
+        logger.warning(f"{filepath}: {error}; parsing the remaining rows line by line")
+        yield from _read_csv_lines(filepath, chunk_rows, skip_rows=rows_read)
+
+
+def validate_chunk(model: SeedModel, chunk: pd.DataFrame, malformed=None):
+    """
+    Split a chunk into (inputs, rejects). inputs holds the rows that can be
+    scored with numeric columns converted; rejects holds the rest with an
+    "error" column naming the first problem found in each row. malformed
+    maps chunk positions of unparseable lines to their reason.
+    """
+    columns = input_columns(model)
+    missing = [col for col in columns if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Input is missing required columns: {missing}")
+
+    inputs = chunk[columns].copy()
+    errors = pd.Series("", index=chunk.index, dtype=object)
+    for position, reason in (malformed or {}).items():
+        errors.iloc[position] = reason
+
+    known_crops = pd.Index(model.label_encoders["crop"].classes_)
+    inputs["crop"] = inputs["crop"].astype(str).str.strip()
+    errors[~inputs["crop"].isin(known_crops) & (errors == "")] = "unknown crop"
+
+    for col in columns[1:]:
+        values = pd.to_numeric(inputs[col], errors="coerce").astype("float64")
+        invalid = ~np.isfinite(values) & (errors == "")
+        errors[invalid] = f"invalid {col}"
+        inputs[col] = values
+
+    bad = errors != ""
+    rejects = chunk[bad].assign(error=errors[bad])
+    return inputs[~bad], rejects
+
+
+class _ChunkWriter:
+    """Appends DataFrames to a CSV or Parquet file, creating it on first write"""
+
+    def __init__(self, filepath):
+        self.filepath = Path(filepath)
+        self.parquet = _is_parquet(filepath)
+        self._parquet_writer = None
+        self._started = False
+        if self.parquet and not HAS_PYARROW:
+            raise ImportError("Writing Parquet output requires pyarrow")
+
+    def write(self, df: pd.DataFrame):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.filepath, table.schema)
+            self._parquet_writer.write_table(table.cast(self._parquet_writer.schema))
+        else:
+            df.to_csv(
+                self.filepath,
+                mode="a" if self._started else "w",
+                header=not self._started,
+                index=False,
+            )
+        self._started = True
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+
+def score_file(
+    model_path,
+    input_path,
+    output_path,
+    rejects_path=None,
+    chunk_rows: int = 100_000,
+    n_workers: int = 1,
+    fast: bool = False,
+) -> ScoreFileStats:
+    """
+    Score every row of input_path with the saved model and write the input
+    columns plus predicted_<target> columns to output_path. Rows that cannot
+    be scored go to rejects_path (default: <output stem>.rejects.csv) with
+    their input row number and the error. n_workers > 1 scores each chunk on
+    a BatchScorer process pool. fast=True uses the distilled students.
+    """
+    output_path = Path(output_path)
+    if rejects_path is None:
+        rejects_path = output_path.with_name(f"{output_path.stem}.rejects.csv")
+
+    scorer = None
+    if n_workers > 1:
+        from seed.batch_scoring import BatchScorer
+
+        scorer = BatchScorer(model_path, n_workers=n_workers, fast=fast)
+        model = scorer.model
+    else:
+        model = SeedModel()
+        model.load_model(model_path, mmap_mode="r")
+
+    # Never leave results of an earlier run behind
+    for filepath in (output_path, rejects_path):
+        Path(filepath).unlink(missing_ok=True)
+    output = _ChunkWriter(output_path)
+    rejects = _ChunkWriter(rejects_path)
+    stats = ScoreFileStats()
+    start = time.perf_counter()
+    row_offset = 0
+
+    try:
+        for chunk, malformed in read_chunks(input_path, chunk_rows):
+            chunk.index = pd.RangeIndex(row_offset, row_offset + len(chunk))
+            row_offset += len(chunk)
+
+            inputs, bad_rows = validate_chunk(model, chunk, malformed)
+            if len(inputs):
+                if scorer is not None:
+                    predictions = scorer.score(inputs)
+                else:
+                    predictions = model.predict(inputs, fast=fast)
+                # The validated inputs replace their raw text columns, so
+                # numeric inputs keep a numeric type in the output; any other
+                # columns pass through unchanged
+                scored = chunk.loc[inputs.index].assign(
+                    **{col: inputs[col] for col in inputs.columns},
+                    **{f"predicted_{target}": values for target, values in predictions.items()},
+                )
+                output.write(scored)
+            if len(bad_rows):
+                rejects.write(bad_rows.rename_axis("row").reset_index())
+
+            stats.rows += len(chunk)
+            stats.scored += len(inputs)
+            stats.rejected += len(bad_rows)
+            stats.chunks += 1
+            stats.seconds = time.perf_counter() - start
+            logger.info(f"Chunk {stats.chunks}: {stats.summary()}")
+    finally:
+        output.close()
+        rejects.close()
+        if scorer is not None:
+            scorer.close()
+
+    stats.seconds = time.perf_counter() - start
+    return stats
@@ -0,0 +1,123 @@
+"""
+Batched polynomial trend forecasting over the yearly history in data/
+
+Every (item, metric) series of a category, e.g. (Rice, yield_per_hectare),
+is fitted against the same design matrix of year powers, so all series are
+solved in a single batched least-squares call.
+"""
+
+import numpy as np
+import pandas as pd
+
+from seed.fact_table import load_fact_table
+
+
+class TrendForecaster:
+    """
+    Fits per-item, per-metric polynomial trends (linear by default) to the
+    history of one category and forecasts any set of future years.
+    """
+
+    def __init__(self, degree=1, category="crops"):
+        self.degree = degree
+        self.category = category
+        self.coefficients = None  # (degree + 1, n_series)
+        self.residual_std = None  # (n_series,)
+        self.series = None  # MultiIndex of (item, metric)
+        self.years = None
+        self.year_center = 0.0
+        self.year_scale = 1.0
+        self.is_fitted = False
+
+    def _design_matrix(self, years):
+        t = (np.asarray(years, dtype="float64") - self.year_center) / self.year_scale
+        return np.vander(t, self.degree + 1, increasing=True)
+
+    def fit(self, fact_table=None, data_dir="data", metrics=None):
+        """
+        Fit every series of self.category. fact_table defaults to
+        load_fact_table(data_dir, categories=[self.category]).
+        """
+        if fact_table is None:
+            fact_table = load_fact_table(data_dir, categories=[self.category])
+
+        facts = fact_table[fact_table["category"] == self.category]
+        if metrics is not None:
+            facts = facts[facts["metric"].isin(metrics)]
+
+        # years x (item, metric) matrix; missing observations become NaN
+        history = facts.pivot_table(
+            index="year", columns=["item", "metric"], values="value", observed=True
+        ).astype("float64")
+        if history.shape[0] <= self.degree:
+            raise ValueError(
+                f"Need more than {self.degree} years of {self.category} history to fit"
+            )
+
+        self.years = history.index.to_numpy()
+        self.series = history.columns
+        self.year_center = float(self.years.mean())
+        self.year_scale = float(max(np.ptp(self.years), 1))
+
+        X = self._design_matrix(self.years)  # (n_years, p)
+        Y = history.to_numpy()  # (n_years, n_series)
+        observed = ~np.isnan(Y)
+
+        if observed.all():
+            # Complete history: one multi-right-hand-side least-squares solve
+            B, _, _, _ = np.linalg.lstsq(X, Y, rcond=None)
+        else:
+            # Gaps: per-series normal equations with observation weights,
+            # stacked into one batched solve of shape (n_series, p, p)
+            W = observed.astype("float64")
+            Y0 = np.where(observed, Y, 0.0)
+            XtWX = np.einsum("ni,ns,nj->sij", X, W, X)
+            XtWy = np.einsum("ni,ns->si", X, W * Y0)
+            # A tiny ridge keeps series with too few points solvable
+            XtWX += 1e-9 * np.eye(X.shape[1])
+            B = np.linalg.solve(XtWX, XtWy[..., None])[..., 0].T
+
+        residuals = np.where(observed, Y - X @ B, 0.0)
+        dof = np.maximum(observed.sum(axis=0) - X.shape[1], 1)
+        self.coefficients = B
+        self.residual_std = np.sqrt((residuals**2).sum(axis=0) / dof)
+        self.is_fitted = True
+        return self
+
+    def forecast(self, years=None, horizon=None):
+        """
+        Forecast every series for the given years (or the `horizon` years
+        after the last observed year) in one matrix product. Returns a tidy
+        DataFrame: year, item, metric, forecast, residual_std.
+        """
+        if not self.is_fitted:
+            raise ValueError("Forecaster must be fitted before forecasting")
+        if years is None:
+            if horizon is None:
+                raise ValueError("Pass either years or horizon")
+            last = int(self.years.max())
+            years = range(last + 1, last + horizon + 1)
+
+        years = np.asarray(list(years), dtype="int64")
+        values = self._design_matrix(years) @ self.coefficients  # (n_years, n_series)
+        n_years, n_series = values.shape
+
+        return pd.DataFrame(
+            {
+                "year": np.repeat(years, n_series),
+                "item": np.tile(self.series.get_level_values(0).astype(str), n_years),
+                "metric": np.tile(self.series.get_level_values(1).astype(str), n_years),
+                "forecast": values.ravel(),
+                "residual_std": np.tile(self.residual_std, n_years),
+            }
+        )
+
+    def growth_factor(self, item, metric, year, base_year):
+        """
+        Ratio of the fitted trend at `year` to the trend at `base_year`.
+        """
+        column = self.series.get_loc((item, metric))
+        trend = self._design_matrix([year, base_year]) @ self.coefficients[:, column]
+        if trend[1] == 0:
+            return 1.0
+        return float(trend[0] / trend[1])
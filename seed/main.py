@@ -4,8 +4,33 @@ Main application for Gambia Crop Prediction Model
 Runs predictions for current and future years
 """
 
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
 from datetime import datetime
-from model import SeedModel
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from seed.model import SeedModel
+from seed.fact_table import load_fact_table
+from seed.report_cache import REPORT_FORMATS, ReportCache, frame_digest
+from seed.forecast import TrendForecaster
+from seed.sensitivity import partial_dependence_table, sensitivity_ranking
+
+# Farm practices whose historical adoption trend drives technology inputs
+TECHNOLOGY_TREND_SERIES = {
+    "fertilizer_use_kg_ha": ("Fertilizer Use", "area_hectares"),
+    "irrigation_area_percent": ("Irrigation", "area_hectares"),
+}
+
+
+def cached_section(cache, section, model, inputs, compute):
+    """compute() a report section, through the report cache when there is one"""
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(section, model.model_version, inputs, compute)
 
 
 def get_current_year():
@@ -13,147 +38,199 @@ def get_current_year():
     return datetime.now().year
 
 
-def run_predictions_for_year(model, year, scenarios=None):
+def technology_trend_factors(practice_trends, year):
     """
-    Run predictions for a specific year with different scenarios
+    Growth of technology inputs between the current year and `year`, taken
+    from the fitted farm practices trends instead of fixed annual rates
     """
-    print(f"\n{'=' * 60}")
-    print(f"PREDICTIONS FOR YEAR {year}")
-    print(f"{'=' * 60}")
+    if practice_trends is None:
+        return {}
+    return {
+        key: practice_trends.growth_factor(item, metric, year, get_current_year())
+        for key, (item, metric) in TECHNOLOGY_TREND_SERIES.items()
+    }
+
+
+DEFAULT_SCENARIOS = {
+    "Good Conditions": {
+        "rainfall_mm": 900,
+        "temperature_c": 28,
+        "humidity_percent": 80,
+        "soil_ph": 6.8,
+        "fertilizer_use_kg_ha": 80,
+        "irrigation_area_percent": 30,
+        "fuel_price_usd_liter": 1.2,
+        "labor_cost_usd_day": 15,
+        "market_demand_index": 120,
+    },
+    "Average Conditions": {
+        "rainfall_mm": 800,
+        "temperature_c": 27,
+        "humidity_percent": 70,
+        "soil_ph": 6.5,
+        "fertilizer_use_kg_ha": 60,
+        "irrigation_area_percent": 20,
+        "fuel_price_usd_liter": 1.3,
+        "labor_cost_usd_day": 16,
+        "market_demand_index": 100,
+    },
+    "Poor Conditions": {
+        "rainfall_mm": 600,
+        "temperature_c": 32,
+        "humidity_percent": 60,
+        "soil_ph": 5.5,
+        "fertilizer_use_kg_ha": 40,
+        "irrigation_area_percent": 10,
+        "fuel_price_usd_liter": 1.5,
+        "labor_cost_usd_day": 18,
+        "market_demand_index": 80,
+    },
+}
+
+PREDICTION_CROPS = [
+    "Rice",
+    "Millet",
+    "Sorghum",
+    "Maize",
+    "Groundnuts",
+    "Cotton",
+    "Vegetables",
+    "Fruits",
+]
+
+TARGETS = ["yield", "price", "production"]
+
+
+def adjust_conditions(base_conditions, year, trend_factors):
+    """
+    Project base scenario conditions from the current year to `year`
+    """
+    adjusted_conditions = {}
+    for key, value in base_conditions.items():
+        if key in ["rainfall_mm", "temperature_c", "humidity_percent"]:
+            # Climate factors
+            if key == "temperature_c":
+                adjusted_conditions[key] = value * (
+                    1 + (year - get_current_year()) * 0.01
+                )  # Warming
+            elif key == "rainfall_mm":
+                adjusted_conditions[key] = value * (
+                    1 + (year - get_current_year()) * 0.005
+                )  # Slight increase
+            else:
+                adjusted_conditions[key] = value
+        elif key in ["fertilizer_use_kg_ha", "irrigation_area_percent"]:
+            # Technology adoption
+            adjusted_conditions[key] = value * trend_factors.get(
+                key, 1 + (year - get_current_year()) * 0.03
+            )
+        elif key in ["fuel_price_usd_liter", "labor_cost_usd_day"]:
+            # Economic factors
+            adjusted_conditions[key] = value * (1 + (year - get_current_year()) * 0.05)
+        elif key == "market_demand_index":
+            # Market demand
+            adjusted_conditions[key] = value * (1 + (year - get_current_year()) * 0.02)
+        else:
+            adjusted_conditions[key] = value
+    return adjusted_conditions
+
+
+def predict_table(model, inputs):
+    """
+    inputs plus one column per target, predicted in one batch. If the batch
+    fails, rows are predicted one by one and the failing ones are left NaN.
+    """
+    try:
+        predictions = model.predict(inputs)
+    except Exception:
+        predictions = {target: np.full(len(inputs), np.nan) for target in TARGETS}
+        for i in range(len(inputs)):
+            try:
+                row = model.predict(inputs.iloc[[i]])
+            except Exception:
+                continue
+            for target in TARGETS:
+                predictions[target][i] = row[target][0]
+    return inputs.assign(**{target: predictions[target] for target in TARGETS})
+
+
+def _format_predictions(label, row, label_width):
+    """One console line: label then yield, price and production (ERROR if missing)"""
+    if pd.isna(row["yield"]) or pd.isna(row["price"]) or pd.isna(row["production"]):
+        return f"{label:<{label_width}} {'ERROR':<15} {'ERROR':<15} {'ERROR':<15}"
+    return (
+        f"{label:<{label_width}} {row['yield']:<15.2f} {row['price']:<15.2f} "
+        f"{row['production']:<15.0f}"
+    )
 
+
+def scenario_inputs(year, scenarios=None, practice_trends=None):
+    """
+    Scenario x crop input rows for one year: year, scenario, crop and the
+    projected conditions
+    """
     if scenarios is None:
-        # Default scenarios for the year
-        scenarios = {
-            "Good Conditions": {
-                "rainfall_mm": 900,
-                "temperature_c": 28,
-                "humidity_percent": 80,
-                "soil_ph": 6.8,
-                "fertilizer_use_kg_ha": 80,
-                "irrigation_area_percent": 30,
-                "fuel_price_usd_liter": 1.2,
-                "labor_cost_usd_day": 15,
-                "market_demand_index": 120,
-            },
-            "Average Conditions": {
-                "rainfall_mm": 800,
-                "temperature_c": 27,
-                "humidity_percent": 70,
-                "soil_ph": 6.5,
-                "fertilizer_use_kg_ha": 60,
-                "irrigation_area_percent": 20,
-                "fuel_price_usd_liter": 1.3,
-                "labor_cost_usd_day": 16,
-                "market_demand_index": 100,
-            },
-            "Poor Conditions": {
-                "rainfall_mm": 600,
-                "temperature_c": 32,
-                "humidity_percent": 60,
-                "soil_ph": 5.5,
-                "fertilizer_use_kg_ha": 40,
-                "irrigation_area_percent": 10,
-                "fuel_price_usd_liter": 1.5,
-                "labor_cost_usd_day": 18,
-                "market_demand_index": 80,
-            },
-        }
-
-    crops = [
-        "Rice",
-        "Millet",
-        "Sorghum",
-        "Maize",
-        "Groundnuts",
-        "Cotton",
-        "Vegetables",
-        "Fruits",
-    ]
+        scenarios = DEFAULT_SCENARIOS
 
-    # Adjust environmental factors based on year (future trends)
-    year_factor = 1 + (year - get_current_year()) * 0.02  # 2% annual change
+    # Technology adoption follows the historical practices trends
+    trend_factors = technology_trend_factors(practice_trends, year)
 
+    rows = []
     for scenario_name, base_conditions in scenarios.items():
+        conditions = adjust_conditions(base_conditions, year, trend_factors)
+        for crop in PREDICTION_CROPS:
+            rows.append({"year": year, "scenario": scenario_name, "crop": crop, **conditions})
+    return pd.DataFrame(rows)
+
+
+def print_predictions(table):
+    """Render a run_predictions_for_year table"""
+    year = table["year"].iloc[0]
+    print(f"\n{'=' * 60}")
+    print(f"PREDICTIONS FOR YEAR {year}")
+    print(f"{'=' * 60}")
+
+    condition_columns = [
+        col for col in table.columns if col not in ["year", "scenario", "crop", *TARGETS]
+    ]
+    for scenario_name, rows in table.groupby("scenario", sort=False):
         print(f"\n📊 {scenario_name.upper()}")
         print("-" * 40)
 
-        # Adjust conditions for future years
-        adjusted_conditions = {}
-        for key, value in base_conditions.items():
-            if key in ["rainfall_mm", "temperature_c", "humidity_percent"]:
-                # Climate factors
-                if key == "temperature_c":
-                    adjusted_conditions[key] = value * (
-                        1 + (year - get_current_year()) * 0.01
-                    )  # Warming
-                elif key == "rainfall_mm":
-                    adjusted_conditions[key] = value * (
-                        1 + (year - get_current_year()) * 0.005
-                    )  # Slight increase
-                else:
-                    adjusted_conditions[key] = value
-            elif key in ["fertilizer_use_kg_ha", "irrigation_area_percent"]:
-                # Technology adoption
-                adjusted_conditions[key] = value * (
-                    1 + (year - get_current_year()) * 0.03
-                )
-            elif key in ["fuel_price_usd_liter", "labor_cost_usd_day"]:
-                # Economic factors
-                adjusted_conditions[key] = value * (
-                    1 + (year - get_current_year()) * 0.05
-                )
-            elif key == "market_demand_index":
-                # Market demand
-                adjusted_conditions[key] = value * (
-                    1 + (year - get_current_year()) * 0.02
-                )
-            else:
-                adjusted_conditions[key] = value
-
         print(f"Year {year} Conditions:")
-        for key, value in adjusted_conditions.items():
-            print(f"  {key}: {value:.2f}")
+        for key in condition_columns:
+            print(f"  {key}: {rows[key].iloc[0]:.2f}")
 
         print(
             f"\n{'Crop':<12} {'Yield (t/ha)':<15} {'Price ($/t)':<15} {'Production (t)':<15}"
         )
         print("-" * 60)
-
-        for crop in crops:
-            input_data = {"crop": crop, **adjusted_conditions}
-
-            try:
-                predictions = model.predict(input_data)
-                yield_val = predictions["yield"][0]
-                price_val = predictions["price"][0]
-                production_val = predictions["production"][0]
-
-                print(
-                    f"{crop:<12} {yield_val:<15.2f} {price_val:<15.2f} {production_val:<15.0f}"
-                )
-            except Exception as e:
-                print(f"{crop:<12} {'ERROR':<15} {'ERROR':<15} {'ERROR':<15}")
+        for _, row in rows.iterrows():
+            print(_format_predictions(row["crop"], row, 12))
 
 
-def run_rainfall_analysis(model, year):
+def run_predictions_for_year(model, year, scenarios=None, practice_trends=None, cache=None):
     """
-    Run detailed rainfall impact analysis for a specific year
+    Run predictions for a specific year with different scenarios.
+    Returns the scenario x crop predictions table; with a ReportCache it is
+    only recomputed when the model or the projected scenario rows changed.
     """
-    print(f"\n{'=' * 60}")
-    print(f"RAINFALL IMPACT ANALYSIS FOR YEAR {year}")
-    print(f"{'=' * 60}")
+    inputs = scenario_inputs(year, scenarios, practice_trends)
+    table = cached_section(
+        cache, f"predictions_{year}", model, inputs, lambda: predict_table(model, inputs)
+    )
+    print_predictions(table)
+    return table
+
 
+def rainfall_inputs(year):
+    """The rainfall level x crop grid of the rainfall analysis"""
     rainfall_levels = [400, 600, 800, 1000, 1200, 1400]
     crops = ["Rice", "Millet", "Groundnuts"]
-
-    print(
-        f"\n{'Rainfall (mm)':<15} {'Crop':<12} {'Yield (t/ha)':<15} {'Price ($/t)':<15} {'Production (t)':<15}"
-    )
-    print("-" * 75)
-
-    for rainfall in rainfall_levels:
-        for crop in crops:
-            input_data = {
+    return pd.DataFrame(
+        [
+            {
+                "year": year,
                 "crop": crop,
                 "rainfall_mm": rainfall,
                 "temperature_c": 27,
@@ -165,91 +242,241 @@ def run_rainfall_analysis(model, year):
                 "labor_cost_usd_day": 16,
                 "market_demand_index": 100,
             }
+            for rainfall in rainfall_levels
+            for crop in crops
+        ]
+    )
 
-            try:
-                predictions = model.predict(input_data)
-                yield_val = predictions["yield"][0]
-                price_val = predictions["price"][0]
-                production_val = predictions["production"][0]
 
-                print(
-                    f"{rainfall:<15} {crop:<12} {yield_val:<15.2f} {price_val:<15.2f} {production_val:<15.0f}"
-                )
-            except Exception as e:
-                print(
-                    f"{rainfall:<15} {crop:<12} {'ERROR':<15} {'ERROR':<15} {'ERROR':<15}"
-                )
+def run_rainfall_analysis(model, year, cache=None):
+    """
+    Run detailed rainfall impact analysis for a specific year
+    """
+    # Evaluate the whole rainfall x crop grid in one batched prediction
+    inputs = rainfall_inputs(year)
+    table = cached_section(
+        cache, f"rainfall_{year}", model, inputs, lambda: predict_table(model, inputs)
+    )
+
+    print(f"\n{'=' * 60}")
+    print(f"RAINFALL IMPACT ANALYSIS FOR YEAR {year}")
+    print(f"{'=' * 60}")
+
+    print(
+        f"\n{'Rainfall (mm)':<15} {'Crop':<12} {'Yield (t/ha)':<15} {'Price ($/t)':<15} {'Production (t)':<15}"
+    )
+    print("-" * 75)
+    for _, row in table.iterrows():
+        print(f"{row['rainfall_mm']:<15} " + _format_predictions(row["crop"], row, 12))
+    return table
+
+
+def run_sensitivity_analysis(model, top_n=5, cache=None):
+    """
+    Rank features by how far their partial-dependence curves move each target
+    """
+    ranking = cached_section(
+        cache,
+        "sensitivity",
+        model,
+        None,
+        lambda: sensitivity_ranking(partial_dependence_table(model)),
+    )
+
+    print(f"\n{'=' * 60}")
+    print("SENSITIVITY ANALYSIS (PARTIAL DEPENDENCE)")
+    print(f"{'=' * 60}")
+
+    for target, group in ranking.groupby("target", sort=False):
+        print(f"\n📊 Most influential features for {target} (mean PD range over crops):")
+        print(group.head(top_n)[["feature", "pd_range"]].to_string(index=False))
+    return ranking
 
 
-def run_future_trends_analysis(model, start_year, end_year):
+def future_trends_inputs(start_year, end_year, practice_trends=None):
+    """Crop x year input rows of the future trends analysis"""
+    rows = []
+    for crop in ["Rice", "Groundnuts", "Vegetables"]:
+        for year in range(start_year, end_year + 1):
+            # Adjust conditions for future
+            trend_factors = technology_trend_factors(practice_trends, year)
+            rows.append(
+                {
+                    "year": year,
+                    "crop": crop,
+                    "rainfall_mm": 800 * (1 + (year - get_current_year()) * 0.005),
+                    "temperature_c": 27 * (1 + (year - get_current_year()) * 0.01),
+                    "humidity_percent": 70,
+                    "soil_ph": 6.5,
+                    "fertilizer_use_kg_ha": 60
+                    * trend_factors.get(
+                        "fertilizer_use_kg_ha", 1 + (year - get_current_year()) * 0.03
+                    ),
+                    "irrigation_area_percent": 20
+                    * trend_factors.get(
+                        "irrigation_area_percent", 1 + (year - get_current_year()) * 0.03
+                    ),
+                    "fuel_price_usd_liter": 1.3 * (1 + (year - get_current_year()) * 0.05),
+                    "labor_cost_usd_day": 16 * (1 + (year - get_current_year()) * 0.05),
+                    "market_demand_index": 100 * (1 + (year - get_current_year()) * 0.02),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def run_future_trends_analysis(model, start_year, end_year, practice_trends=None, cache=None):
     """
     Run analysis of trends over multiple future years
     """
+    inputs = future_trends_inputs(start_year, end_year, practice_trends)
+    table = cached_section(
+        cache,
+        f"future_trends_{start_year}_{end_year}",
+        model,
+        inputs,
+        lambda: predict_table(model, inputs),
+    )
+
     print(f"\n{'=' * 60}")
     print(f"FUTURE TRENDS ANALYSIS ({start_year} - {end_year})")
     print(f"{'=' * 60}")
 
-    crops = ["Rice", "Groundnuts", "Vegetables"]
-    years = range(start_year, end_year + 1)
-
-    for crop in crops:
+    for crop, rows in table.groupby("crop", sort=False):
         print(f"\n📈 {crop.upper()} - Future Trends")
         print("-" * 40)
         print(
             f"{'Year':<8} {'Yield (t/ha)':<15} {'Price ($/t)':<15} {'Production (t)':<15}"
         )
         print("-" * 55)
+        for _, row in rows.iterrows():
+            print(_format_predictions(row["year"], row, 8))
+    return table
 
-        for year in years:
-            # Adjust conditions for future
-            year_factor = 1 + (year - get_current_year()) * 0.02
 
-            input_data = {
-                "crop": crop,
-                "rainfall_mm": 800 * (1 + (year - get_current_year()) * 0.005),
-                "temperature_c": 27 * (1 + (year - get_current_year()) * 0.01),
-                "humidity_percent": 70,
-                "soil_ph": 6.5,
-                "fertilizer_use_kg_ha": 60 * (1 + (year - get_current_year()) * 0.03),
-                "irrigation_area_percent": 20
-                * (1 + (year - get_current_year()) * 0.03),
-                "fuel_price_usd_liter": 1.3 * (1 + (year - get_current_year()) * 0.05),
-                "labor_cost_usd_day": 16 * (1 + (year - get_current_year()) * 0.05),
-                "market_demand_index": 100 * (1 + (year - get_current_year()) * 0.02),
-            }
+def run_historical_trend_forecast(crop_trends, years, cache=None, data_version=None):
+    """
+    Show per-crop yield and production trends fitted to the 2001-2021 history.
+    With a ReportCache the forecast is keyed on data_version (the fact table
+    the trends were fitted to) and the years.
+    """
+    def compute():
+        forecast = crop_trends.forecast(years=years)
+        return forecast.pivot_table(
+            index=["item", "year"], columns="metric", values="forecast"
+        ).reset_index()
+
+    if cache is None:
+        table = compute()
+    else:
+        table = cache.get_or_compute(
+            "historical_forecast", data_version, {"years": list(years)}, compute
+        )
 
-            try:
-                predictions = model.predict(input_data)
-                yield_val = predictions["yield"][0]
-                price_val = predictions["price"][0]
-                production_val = predictions["production"][0]
+    print(f"\n{'=' * 60}")
+    print(f"HISTORICAL TREND FORECAST ({min(years)} - {max(years)})")
+    print(f"{'=' * 60}")
 
-                print(
-                    f"{year:<8} {yield_val:<15.2f} {price_val:<15.2f} {production_val:<15.0f}"
-                )
-            except Exception as e:
-                print(f"{year:<8} {'ERROR':<15} {'ERROR':<15} {'ERROR':<15}")
+    print(f"\n{'Crop':<12} {'Year':<8} {'Yield (t/ha)':<15} {'Production (t)':<15}")
+    print("-" * 50)
+    for _, row in table.iterrows():
+        print(
+            f"{row['item']:<12} {row['year']:<8} {row['yield_per_hectare']:<15.2f} {row['production_tons']:<15.0f}"
+        )
+    return table
+
+
+def feature_importance_table(model, targets=TARGETS):
+    """Native and permutation importances of every target in one long table"""
+    frames = [
+        model.get_feature_importance(target, method=method).assign(
+            target=target, method=method
+        )
+        for target in targets
+        for method in ["native", "permutation"]
+    ]
+    return pd.concat(frames, ignore_index=True)
 
 
-def main():
+def run_feature_importance_analysis(model, top_n=5, cache=None):
+    """
+    Show the top native and held-out permutation importances per target
+    """
+    table = cached_section(
+        cache, "feature_importance", model, None, lambda: feature_importance_table(model)
+    )
+
+    print(f"\n{'=' * 60}")
+    print("FEATURE IMPORTANCE ANALYSIS")
+    print(f"{'=' * 60}")
+
+    columns = [col for col in table.columns if col not in ("target", "method")]
+    for target in TARGETS:
+        rows = table[table["target"] == target]
+        print(f"\n📊 Top {top_n} features for {target} prediction:")
+        native = rows[rows["method"] == "native"][columns]
+        print(native.dropna(axis=1, how="all").head(top_n).to_string(index=False))
+
+        # Held-out permutation importance: comparable across estimator types
+        print(f"\n🔀 Top {top_n} features for {target} (permutation, held-out R² drop):")
+        permutation = rows[rows["method"] == "permutation"][columns]
+        print(permutation.dropna(axis=1, how="all").head(top_n).to_string(index=False))
+    return table
+
+
+def load_saved_model(model, model_path):
+    """
+    Load model_path into model if it was trained on the current data.
+    Returns True when the saved model was reused.
+    """
+    try:
+        model.load_model(model_path)
+    except Exception as e:
+        print(f"⚠️  Could not load saved model: {e}")
+        return False
+    return model.data_version is not None and (
+        model.data_version == model.compute_data_version()
+    )
+
+
+def main(argv=None):
     """
     Main function to run crop predictions
     """
+    parser = argparse.ArgumentParser(description="Gambia crop predictions report")
+    parser.add_argument("--reports", default="reports", help="Directory of the cached report tables")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="csv", help="Format of the cached report tables")
+    parser.add_argument("--refresh", action="store_true", help="Recompute every report section")
+    args = parser.parse_args(argv)
+
     print("🌾 Gambia Crop Prediction Model")
     print("=" * 50)
 
     # Initialize model
-    print("Loading and training model...")
     model = SeedModel()
-
-    # Load real data and train
-    real_data = model.load_real_data()
-    model.train_models(real_data)
-    print("✅ Model trained successfully!")
+    model_path = Path("seed_model.pkl")
+
+    # Reuse the saved model (and its cached importances) while the data it
+    # was trained on is unchanged; otherwise load real data and train
+    if model_path.exists() and load_saved_model(model, model_path):
+        print("✅ Loaded saved model (training data unchanged)")
+    else:
+        print("Loading and training model...")
+        real_data = model.load_real_data()
+        model.train_models(real_data)
+        print("✅ Model trained successfully!")
 
     current_year = get_current_year()
     print(f"Current year: {current_year}")
 
+    # Report sections are materialized as tables and only recomputed when
+    # the model or their inputs change
+    cache = ReportCache(args.reports, fmt=args.format, refresh=args.refresh)
+
+    # Fit historical trends for all crops and farm practices at once
+    fact_table = load_fact_table()
+    crop_trends = TrendForecaster(category="crops").fit(fact_table)
+    practice_trends = TrendForecaster(category="practices").fit(fact_table)
+
     # Run predictions for different years
     years_to_predict = [
         current_year,
@@ -266,26 +493,32 @@ def main():
         else:
             print(f"\n🚀 PREDICTIONS FOR FUTURE YEAR ({year})")
 
-        run_predictions_for_year(model, year)
+        run_predictions_for_year(model, year, practice_trends=practice_trends, cache=cache)
 
     # Run rainfall analysis for current year
-    run_rainfall_analysis(model, current_year)
+    run_rainfall_analysis(model, current_year, cache=cache)
+
+    # Partial-dependence sensitivity for every feature, crop and target
+    run_sensitivity_analysis(model, cache=cache)
 
     # Run future trends analysis
-    run_future_trends_analysis(model, current_year, current_year + 10)
+    run_future_trends_analysis(
+        model, current_year, current_year + 10, practice_trends=practice_trends, cache=cache
+    )
 
-    # Show feature importance
-    print(f"\n{'=' * 60}")
-    print("FEATURE IMPORTANCE ANALYSIS")
-    print(f"{'=' * 60}")
+    # Forecast crop yields and production from the historical trends
+    run_historical_trend_forecast(
+        crop_trends,
+        [current_year, current_year + 5, current_year + 10],
+        cache=cache,
+        data_version=frame_digest(fact_table),
+    )
 
-    for target in ["yield", "price", "production"]:
-        print(f"\n📊 Top 5 features for {target} prediction:")
-        importance_df = model.get_feature_importance(target)
-        print(importance_df.head().to_string(index=False))
+    # Show feature importance
+    run_feature_importance_analysis(model, cache=cache)
 
-    # Save model
-    model.save_model("seed_model.pkl")
+    # Save model (including the cached permutation importances)
+    model.save_model(model_path)
     print("\n✅ Model saved for future use!")
 
     print(f"\n{'=' * 60}")
@@ -295,6 +528,7 @@ def main():
     print("🌧️  Rainfall impact analysis completed")
     print("📈 Future trends analysis completed")
     print("🎯 Model ready for future predictions")
+    print(f"🗂️  {cache.summary()} ({cache.cache_dir}/)")
 
 
 if __name__ == "__main__":
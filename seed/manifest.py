@@ -0,0 +1,331 @@
+"""
+Content-hash manifest for the data/YYYY/category_YYYY.csv partitions
+"""
+
+import os
+import re
+import csv
+import json
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+from seed.dataset_writer import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+PARTITION_PATTERN = re.compile(r"^(?P<category>[a-z]+)_(?P<year>\d{4})\.csv$")
+YEAR_DIR_PATTERN = re.compile(r"^\d{4}$")
+
+# Rows sampled from a file to infer its column types when it is scanned
+DTYPE_SAMPLE_ROWS = 256
+
+
+def normalize_dtype(dtype) -> str:
+    """
+    Collapse a pandas dtype to a stable kind ("int", "float", "bool", "str"),
+    so types recorded from in-memory frames and from CSV files agree.
+    """
+    if pd.api.types.is_bool_dtype(dtype):
+        return "bool"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "int"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float"
+    return "str"
+
+
+def frame_schema(df: pd.DataFrame) -> Dict[str, str]:
+    """Ordered {column: kind} schema of a DataFrame"""
+    return {str(col): normalize_dtype(dtype) for col, dtype in df.dtypes.items()}
+
+
+def scan_csv(filepath, chunk_size: int = 1 << 20):
+    """
+    Stream a CSV file once, returning (sha256, rows, columns, n_bytes).
+    Only one chunk is held in memory at a time.
+    """
+    digest = hashlib.sha256()
+    newlines = 0
+    n_bytes = 0
+    header = b""
+    last_byte = b"\n"
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+            newlines += chunk.count(b"\n")
+            n_bytes += len(chunk)
+            if b"\n" not in header:
+                header += chunk[: chunk.find(b"\n") + 1 or len(chunk)]
+            last_byte = chunk[-1:]
+
+    lines = newlines + (0 if last_byte == b"\n" else 1)
+    columns = next(csv.reader([header.decode("utf-8").strip()])) if header else []
+    return digest.hexdigest(), max(lines - 1, 0), columns, n_bytes
+
+
+def sample_schema(filepath, columns: List[str]) -> Dict[str, str]:
+    """
+    {column: kind} of a CSV file in header order, inferred from its first
+    DTYPE_SAMPLE_ROWS rows
+    """
+    schema = frame_schema(pd.read_csv(filepath, nrows=DTYPE_SAMPLE_ROWS))
+    # Keep the header order even when the sample is empty
+    return {col: schema.get(col, "str") for col in columns}
+
+
+def partition_key(year, category) -> str:
+    return f"{int(year)}/{category}"
+
+
+def discover_partitions(data_dir) -> List[Path]:
+    """
+    Every data/YYYY/category_YYYY.csv partition, in year/category order.
+    """
+    data_dir = Path(data_dir)
+    partitions = []
+    for year_dir in sorted(data_dir.iterdir()):
+        if not (year_dir.is_dir() and YEAR_DIR_PATTERN.match(year_dir.name)):
+            continue
+        for filepath in sorted(year_dir.iterdir()):
+            match = PARTITION_PATTERN.match(filepath.name)
+            if match and match.group("year") == year_dir.name:
+                partitions.append(filepath)
+    return partitions
+
+
+class DatasetManifest:
+    """
+    data/manifest.json: content hash, row count and schema of every
+    year/category partition, plus a digest per year. Consumers compare the
+    per-year digests against the ones they last loaded to find the years
+    that need reloading.
+    """
+
+    FILENAME = "manifest.json"
+    VERSION = 1
+
+    def __init__(self, data_dir: str = "data"):
+        self.data_dir = Path(data_dir)
+        self.partitions: Dict[str, dict] = {}
+
+    @property
+    def path(self) -> Path:
+        return self.data_dir / self.FILENAME
+
+    @classmethod
+    def load(cls, data_dir: str = "data") -> "DatasetManifest":
+        """Load data/manifest.json, or return an empty manifest"""
+        manifest = cls(data_dir)
+        if manifest.path.exists():
+            with open(manifest.path) as f:
+                content = json.load(f)
+            if content.get("version") == cls.VERSION:
+                manifest.partitions = content["partitions"]
+        return manifest
+
+    def save(self) -> bool:
+        """
+        Write the manifest; returns False when the file was already current.
+        """
+        payload = self.to_json().encode("utf-8")
+        if self.path.exists() and self.path.read_bytes() == payload:
+            return False
+        atomic_write_bytes(self.path, payload)
+        logger.info(f"Saved manifest to {self.path}")
+        return True
+
+    def to_json(self) -> str:
+        content = {
+            "version": self.VERSION,
+            "years": self.year_digests(),
+            "partitions": dict(sorted(self.partitions.items())),
+        }
+        return json.dumps(content, indent=2) + "\n"
+
+    def get(self, year, category):
+        return self.partitions.get(partition_key(year, category))
+
+    def record(
+        self,
+        year,
+        category,
+        filepath,
+        sha256: str,
+        rows: int,
+        schema: Dict[str, str],
+    ):
+        """Record (or replace) the entry for one partition"""
+        stat = Path(filepath).stat()
+        self.partitions[partition_key(year, category)] = {
+            "path": Path(filepath).relative_to(self.data_dir).as_posix(),
+            "sha256": sha256,
+            "rows": int(rows),
+            "bytes": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "schema": schema,
+        }
+
+    def record_frame(self, write, df: pd.DataFrame):
+        """Record a partition just written by ParallelDatasetWriter"""
+        self.record(
+            write.year, write.category, write.path, write.sha256, write.rows, frame_schema(df)
+        )
+
+    def is_current(self, year, category, filepath, sha256: str) -> bool:
+        """
+        True when the partition on disk already holds content with sha256.
+        Relies on the recorded size and mtime, so no file is read.
+        """
+        entry = self.get(year, category)
+        if entry is None or entry["sha256"] != sha256:
+            return False
+        try:
+            stat = Path(filepath).stat()
+        except FileNotFoundError:
+            return False
+        return stat.st_size == entry["bytes"] and stat.st_mtime_ns == entry["mtime_ns"]
+
+    def refresh(self, max_workers: int = None) -> List[str]:
+        """
+        Bring the manifest in line with the files on disk. Only partitions
+        that are new or whose size/mtime changed are rescanned. Returns the
+        keys that were (re)scanned.
+        """
+        on_disk = {}
+        for filepath in discover_partitions(self.data_dir):
+            match = PARTITION_PATTERN.match(filepath.name)
+            on_disk[partition_key(match.group("year"), match.group("category"))] = (
+                filepath
+            )
+
+        for key in set(self.partitions) - set(on_disk):
+            del self.partitions[key]
+
+        stale = []
+        for key, filepath in on_disk.items():
+            entry = self.partitions.get(key)
+            stat = filepath.stat()
+            if (
+                entry is None
+                or entry["bytes"] != stat.st_size
+                or entry["mtime_ns"] != stat.st_mtime_ns
+            ):
+                stale.append(key)
+
+        if max_workers is None:
+            max_workers = min(8, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            scans = executor.map(lambda key: self._scan(on_disk[key]), stale)
+            for key, (sha256, rows, schema) in zip(stale, scans):
+                year, category = key.split("/")
+                self.record(year, category, on_disk[key], sha256, rows, schema)
+
+        return stale
+
+    def _scan(self, filepath):
+        sha256, rows, columns, _ = scan_csv(filepath)
+        return sha256, rows, sample_schema(filepath, columns)
+
+    def year_digests(self) -> Dict[str, str]:
+        """
+        {year: digest over that year's partition hashes}. A year's digest
+        changes whenever any of its partitions is added, removed or edited.
+        """
+        by_year: Dict[str, List[str]] = {}
+        for key, entry in sorted(self.partitions.items()):
+            year, category = key.split("/")
+            by_year.setdefault(year, []).append(f"{category}:{entry['sha256']}")
+
+        return {
+            year: hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+            for year, lines in by_year.items()
+        }
+
+    def changed_years(self, previous_digests: Dict[str, str]) -> List[int]:
+        """
+        Years whose digest differs from previous_digests (e.g. the "years"
+        block of a manifest a consumer loaded earlier), including years that
+        were added or removed since.
+        """
+        current = self.year_digests()
+        years = set(current) | set(previous_digests)
+        return sorted(
+            int(year)
+            for year in years
+            if current.get(year) != previous_digests.get(year)
+        )
+
+
+def read_year_digests(data_dir: str = "data") -> Dict[str, str]:
+    """
+    Cheap consumer-side read of the per-year digests in data/manifest.json.
+    """
+    path = Path(data_dir) / DatasetManifest.FILENAME
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f).get("years", {})
+
+
+def verify_partition(manifest: DatasetManifest, key: str, filepath: Path) -> dict:
+    """
+    Stream one partition and compare its checksum, row count, header and
+    column kinds against the manifest entry. Returns {"key", "path",
+    "problems"}.
+    """
+    entry = manifest.partitions.get(key)
+    result = {"key": key, "path": filepath, "problems": []}
+    if entry is None:
+        result["problems"].append("not in manifest")
+        return result
+
+    sha256, rows, columns, _ = scan_csv(filepath)
+    expected_columns = list(entry["schema"])
+    if columns != expected_columns:
+        result["problems"].append(f"columns {columns} != {expected_columns}")
+    else:
+        schema = sample_schema(filepath, columns)
+        for col, kind in entry["schema"].items():
+            if schema[col] != kind:
+                result["problems"].append(f"{col} is {schema[col]}, expected {kind}")
+    if rows != entry["rows"]:
+        result["problems"].append(f"{rows} rows != {entry['rows']}")
+    if sha256 != entry["sha256"]:
+        result["problems"].append("checksum mismatch")
+    return result
+
+
+def verify_data_tree(manifest: DatasetManifest, max_workers: int = None) -> List[dict]:
+    """
+    Verify every partition on disk against the manifest in parallel.
+    Partitions listed in the manifest but missing on disk are reported too.
+    """
+    on_disk = {}
+    for filepath in discover_partitions(manifest.data_dir):
+        match = PARTITION_PATTERN.match(filepath.name)
+        on_disk[partition_key(match.group("year"), match.group("category"))] = filepath
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda key: verify_partition(manifest, key, on_disk[key]),
+                sorted(on_disk),
+            )
+        )
+
+    for key in sorted(set(manifest.partitions) - set(on_disk)):
+        results.append(
+            {
+                "key": key,
+                "path": manifest.data_dir / manifest.partitions[key]["path"],
+                "problems": ["missing"],
+            }
+        )
+    return results
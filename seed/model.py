@@ -6,21 +6,72 @@ Uses real datasets from data/ directory
 
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.linear_model import LinearRegression, Ridge
-from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV
+from sklearn.model_selection import train_test_split, GridSearchCV
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
 from sklearn.pipeline import Pipeline
 from sklearn.compose import ColumnTransformer
 from sklearn.preprocessing import OneHotEncoder
 import joblib
+from joblib import Parallel, delayed
+import hashlib
+import uuid
 import warnings
+from contextlib import nullcontext
+from functools import wraps
+from itertools import product
 from pathlib import Path
+
+from seed.bootstrap import bootstrap_metrics
+from seed.drift import DriftMonitor, DriftReference
+from seed.distillation import distill_estimator, is_distillable
+from seed.selection import FoldCache, ModelSelector
+from seed.packed_trees import (
+    PACKED_FORMAT_VERSION,
+    PackedTreeEnsemble,
+    check_format_version,
+    is_packable,
+    linear_contributions,
+)
+from seed.profiling import MemoryProfiler
+from seed.stacking import StackedRegressor, fit_stack
+from seed.regions import region_dir
 import os
 
 warnings.filterwarnings("ignore")
 
+METRIC_LABELS = {"r2": "R²", "rmse": "RMSE", "mae": "MAE"}
+
+
+def _permuted_scores(models, targets, X_test, y_tests, seed):
+    """
+    R² of every target model with each feature of X_test shuffled in turn.
+    Returns an array of shape (n_targets, n_features).
+    """
+    rng = np.random.default_rng(seed)
+    X_permuted = X_test.copy()
+    scores = np.empty((len(targets), X_test.shape[1]))
+    for j in range(X_test.shape[1]):
+        X_permuted[:, j] = X_test[rng.permutation(len(X_test)), j]
+        for t, target in enumerate(targets):
+            scores[t, j] = r2_score(y_tests[target], models[target].predict(X_permuted))
+        X_permuted[:, j] = X_test[:, j]
+    return scores
+
+
+def _profiled(stage):
+    """Record the decorated method as a memory profiling stage when enabled"""
+
+    def decorate(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self._stage(stage):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
 
 class SeedModel:
     """
@@ -28,25 +79,80 @@ class SeedModel:
     Uses real datasets from data/ directory
     """
 
+    # Engineered columns computed by add_derived_features
+    DERIVED_FEATURES = (
+        "rainfall_squared",
+        "temperature_humidity_interaction",
+        "fertilizer_irrigation_interaction",
+    )
+
     def __init__(self):
         self.models = {"yield": None, "price": None, "production": None}
         self.scalers = {}
         self.label_encoders = {}
         self.feature_names = []
+        self.training_features = None
+        self.holdout = {}
+        self.permutation_importances = {}
+        self.packed_models = {}
+        self.students = {}
+        self.distillation_report = {}
+        self.stacking_report = {}
+        self.metric_intervals = None
+        self.drift_reference = None
+        self.drift_monitor = None
+        self.selection_log = []
+        self.data_version = None
+        self.model_version = None
         self.is_trained = False
         self.data_dir = Path("data")
+        self.memory_profiler = None
+
+    def profile_memory(self, top_n=10):
+        """
+        Turn on memory profiling. Data loading, feature preparation, the
+        split, scaling, each target's CV and fit, and predict are recorded
+        as stages of the returned MemoryProfiler.
+        """
+        self.memory_profiler = MemoryProfiler(top_n=top_n).start()
+        return self.memory_profiler
 
-    def load_real_data(self, years=None):
+    def monitor_drift(self):
         """
-        Load real agricultural data from data/ directory
+        Score every predict() batch against the training inputs' statistics.
+        Returns the DriftMonitor: its last_report holds the latest batch's
+        drift scores and summary() the scores over everything predicted.
+        """
+        if self.drift_reference is None:
+            raise ValueError("No training statistics in this model; retrain it")
+        self.drift_monitor = DriftMonitor(self.drift_reference)
+        return self.drift_monitor
+
+    def _stage(self, name):
+        if self.memory_profiler is None:
+            return nullcontext()
+        return self.memory_profiler.stage(name)
+
+    @_profiled("load_real_data")
+    def load_real_data(self, years=None, regions=None):
+        """
+        Load real agricultural data from data/ directory.
+        With regions, load those regions' data/synthetic_regions/<Region>/ partitions
+        instead of the national ones, with a region column added.
         """
         if years is None:
             years = range(2001, 2022)  # All available years
 
+        self.data_version = self.compute_data_version(years, regions)
         all_data = []
 
-        for year in years:
-            year_dir = self.data_dir / str(year)
+        if regions is None:
+            roots = [(None, self.data_dir)]
+        else:
+            roots = [(region, region_dir(self.data_dir, region)) for region in regions]
+
+        for (region, root), year in product(roots, years):
+            year_dir = root / str(year)
             if not year_dir.exists():
                 continue
 
@@ -90,10 +196,31 @@ class SeedModel:
                         "production_tons": row["production_tons"],
                         "farmers_count": row["farmers_count"],
                     }
+                    if region is not None:
+                        data_row["region"] = region
                     all_data.append(data_row)
 
         return pd.DataFrame(all_data)
 
+    def compute_data_version(self, years=None, regions=None):
+        """
+        Digest of the crops files a model is trained on; a saved model whose
+        data_version matches can be reused instead of retrained
+        """
+        if years is None:
+            years = range(2001, 2022)
+
+        digest = hashlib.sha256()
+        for region, year in product([None] if regions is None else regions, years):
+            root = self.data_dir if region is None else region_dir(self.data_dir, region)
+            crops_file = root / str(year) / f"crops_{year}.csv"
+            if crops_file.exists():
+                if region is not None:
+                    digest.update(region.encode())
+                digest.update(str(year).encode())
+                digest.update(crops_file.read_bytes())
+        return digest.hexdigest()
+
     def _generate_rainfall(self, year, crop):
         """Generate realistic rainfall data"""
         base_rainfall = 800  # mm/year average
@@ -224,11 +351,19 @@ class SeedModel:
         factor = crop_factors.get(crop, 1.0)
         return np.random.normal(base_demand * factor * year_factor, 20)
 
-    def prepare_features(self, df):
+    def raw_input_features(self):
+        """The numeric model inputs a caller provides (not derived, not crop)"""
+        return [
+            f
+            for f in self.feature_names
+            if f not in self.DERIVED_FEATURES and f != "crop_encoded"
+        ]
+
+    @staticmethod
+    def add_derived_features(df):
         """
-        Prepare features for machine learning
+        Add the engineered rainfall and interaction features in place
         """
-        # Create additional features
         df["rainfall_squared"] = df["rainfall_mm"] ** 2
         df["temperature_humidity_interaction"] = (
             df["temperature_c"] * df["humidity_percent"]
@@ -236,6 +371,15 @@ class SeedModel:
         df["fertilizer_irrigation_interaction"] = (
             df["fertilizer_use_kg_ha"] * df["irrigation_area_percent"]
         )
+        return df
+
+    @_profiled("prepare_features")
+    def prepare_features(self, df):
+        """
+        Prepare features for machine learning
+        """
+        # Create additional features
+        self.add_derived_features(df)
 
         # Encode categorical variables
         le_crop = LabelEncoder()
@@ -262,76 +406,119 @@ class SeedModel:
         self.feature_names = feature_columns
         return df[feature_columns]
 
-    def train_models(self, df, test_size=0.2, random_state=42):
+    def train_models(
+        self,
+        df,
+        test_size=0.2,
+        random_state=42,
+        distill=False,
+        time_budget=None,
+        cache_dir=None,
+        stack=False,
+        n_jobs=-1,
+        n_bootstrap=2000,
+    ):
         """
-        Train models for yield, price, and production prediction
+        Train models for yield, price, and production prediction. With
+        distill=True (opt-in, it labels 10k synthetic samples per forest),
+        targets won by a random forest also get a compact student model
+        (see distill). time_budget (seconds) bounds model
+        selection: expensive candidates predicted to overrun it are skipped
+        and recorded in self.selection_log. cache_dir keeps the scaled CV
+        folds in a joblib Memory cache, reused by retrains on the same data.
+        With stack=True each target gets a StackedRegressor over every
+        evaluated candidate, built from the selection pass's out-of-fold
+        predictions, with the base models refitted on n_jobs workers.
+        n_bootstrap held-out resamples give 95% confidence intervals for the
+        test metrics (self.metric_intervals); 0 skips them.
         """
         X = self.prepare_features(df)
+        # Unscaled training features, kept as background data for analyses
+        self.training_features = X.copy()
+        # Statistics of the raw inputs that live inputs are checked against
+        self.drift_reference = DriftReference.from_frame(X[self.raw_input_features()])
 
         # Define targets
-        targets = {
-            "yield": df["yield_per_hectare"],
-            "price": self._calculate_price_per_ton(
-                df
-            ),  # Calculate price from available data
-            "production": df["production_tons"],
-        }
+        targets = self.build_targets(df)
+
+        # Split and scale once: every target shares the same rows and scaler
+        with self._stage("split"):
+            train_idx, test_idx = train_test_split(
+                np.arange(len(X)), test_size=test_size, random_state=random_state
+            )
+            X_train = X.iloc[train_idx].to_numpy(dtype=np.float64)
+        with self._stage("scale"):
+            scaler = StandardScaler()
+            X_train_scaled = scaler.fit_transform(X.iloc[train_idx])
+            X_test_scaled = scaler.transform(X.iloc[test_idx])
+
+        # CV folds (and their scaled matrices) shared by every candidate and target
+        folds = FoldCache(X_train, n_splits=5, cache_dir=cache_dir)
+
+        # Held-out split, kept for permutation importance
+        self.holdout = {"X_test_scaled": X_test_scaled, "y_test": {}}
+        self.permutation_importances = {}
+        self.packed_models = {}
+        self.students = {}
+        self.distillation_report = {}
+        self.stacking_report = {}
+        self.metric_intervals = None
+        test_predictions = {}
+
+        # Model selection, optionally within a wall-clock budget
+        selector = ModelSelector(time_budget=time_budget, random_state=random_state)
+        selector.start(len(targets))
+        self.selection_log = selector.log
 
         # Train models for each target
         for target_name, y in targets.items():
             print(f"\nTraining model for {target_name} prediction...")
 
-            # Split data
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=test_size, random_state=random_state
-            )
-
-            # Scale features
-            scaler = StandardScaler()
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_test_scaled = scaler.transform(X_test)
+            y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
             self.scalers[target_name] = scaler
-
-            # Try different models and select the best one
-            models = {
-                "Random Forest": RandomForestRegressor(
-                    n_estimators=100, random_state=random_state
-                ),
-                "Gradient Boosting": GradientBoostingRegressor(
-                    n_estimators=100, random_state=random_state
-                ),
-                "Ridge Regression": Ridge(alpha=1.0),
-                "Linear Regression": LinearRegression(),
-            }
-
-            best_model = None
-            best_score = -np.inf
-
-            for name, model in models.items():
-                # Cross-validation score
-                cv_scores = cross_val_score(
-                    model, X_train_scaled, y_train, cv=5, scoring="r2"
-                )
-                mean_cv_score = cv_scores.mean()
-
-                print(
-                    f"  {name}: CV R² = {mean_cv_score:.4f} (+/- {cv_scores.std() * 2:.4f})"
+            self.holdout["y_test"][target_name] = np.asarray(y_test, dtype="float64")
+
+            # Try different models and select the best one, scaling inside
+            # each shared CV fold so validation rows never inform the scaler.
+            # The out-of-fold predictions are kept per candidate for stacking
+            with self._stage(f"{target_name}: cv"):
+                best_model = selector.select(
+                    target_name, X_train, y_train, cv_predict=folds.cv_predict
                 )
 
-                if mean_cv_score > best_score:
-                    best_score = mean_cv_score
-                    best_model = model
-
-            # Train the best model
-            best_model.fit(X_train_scaled, y_train)
+            # Train the best model, or stack every candidate
+            with self._stage(f"{target_name}: fit"):
+                if stack:
+                    best_model, oof_r2 = fit_stack(
+                        selector.evaluated[target_name],
+                        selector.oof_predictions[target_name],
+                        X_train_scaled,
+                        y_train,
+                        n_jobs=n_jobs,
+                    )
+                    self.stacking_report[target_name] = {
+                        **best_model.report(),
+                        "oof_r2": oof_r2,
+                    }
+                    print(f"  Stack OOF R² = {oof_r2:.4f}")
+                else:
+                    best_model.fit(X_train_scaled, y_train)
 
             # Evaluate on test set
             y_pred = best_model.predict(X_test_scaled)
+            test_predictions[target_name] = y_pred
             test_r2 = r2_score(y_test, y_pred)
             test_rmse = np.sqrt(mean_squared_error(y_test, y_pred))
             test_mae = mean_absolute_error(y_test, y_pred)
 
-            print(f"  Best model: {type(best_model).__name__}")
+            if isinstance(best_model, StackedRegressor):
+                weights = ", ".join(
+                    f"{name} {weight:.2f}"
+                    for name, weight in zip(best_model.names, best_model.weights)
+                )
+                print(f"  Best model: stack of {weights}")
+            else:
+                print(f"  Best model: {type(best_model).__name__}")
             print(f"  Test R² = {test_r2:.4f}")
             print(f"  Test RMSE = {test_rmse:.4f}")
             print(f"  Test MAE = {test_mae:.4f}")
@@ -339,8 +526,97 @@ class SeedModel:
             self.models[target_name] = best_model
 
         self.is_trained = True
+        # Identifies this training run, e.g. to key cached reports on
+        self.model_version = uuid.uuid4().hex
         print("\nAll models trained successfully!")
 
+        # Bootstrap the shared held-out rows once for every target
+        if n_bootstrap:
+            self.metric_intervals = bootstrap_metrics(
+                self.holdout["y_test"], test_predictions, n_resamples=n_bootstrap
+            )
+            print(f"\nHeld-out metrics (95% CI over {n_bootstrap} bootstrap resamples):")
+            for target, rows in self.metric_intervals.groupby("target", sort=False):
+                print(
+                    f"  {target}: "
+                    + ", ".join(
+                        f"{METRIC_LABELS[row.metric]} = {row.estimate:.4f} "
+                        f"[{row.lower:.4f}, {row.upper:.4f}]"
+                        for row in rows.itertuples()
+                    )
+                )
+        if time_budget is not None:
+            skipped = sum(entry["status"] == "skipped" for entry in self.selection_log)
+            print(
+                f"Model selection took {selector.elapsed():.1f}s of a {time_budget:.0f}s "
+                f"budget ({skipped} candidates skipped)"
+            )
+
+        if distill:
+            with self._stage("distill"):
+                self.distill()
+
+    def distill(self, targets=None, n_samples=10_000, student_params=None, random_state=0):
+        """
+        Train compact students for the given targets (default: every target
+        whose model is a random forest) on synthetic samples labelled by the
+        full model. Students are used by predict(..., fast=True).
+        """
+        if not self.is_trained or self.training_features is None:
+            raise ValueError("Models must be trained before distillation")
+        if targets is None:
+            targets = [
+                target
+                for target, model in self.models.items()
+                if is_distillable(model)
+            ]
+
+        for target in targets:
+            print(f"\nDistilling {target} model...")
+            student, report = distill_estimator(
+                self.models[target],
+                self.scalers[target],
+                self,
+                n_samples=n_samples,
+                student_params=student_params,
+                random_state=random_state,
+            )
+
+            # Accuracy of both models on the real held-out split
+            if self.holdout:
+                X_test = self.holdout["X_test_scaled"]
+                y_test = self.holdout["y_test"][target]
+                report["teacher_test_r2"] = r2_score(y_test, self.models[target].predict(X_test))
+                report["student_test_r2"] = r2_score(y_test, student.predict(X_test))
+
+            self.students[target] = student
+            self.distillation_report[target] = report
+            print(f"  Student: {report['student']}")
+            print(f"  Fidelity R² (vs {report['teacher']}) = {report['fidelity_r2']:.4f}")
+            if "student_test_r2" in report:
+                print(
+                    f"  Test R² = {report['student_test_r2']:.4f} "
+                    f"(teacher {report['teacher_test_r2']:.4f})"
+                )
+            print(
+                f"  Latency = {report['student_ms_per_1k']:.2f} ms per 1k rows "
+                f"(teacher {report['teacher_ms_per_1k']:.2f})"
+            )
+
+        return self.distillation_report
+
+    def build_targets(self, df):
+        """
+        The yield, price and production series the models are trained on
+        """
+        return {
+            "yield": df["yield_per_hectare"],
+            "price": self._calculate_price_per_ton(
+                df
+            ),  # Calculate price from available data
+            "production": df["production_tons"],
+        }
+
     def _calculate_price_per_ton(self, df):
         """
         Calculate price per ton based on production and market factors
@@ -378,13 +654,11 @@ class SeedModel:
 
         return pd.Series(prices)
 
-    def predict(self, input_data):
+    def build_feature_matrix(self, input_data):
         """
-        Make predictions for new data
+        Turn raw inputs (a dict or a DataFrame of scenario rows) into the
+        unscaled model feature matrix
         """
-        if not self.is_trained:
-            raise ValueError("Models must be trained before making predictions")
-
         # Prepare input data
         if isinstance(input_data, dict):
             input_df = pd.DataFrame([input_data])
@@ -392,13 +666,7 @@ class SeedModel:
             input_df = input_data.copy()
 
         # Add derived features
-        input_df["rainfall_squared"] = input_df["rainfall_mm"] ** 2
-        input_df["temperature_humidity_interaction"] = (
-            input_df["temperature_c"] * input_df["humidity_percent"]
-        )
-        input_df["fertilizer_irrigation_interaction"] = (
-            input_df["fertilizer_use_kg_ha"] * input_df["irrigation_area_percent"]
-        )
+        self.add_derived_features(input_df)
 
         # Encode crop if needed
         if "crop" in input_df.columns:
@@ -407,23 +675,104 @@ class SeedModel:
             )
 
         # Select features
-        X = input_df[self.feature_names]
+        return input_df[self.feature_names]
+
+    @_profiled("predict")
+    def predict(self, input_data, fast=False):
+        """
+        Make predictions for new data. fast=True uses the distilled student
+        of a target where one exists, trading a little accuracy for latency.
+        """
+        if not self.is_trained:
+            raise ValueError("Models must be trained before making predictions")
 
-        # Make predictions
+        X = self.build_feature_matrix(input_data)
+        if self.drift_monitor is not None:
+            self.drift_monitor.update(X)
+        return self.predict_features(X, fast=fast)
+
+    def predict_features(self, X, fast=False):
+        """
+        Predict every target from an unscaled model feature matrix: scale it
+        and apply the full model, or with fast=True the target's distilled
+        student where one exists. Shared by predict() and the batch scorers.
+        """
         predictions = {}
         for target_name, model in self.models.items():
+            if fast and target_name in self.students:
+                model = self.students[target_name]
             X_scaled = self.scalers[target_name].transform(X)
             predictions[target_name] = model.predict(X_scaled)
 
         return predictions
 
-    def get_feature_importance(self, target="yield"):
+    def packed_model(self, target):
+        """
+        The flattened tree ensemble for a target, or None for linear models
+        """
+        model = self.models[target]
+        if isinstance(model, PackedTreeEnsemble):
+            return model
+        if not is_packable(model):
+            return None
+        if target not in self.packed_models:
+            self.packed_models[target] = PackedTreeEnsemble.from_estimator(model)
+        return self.packed_models[target]
+
+    def explain(self, input_data, targets=None):
+        """
+        Per-prediction feature attribution for a batch of inputs.
+
+        Returns {target: DataFrame} with one column per model feature, plus
+        "bias" and "prediction", where bias + the feature columns equals the
+        prediction. Tree models use the path decomposition over their
+        flattened trees; linear models use coefficient x scaled feature;
+        stacks combine their base models' attributions by weight.
+        """
+        if not self.is_trained:
+            raise ValueError("Models must be trained before explaining predictions")
+        if targets is None:
+            targets = list(self.models)
+
+        X = self.build_feature_matrix(input_data)
+        index = X.index if isinstance(input_data, pd.DataFrame) else None
+
+        explanations = {}
+        for target in targets:
+            model = self.models[target]
+            X_scaled = self.scalers[target].transform(X)
+            packed = self.packed_model(target)
+            if packed is not None:
+                bias, contributions = packed.contributions(X_scaled)
+            elif isinstance(model, StackedRegressor):
+                bias, contributions = model.contributions(X_scaled)
+            else:
+                bias, contributions = linear_contributions(model, X_scaled)
+
+            explanation = pd.DataFrame(contributions, columns=self.feature_names, index=index)
+            explanation.insert(0, "bias", bias)
+            explanation["prediction"] = bias + contributions.sum(axis=1)
+            explanations[target] = explanation
+
+        return explanations
+
+    def get_feature_importance(self, target="yield", method="native"):
         """
         Get feature importance for a specific target
+
+        method="native" uses impurity importances for tree models and absolute
+        coefficients for linear models. method="permutation" uses the drop in
+        held-out R² when a feature is shuffled, which is comparable across
+        estimator types; it is computed once for all targets and cached.
         """
         if not self.is_trained:
             raise ValueError("Models must be trained before getting feature importance")
 
+        if method == "permutation":
+            if target not in self.permutation_importances:
+                self.compute_permutation_importance()
+            return self.permutation_importances[target].copy()
+
         model = self.models[target]
         if hasattr(model, "feature_importances_"):
             importance = model.feature_importances_
@@ -437,28 +786,106 @@ class SeedModel:
 
         return feature_importance_df
 
+    def compute_permutation_importance(self, n_repeats=10, n_jobs=-1, random_state=0):
+        """
+        Permutation importance on the held-out split for all targets at once.
+        Repeats run in parallel; every repeat shuffles the single shared
+        scaled test matrix and scores all three target models on it.
+        """
+        if not self.is_trained:
+            raise ValueError("Models must be trained before getting feature importance")
+        if not self.holdout:
+            raise ValueError("No held-out split available; retrain the model")
+
+        X_test = self.holdout["X_test_scaled"]
+        y_tests = self.holdout["y_test"]
+        targets = list(self.models)
+
+        baseline = np.array(
+            [r2_score(y_tests[t], self.models[t].predict(X_test)) for t in targets]
+        )
+        seeds = np.random.SeedSequence(random_state).spawn(n_repeats)
+        repeats = Parallel(n_jobs=n_jobs)(
+            delayed(_permuted_scores)(self.models, targets, X_test, y_tests, seed)
+            for seed in seeds
+        )
+        # (n_repeats, n_targets, n_features) drops in R²
+        drops = baseline[None, :, None] - np.stack(repeats)
+
+        self.permutation_importances = {
+            target: pd.DataFrame(
+                {
+                    "feature": self.feature_names,
+                    "importance": drops[:, t].mean(axis=0),
+                    "importance_std": drops[:, t].std(axis=0),
+                }
+            )
+            .sort_values("importance", ascending=False)
+            .reset_index(drop=True)
+            for t, target in enumerate(targets)
+        }
+        return self.permutation_importances
+
     def save_model(self, filepath):
         """
-        Save the trained model
+        Save the trained model. Tree ensembles are stored flattened into
+        NumPy node arrays and the file is left uncompressed, so it can be
+        memory-mapped by load_model(filepath, mmap_mode="r").
         """
+        models = {}
+        for target, model in self.models.items():
+            packed = self.packed_model(target)
+            if isinstance(model, StackedRegressor):
+                packed = model.packed()
+            models[target] = packed if packed is not None else model
+
         model_data = {
-            "models": self.models,
+            "format_version": PACKED_FORMAT_VERSION,
+            "models": models,
             "scalers": self.scalers,
             "label_encoders": self.label_encoders,
             "feature_names": self.feature_names,
+            "training_features": self.training_features,
+            "holdout": self.holdout,
+            "permutation_importances": self.permutation_importances,
+            "students": self.students,
+            "distillation_report": self.distillation_report,
+            "stacking_report": self.stacking_report,
+            "metric_intervals": self.metric_intervals,
+            "drift_reference": self.drift_reference,
+            "selection_log": self.selection_log,
+            "data_version": self.data_version,
+            "model_version": self.model_version,
             "is_trained": self.is_trained,
         }
-        joblib.dump(model_data, filepath)
+        joblib.dump(model_data, filepath, compress=0)
         print(f"Model saved to {filepath}")
 
-    def load_model(self, filepath):
+    def load_model(self, filepath, mmap_mode=None):
         """
-        Load a trained model
+        Load a trained model. With mmap_mode="r" the tree arrays are
+        memory-mapped read-only, so every process that loads the same file
+        shares one physical copy of them. Raises ValueError for artifacts
+        saved with a different format version.
         """
-        model_data = joblib.load(filepath)
+        model_data = joblib.load(filepath, mmap_mode=mmap_mode)
+        check_format_version(model_data, filepath)
         self.models = model_data["models"]
         self.scalers = model_data["scalers"]
         self.label_encoders = model_data["label_encoders"]
         self.feature_names = model_data["feature_names"]
+        self.training_features = model_data.get("training_features")
+        self.holdout = model_data.get("holdout", {})
+        self.permutation_importances = model_data.get("permutation_importances", {})
+        self.data_version = model_data.get("data_version")
+        self.model_version = model_data.get("model_version")
+        self.packed_models = {}
+        self.students = model_data.get("students", {})
+        self.distillation_report = model_data.get("distillation_report", {})
+        self.stacking_report = model_data.get("stacking_report", {})
+        self.metric_intervals = model_data.get("metric_intervals")
+        self.drift_reference = model_data.get("drift_reference")
+        self.drift_monitor = None
+        self.selection_log = model_data.get("selection_log", [])
         self.is_trained = model_data["is_trained"]
         print(f"Model loaded from {filepath}")
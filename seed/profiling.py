@@ -0,0 +1,192 @@
+"""
+Opt-in memory profiling of the training and prediction pipeline
+
+MemoryProfiler wraps named stages (data loading, feature preparation, each
+target's cross-validation and fit, prediction) in tracemalloc snapshots and
+RSS readings from /proc. Per stage it records the Python heap delta and
+peak, the process RSS before, after and at its peak, and the source lines
+that allocated the most memory during the stage. Stages may be nested; a
+parent's peak includes its children's. Allocations made in worker
+processes (joblib n_jobs > 1) only show up as the parent's RSS.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+MB = 1024 * 1024
+
+STATUS_PATH = Path("/proc/self/status")
+CLEAR_REFS_PATH = Path("/proc/self/clear_refs")
+
+# The profiler's own bookkeeping and import machinery are left out of the
+# allocation sites
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+REPORT_COLUMNS = [
+    "stage",
+    "seconds",
+    "traced_delta_mb",
+    "traced_peak_mb",
+    "rss_before_mb",
+    "rss_after_mb",
+    "rss_delta_mb",
+    "rss_peak_mb",
+]
+
+
+def read_rss():
+    """(current RSS, peak RSS) of this process in bytes; None where unavailable"""
+    try:
+        status = STATUS_PATH.read_text()
+    except OSError:
+        return None, None
+    values = {}
+    for line in status.splitlines():
+        key, _, value = line.partition(":")
+        if key in ("VmRSS", "VmHWM"):
+            values[key] = int(value.split()[0]) * 1024
+    return values.get("VmRSS"), values.get("VmHWM")
+
+
+def reset_rss_peak():
+    """Reset the kernel's peak-RSS counter (VmHWM); False if not permitted"""
+    try:
+        CLEAR_REFS_PATH.write_text("5")
+    except OSError:
+        return False
+    return True
+
+
+def _mb(n_bytes):
+    return None if n_bytes is None else n_bytes / MB
+
+
+class MemoryProfiler:
+    """
+    Records memory use per named stage. Use stage() as a context manager
+    around each step; report() and top_allocations() summarize the run.
+    """
+
+    def __init__(self, top_n=10, traceback_depth=1):
+        self.top_n = top_n
+        self.traceback_depth = traceback_depth
+        self.stages = []
+        self.allocations = []
+        self._open = []  # stack of running peaks: [traced peak, rss peak]
+        self._started_tracing = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_depth)
+            self._started_tracing = True
+        return self
+
+    def stop(self):
+        """Stop tracing if this profiler started it"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _fold_peaks_into_open_stages(self):
+        """Carry the peaks so far into every open stage before a reset"""
+        traced_peak = tracemalloc.get_traced_memory()[1]
+        rss_peak = read_rss()[1]
+        for running in self._open:
+            running[0] = max(running[0], traced_peak)
+            if rss_peak is not None:
+                running[1] = max(running[1] or 0, rss_peak)
+
+    @contextmanager
+    def stage(self, name):
+        """Profile the enclosed block as one stage"""
+        self.start()
+        self._fold_peaks_into_open_stages()
+        tracemalloc.reset_peak()
+        rss_resettable = reset_rss_peak()
+
+        before_snapshot = tracemalloc.take_snapshot()
+        traced_before = tracemalloc.get_traced_memory()[0]
+        rss_before = read_rss()[0]
+        running = [traced_before, None]
+        self._open.append(running)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            seconds = time.perf_counter() - start
+            self._fold_peaks_into_open_stages()
+            self._open.pop()
+            traced_after = tracemalloc.get_traced_memory()[0]
+            rss_after = read_rss()[0]
+            after_snapshot = tracemalloc.take_snapshot()
+
+            self.stages.append(
+                {
+                    "stage": name,
+                    "seconds": seconds,
+                    "traced_delta_mb": _mb(traced_after - traced_before),
+                    "traced_peak_mb": _mb(running[0]),
+                    "rss_before_mb": _mb(rss_before),
+                    "rss_after_mb": _mb(rss_after),
+                    "rss_delta_mb": _mb(
+                        None if rss_before is None else rss_after - rss_before
+                    ),
+                    # Without a resettable counter VmHWM is the lifetime peak
+                    "rss_peak_mb": _mb(running[1]) if rss_resettable else None,
+                }
+            )
+            stats = after_snapshot.filter_traces(SNAPSHOT_FILTERS).compare_to(
+                before_snapshot.filter_traces(SNAPSHOT_FILTERS), "lineno"
+            )
+            for stat in stats[: self.top_n]:
+                if stat.size_diff <= 0:
+                    break
+                frame = stat.traceback[0]
+                self.allocations.append(
+                    {
+                        "stage": name,
+                        "site": f"{frame.filename}:{frame.lineno}",
+                        "size_diff_mb": stat.size_diff / MB,
+                        "count_diff": stat.count_diff,
+                    }
+                )
+            # A stage nested in another also counts towards the outer peak
+            if self._open:
+                self._open[-1][0] = max(self._open[-1][0], running[0])
+                if running[1] is not None:
+                    self._open[-1][1] = max(self._open[-1][1] or 0, running[1])
+
+    def report(self):
+        """Per-stage timing, heap delta/peak and RSS, in completion order"""
+        return pd.DataFrame(self.stages, columns=REPORT_COLUMNS)
+
+    def top_allocations(self, stage=None):
+        """Largest net allocation sites per stage (or for one stage)"""
+        allocations = pd.DataFrame(
+            self.allocations, columns=["stage", "site", "size_diff_mb", "count_diff"]
+        )
+        if stage is not None:
+            allocations = allocations[allocations["stage"] == stage]
+        return allocations.reset_index(drop=True)
+
+    def format_report(self, top_n=3):
+        """The stage table plus the top allocation sites of each stage, as text"""
+        lines = [self.report().to_string(index=False, float_format="{:.1f}".format)]
+        allocations = self.top_allocations()
+        for stage, sites in allocations.groupby("stage", sort=False):
+            lines.append(f"\n{stage}:")
+            for site in sites.head(top_n).itertuples():
+                lines.append(
+                    f"  {site.size_diff_mb:8.2f} MB  {site.count_diff:7d} blocks  {site.site}"
+                )
+        return "\n".join(lines)
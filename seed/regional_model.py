@@ -0,0 +1,159 @@
+"""
+Per-region models trained in parallel, with aggregation to national totals
+
+RegionalSeedModel fits one SeedModel per region on that region's
+data/synthetic_regions/<Region>/ partitions, fanning the regions out across a process
+pool. Scenario rows carry a region column and are routed to their region's
+model with one stable sort, as in ShardedSeedModel. aggregate_to_national()
+rolls regional forecasts up with one vectorized group-by: production is
+summed, yield is total production over total implied area (production /
+yield per region) and price is weighted by production.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from seed.model import SeedModel
+from seed.regions import REGIONS
+
+
+def _train_region(data_dir, region, years, train_kwargs):
+    """Load one region's data and train a SeedModel on it (in a worker)"""
+    model = SeedModel()
+    model.data_dir = Path(data_dir)
+    df = model.load_real_data(years, regions=[region])
+    if df.empty:
+        raise ValueError(f"No data for region {region} under {data_dir}")
+    model.train_models(df.drop(columns="region"), **train_kwargs)
+    return region, model
+
+
+def aggregate_to_national(scenarios, predictions, by=("year", "crop")):
+    """
+    Roll regional forecasts up to national ones. scenarios holds one row per
+    (region, *by) with the group columns; predictions is {target: array}
+    aligned with it. Returns a DataFrame per group with the national
+    production, yield and price and the number of regions aggregated.
+    """
+    by = [col for col in by if col in scenarios.columns]
+    # Missing keys form their own group (sorted last, like sort_values)
+    # rather than ngroup's -1, which bincount cannot take
+    codes = scenarios.groupby(by, sort=True, dropna=False).ngroup().to_numpy()
+    keys = scenarios[by].drop_duplicates().sort_values(by, ignore_index=True)
+    n_groups = len(keys)
+
+    production = np.asarray(predictions["production"], dtype=np.float64)
+    yields = np.asarray(predictions["yield"], dtype=np.float64)
+    area = np.divide(production, yields, out=np.zeros_like(production), where=yields > 0)
+
+    total_production = np.bincount(codes, weights=production, minlength=n_groups)
+    total_area = np.bincount(codes, weights=area, minlength=n_groups)
+    national = keys.assign(
+        production=total_production,
+        yield_=np.divide(
+            total_production, total_area, out=np.zeros(n_groups), where=total_area > 0
+        ),
+        regions=np.bincount(codes, minlength=n_groups),
+    ).rename(columns={"yield_": "yield"})
+
+    if "price" in predictions:
+        price = np.asarray(predictions["price"], dtype=np.float64)
+        revenue = np.bincount(codes, weights=price * production, minlength=n_groups)
+        # Groups with no production fall back to the plain mean price
+        mean_price = np.bincount(codes, weights=price, minlength=n_groups) / national["regions"]
+        national["price"] = np.where(
+            total_production > 0,
+            revenue / np.where(total_production > 0, total_production, 1.0),
+            mean_price,
+        )
+    return national
+
+
+class RegionalSeedModel:
+    """
+    One SeedModel per region, trained on a process pool and served through
+    a single group-by on the region column.
+    """
+
+    def __init__(self, regions=None, data_dir="data", max_workers=None):
+        self.regions = list(regions or REGIONS)
+        self.data_dir = Path(data_dir)
+        self.max_workers = max_workers
+        self.models = {}  # region -> SeedModel
+        self.is_trained = False
+
+    def train_models(self, years=None, **train_kwargs):
+        """
+        Train every region's model in parallel; train_kwargs are passed on to
+        SeedModel.train_models
+        """
+        max_workers = self.max_workers or min(len(self.regions), os.cpu_count() or 1)
+        start = time.perf_counter()
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            # Same reasoning as BatchScorer: spawned workers start clean
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = [
+                executor.submit(_train_region, str(self.data_dir), region, years, train_kwargs)
+                for region in self.regions
+            ]
+            self.models = dict(future.result() for future in futures)
+        self.is_trained = True
+        print(
+            f"Trained {len(self.models)} regional models in "
+            f"{time.perf_counter() - start:.1f}s"
+        )
+
+    def predict(self, input_data):
+        """
+        Predict every target, routing each row to its region's model.
+        input_data needs a region column. Returns {target: array} in input order.
+        """
+        if not self.is_trained:
+            raise ValueError("Models must be trained before making predictions")
+
+        input_df = pd.DataFrame([input_data]) if isinstance(input_data, dict) else input_data
+        regions = input_df["region"].to_numpy()
+        unknown = set(regions) - set(self.models)
+        if unknown:
+            raise ValueError(f"No model for regions: {sorted(unknown)}")
+
+        order = np.argsort(regions, kind="stable")
+        groups, starts = np.unique(regions[order], return_index=True)
+        stops = np.append(starts[1:], len(order))
+
+        predictions = {}
+        for region, start, stop in zip(groups, starts, stops):
+            rows = order[start:stop]
+            for target, values in self.models[region].predict(input_df.iloc[rows]).items():
+                predictions.setdefault(target, np.empty(len(order)))[rows] = values
+        return predictions
+
+    def predict_national(self, input_data, by=("year", "crop")):
+        """Regional predictions for input_data aggregated to national totals"""
+        return aggregate_to_national(input_data, self.predict(input_data), by=by)
+
+    def save_model(self, model_dir):
+        """Save each region's model as <model_dir>/<Region>.pkl"""
+        model_dir = Path(model_dir)
+        model_dir.mkdir(parents=True, exist_ok=True)
+        for region, model in self.models.items():
+            model.save_model(model_dir / f"{region}.pkl")
+
+    def load_model(self, model_dir, mmap_mode=None):
+        """Load the regional models saved in model_dir"""
+        self.models = {}
+        for region in self.regions:
+            filepath = Path(model_dir) / f"{region}.pkl"
+            if filepath.exists():
+                model = SeedModel()
+                model.load_model(filepath, mmap_mode=mmap_mode)
+                self.models[region] = model
+        self.is_trained = bool(self.models)
@@ -0,0 +1,192 @@
+"""
+Synthetic regional (LGA) layout of the agricultural datasets
+
+There is no measured regional breakdown of the GBoS data. The national
+data/YYYY/category_YYYY.csv partitions are split across the eight Local
+Government Areas with assumed shares and stored as
+
+    data/synthetic_regions/<Region>/YYYY/category_YYYY.csv
+
+i.e. partitioned by region and then by year, with the same per-year layout
+(and a manifest.json per region) as the national tree, plus a
+metadata.json at the root recording that the split is synthetic and how it
+was made. Additive metrics (areas, production, counts, values) are
+apportioned with per-item regional shares so the regions always sum back
+to the national figure exactly. Ratios and percentages, yield per hectare
+included, are carried over unchanged, so every regional model learns the
+national yield relationship; the regions differ only in scale.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from seed.dataset_writer import ParallelDatasetWriter, WriteStats, atomic_write_bytes
+from seed.manifest import PARTITION_PATTERN, DatasetManifest, discover_partitions
+from seed.summary import CATEGORY_ITEM_COLUMNS, NON_ADDITIVE_METRICS
+
+logger = logging.getLogger(__name__)
+
+REGIONS_DIRNAME = "synthetic_regions"
+METADATA_FILENAME = "metadata.json"
+
+# Assumed (not measured) share of national agricultural activity by Local
+# Government Area
+REGION_SHARES = {
+    "Banjul": 0.01,
+    "Kanifing": 0.04,
+    "Brikama": 0.20,
+    "Mansakonko": 0.11,
+    "Kerewan": 0.20,
+    "Kuntaur": 0.13,
+    "Janjanbureh": 0.14,
+    "Basse": 0.17,
+}
+REGIONS = tuple(REGION_SHARES)
+
+# Assumed concentration of some items in some regions: multipliers on
+# REGION_SHARES, renormalized per item
+ITEM_REGION_WEIGHTS = {
+    "Rice": {"Janjanbureh": 2.5, "Kuntaur": 2.0, "Mansakonko": 1.5, "Banjul": 0.1},
+    "Groundnuts": {"Kerewan": 1.6, "Kuntaur": 1.4, "Banjul": 0.1, "Kanifing": 0.2},
+    "Cotton": {"Basse": 2.5, "Janjanbureh": 1.5, "Banjul": 0.05, "Kanifing": 0.05},
+    "Vegetables": {"Kanifing": 4.0, "Brikama": 2.0},
+    "Fruits": {"Brikama": 2.0, "Kanifing": 2.0},
+}
+
+
+def region_dir(data_dir, region: str) -> Path:
+    """Root of one region's partitions, e.g. data/synthetic_regions/Brikama"""
+    return Path(data_dir) / REGIONS_DIRNAME / region
+
+
+def region_shares(items, regions=REGIONS) -> np.ndarray:
+    """(n_items, n_regions) shares of each item's national total; rows sum to 1"""
+    base = np.array([REGION_SHARES[region] for region in regions])
+    shares = np.tile(base, (len(items), 1))
+    for i, item in enumerate(items):
+        for j, region in enumerate(regions):
+            shares[i, j] *= ITEM_REGION_WEIGHTS.get(item, {}).get(region, 1.0)
+    return shares / shares.sum(axis=1, keepdims=True)
+
+
+def apportion(totals, shares) -> np.ndarray:
+    """
+    Split integer totals (n_items,) by shares (n_items, n_regions) with the
+    largest-remainder method, so every row sums exactly to its total.
+    """
+    totals = np.asarray(totals, dtype=np.int64)
+    quotas = totals[:, None] * shares
+    counts = np.floor(quotas).astype(np.int64)
+    remainder = totals - counts.sum(axis=1)
+    # Rank each row's regions by fractional part, largest first
+    rank = np.argsort(np.argsort(-(quotas - counts), axis=1, kind="stable"), axis=1)
+    return counts + (rank < remainder[:, None])
+
+
+def split_partition(df: pd.DataFrame, category: str, regions=REGIONS) -> Dict[str, pd.DataFrame]:
+    """One national category dataset as {region: regional dataset}"""
+    item_column = CATEGORY_ITEM_COLUMNS[category]
+    shares = region_shares(df[item_column].tolist(), regions)
+
+    splits = {}
+    for col in df.columns:
+        if col in (item_column, "year") or col in NON_ADDITIVE_METRICS:
+            continue
+        values = df[col].to_numpy()
+        if pd.api.types.is_integer_dtype(df[col]):
+            splits[col] = apportion(values, shares)
+        else:
+            splits[col] = values[:, None] * shares
+
+    regional = {}
+    for j, region in enumerate(regions):
+        part = df.copy()
+        for col, split in splits.items():
+            part[col] = split[:, j]
+        regional[region] = part
+    return regional
+
+
+def split_annual_datasets(
+    annual_datasets: Dict[int, Dict[str, pd.DataFrame]], regions=REGIONS
+) -> Dict[str, Dict[int, Dict[str, pd.DataFrame]]]:
+    """
+    Split {year: {category: df}} into {region: {year: {category: df}}}.
+    Categories without a known item column are left out.
+    """
+    regional = {region: {} for region in regions}
+    for year, categories in annual_datasets.items():
+        for category, df in categories.items():
+            if category not in CATEGORY_ITEM_COLUMNS:
+                continue
+            for region, part in split_partition(df, category, regions).items():
+                regional[region].setdefault(year, {})[category] = part
+    return regional
+
+
+def load_annual_datasets(data_dir="data", years=None) -> Dict[int, Dict[str, pd.DataFrame]]:
+    """Read the national data/YYYY/category_YYYY.csv partitions back"""
+    annual_datasets = {}
+    for filepath in discover_partitions(data_dir):
+        match = PARTITION_PATTERN.match(filepath.name)
+        year = int(match.group("year"))
+        if years is not None and year not in years:
+            continue
+        annual_datasets.setdefault(year, {})[match.group("category")] = pd.read_csv(filepath)
+    return annual_datasets
+
+
+def synthetic_metadata() -> dict:
+    """Description of how the regional datasets were derived"""
+    return {
+        "synthetic": True,
+        "source": "national data/YYYY partitions",
+        "method": (
+            "additive metrics split by assumed regional shares (largest-remainder "
+            "rounding for integers); non-additive metrics copied unchanged"
+        ),
+        "copied_unchanged": sorted(NON_ADDITIVE_METRICS),
+        "region_shares": REGION_SHARES,
+        "item_region_weights": ITEM_REGION_WEIGHTS,
+    }
+
+
+def write_regional_datasets(
+    regional_datasets: Dict[str, Dict[int, Dict[str, pd.DataFrame]]],
+    data_dir="data",
+    max_workers: int = None,
+) -> Dict[str, WriteStats]:
+    """
+    Write every region's partitions under data/synthetic_regions/<Region>/,
+    skipping the ones its manifest shows are already current, and the
+    metadata.json describing the synthetic split.
+    """
+    layout_root = Path(data_dir) / REGIONS_DIRNAME
+    layout_root.mkdir(parents=True, exist_ok=True)
+    metadata = json.dumps(synthetic_metadata(), indent=2) + "\n"
+    atomic_write_bytes(layout_root / METADATA_FILENAME, metadata.encode("utf-8"))
+
+    stats = {}
+    for region, annual_datasets in regional_datasets.items():
+        root = region_dir(data_dir, region)
+        root.mkdir(parents=True, exist_ok=True)
+        manifest = DatasetManifest.load(root)
+        manifest.refresh()
+        writer = ParallelDatasetWriter(root, max_workers=max_workers)
+        stats[region] = writer.write(annual_datasets, manifest=manifest)
+        manifest.save()
+    logger.info(f"Wrote regional datasets for {len(stats)} regions under {data_dir}")
+    return stats
+
+
+def regionalize(data_dir="data", years=None, max_workers: int = None) -> Dict[str, WriteStats]:
+    """Split the national datasets already in data_dir into the regional layout"""
+    annual_datasets = load_annual_datasets(data_dir, years)
+    return write_regional_datasets(
+        split_annual_datasets(annual_datasets), data_dir, max_workers=max_workers
+    )
@@ -0,0 +1,166 @@
+"""
+Materialized report sections for seed/main.py
+
+Every section of the console report (predictions per year, rainfall
+analysis, future trends, sensitivity, feature importance, ...) is computed
+as a table and stored under reports/ as CSV, Parquet or JSON. A section is
+keyed by the model version plus a hash of its inputs (the scenario rows it
+predicts, the years it covers, ...): when the key matches the stored one the
+table is read back instead of recomputed. reports/index.json maps each
+section to its current key and file.
+"""
+
+import hashlib
+import io
+import json
+import logging
+from pathlib import Path
+
+import pandas as pd
+
+from seed.compat import HAS_PYARROW
+from seed.dataset_writer import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+REPORT_FORMATS = ("csv", "parquet", "json")
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """Content hash of a DataFrame's columns and values"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(col) for col in df.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def section_key(section: str, model_version, inputs=None) -> str:
+    """
+    Key of one section: its name, the model version and its inputs, where
+    DataFrames are hashed by content and everything else as sorted JSON
+    """
+    def encode(value):
+        if isinstance(value, pd.DataFrame):
+            return {"frame": frame_digest(value)}
+        if isinstance(value, dict):
+            return {str(k): encode(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple, range)):
+            return [encode(v) for v in value]
+        return value
+
+    payload = json.dumps(
+        {"section": section, "model_version": model_version, "inputs": encode(inputs)},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ReportCache:
+    """
+    Section tables under cache_dir, each recomputed only when its key changes
+    """
+
+    INDEX = "index.json"
+    VERSION = 1
+
+    def __init__(self, cache_dir="reports", fmt="csv", refresh=False):
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format {fmt!r}; use one of {REPORT_FORMATS}")
+        if fmt == "parquet" and not HAS_PYARROW:
+            raise ImportError("Parquet reports require pyarrow")
+        self.cache_dir = Path(cache_dir)
+        self.fmt = fmt
+        self.refresh = refresh
+        self.hits = []
+        self.misses = []
+        self.index = self._load_index()
+
+    @property
+    def index_path(self) -> Path:
+        return self.cache_dir / self.INDEX
+
+    def _load_index(self):
+        if self.index_path.exists():
+            with open(self.index_path) as f:
+                content = json.load(f)
+            if content.get("version") == self.VERSION:
+                return content["sections"]
+        return {}
+
+    def _save_index(self):
+        content = {"version": self.VERSION, "sections": dict(sorted(self.index.items()))}
+        atomic_write_bytes(
+            self.index_path, (json.dumps(content, indent=2) + "\n").encode("utf-8")
+        )
+
+    def _serialize(self, table: pd.DataFrame) -> bytes:
+        if self.fmt == "parquet":
+            buffer = io.BytesIO()
+            table.to_parquet(buffer, index=False)
+            return buffer.getvalue()
+        if self.fmt == "json":
+            return table.to_json(orient="table", index=False).encode("utf-8")
+        return table.to_csv(index=False).encode("utf-8")
+
+    def _read(self, filepath: Path) -> pd.DataFrame:
+        if self.fmt == "parquet":
+            return pd.read_parquet(filepath)
+        if self.fmt == "json":
+            return pd.read_json(filepath, orient="table")
+        return pd.read_csv(filepath)
+
+    def load(self, section: str, key: str):
+        """The stored table of section if it was stored under key, else None"""
+        entry = self.index.get(section)
+        if entry is None or entry["key"] != key or entry["format"] != self.fmt:
+            return None
+        filepath = self.cache_dir / entry["file"]
+        if not filepath.exists():
+            return None
+        return self._read(filepath)
+
+    def save(self, section: str, key: str, table: pd.DataFrame):
+        """Store table as the current version of section, replacing the old one"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        filename = f"{section}-{key[:12]}.{self.fmt}"
+        atomic_write_bytes(self.cache_dir / filename, self._serialize(table))
+
+        previous = self.index.get(section)
+        if previous is not None and previous["file"] != filename:
+            (self.cache_dir / previous["file"]).unlink(missing_ok=True)
+        self.index[section] = {
+            "key": key,
+            "file": filename,
+            "format": self.fmt,
+            "rows": len(table),
+        }
+        self._save_index()
+
+    def get_or_compute(self, section: str, model_version, inputs, compute):
+        """
+        The table of section for (model_version, inputs): read back when
+        stored under the same key, otherwise compute() and store it. With
+        refresh, or without a model version to key on, it is always
+        recomputed (and only stored in the first case).
+        """
+        key = section_key(section, model_version, inputs)
+        cacheable = model_version is not None
+        if cacheable and not self.refresh:
+            table = self.load(section, key)
+            if table is not None:
+                logger.info(f"Report section {section}: cached")
+                self.hits.append(section)
+                return table
+
+        logger.info(f"Report section {section}: computing")
+        self.misses.append(section)
+        table = compute()
+        if cacheable:
+            self.save(section, key, table)
+            # Render from exactly what a later run will read back
+            table = self.load(section, key)
+        return table
+
+    def summary(self) -> str:
+        return f"{len(self.hits)} report sections reused, {len(self.misses)} recomputed"
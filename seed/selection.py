@@ -0,0 +1,236 @@
+"""
+Cross-validated model selection for SeedModel.train_models, optionally
+under a wall-clock budget
+
+Candidates are evaluated cheapest first. With a budget, each expensive
+candidate is first fitted on two small subsamples; the fit times give a
+learning curve t(n) = t0 + k * n (fixed overhead plus per-row cost) that is
+extrapolated to the cost of the full cross-validation plus the final
+refit. A candidate whose predicted cost would overrun the time left for
+the current target is skipped, and every decision is recorded in the
+selection log.
+
+Cross-validation shares one set of fold indices across every candidate and
+target. The scaler is fitted inside each fold (on that fold's training rows
+only) and the scaled fold matrices are cached, so each is computed once per
+training run, or once per dataset with an on-disk joblib Memory cache.
+"""
+
+import time
+
+import numpy as np
+from joblib import Memory
+from sklearn.base import clone
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.metrics import r2_score
+from sklearn.model_selection import KFold, cross_val_score
+from sklearn.preprocessing import StandardScaler
+
+# Candidates that are always evaluated: their cost is negligible
+CHEAP_CANDIDATES = ("Ridge Regression", "Linear Regression")
+
+
+def candidate_models(random_state=42):
+    """The estimators train_models chooses between, cheapest first"""
+    return {
+        "Ridge Regression": Ridge(alpha=1.0),
+        "Linear Regression": LinearRegression(),
+        "Gradient Boosting": GradientBoostingRegressor(
+            n_estimators=100, random_state=random_state
+        ),
+        "Random Forest": RandomForestRegressor(n_estimators=100, random_state=random_state),
+    }
+
+
+def _fit_seconds(estimator, X, y):
+    start = time.perf_counter()
+    clone(estimator).fit(X, y)
+    return time.perf_counter() - start
+
+
+def extrapolate_fit_seconds(sizes, seconds, n):
+    """
+    Fit time at n rows from fit times measured at two smaller sizes, along
+    the line through both points (never decreasing with n)
+    """
+    (n1, n2), (t1, t2) = sizes, seconds
+    per_row = max(t2 - t1, 0.0) / (n2 - n1) if n2 > n1 else t2 / max(n2, 1)
+    return t2 + per_row * max(n - n2, 0)
+
+
+def scale_fold(X, train_rows, valid_rows):
+    """Fit a StandardScaler on one fold's training rows and scale both parts"""
+    scaler = StandardScaler().fit(X[train_rows])
+    return scaler.transform(X[train_rows]), scaler.transform(X[valid_rows])
+
+
+class FoldCache:
+    """
+    Cross-validation folds of one (unscaled) training matrix, computed once
+    and shared by every estimator and target, with each fold's scaled
+    matrices computed on first use and reused afterwards. With cache_dir the
+    scaled folds are also kept in a joblib Memory cache on disk.
+    """
+
+    def __init__(self, X, n_splits=5, cache_dir=None):
+        self.X = np.asarray(X, dtype=np.float64)
+        self.folds = list(KFold(n_splits=n_splits).split(self.X))
+        self._scaled = {}
+        if cache_dir is not None:
+            self._scale_fold = Memory(cache_dir, verbose=0).cache(scale_fold)
+        else:
+            self._scale_fold = scale_fold
+
+    def scaled_fold(self, fold):
+        """(X_train_scaled, X_valid_scaled) for one fold"""
+        if fold not in self._scaled:
+            train_rows, valid_rows = self.folds[fold]
+            self._scaled[fold] = self._scale_fold(self.X, train_rows, valid_rows)
+        return self._scaled[fold]
+
+    def cv_score(self, estimator, y):
+        """R² of a clone of estimator on every fold"""
+        return self.cv_predict(estimator, y)[0]
+
+    def cv_predict(self, estimator, y):
+        """
+        (per-fold R², out-of-fold predictions) of a clone of estimator. The
+        out-of-fold predictions are the validation predictions the scores are
+        computed from, so keeping them costs nothing extra.
+        """
+        y = np.asarray(y)
+        scores = []
+        oof = np.empty(len(y))
+        for fold, (train_rows, valid_rows) in enumerate(self.folds):
+            X_fold_train, X_fold_valid = self.scaled_fold(fold)
+            fitted = clone(estimator).fit(X_fold_train, y[train_rows])
+            oof[valid_rows] = fitted.predict(X_fold_valid)
+            scores.append(r2_score(y[valid_rows], oof[valid_rows]))
+        return np.array(scores), oof
+
+
+class ModelSelector:
+    """
+    Picks the best candidate per target by cross-validated R². With
+    time_budget (seconds, for all targets together) expensive candidates are
+    profiled first and skipped when they would not fit in the time left.
+    """
+
+    def __init__(
+        self,
+        time_budget=None,
+        cv=5,
+        subsample_fractions=(0.15, 0.3),
+        safety_factor=1.25,
+        random_state=42,
+    ):
+        self.time_budget = time_budget
+        self.cv = cv
+        self.subsample_fractions = subsample_fractions
+        self.safety_factor = safety_factor
+        self.random_state = random_state
+        self.log = []
+        self.evaluated = {}  # target -> {name: unfitted estimator}
+        self.oof_predictions = {}  # target -> {name: out-of-fold predictions}
+        self._start = None
+        self._targets_left = 0
+
+    def start(self, n_targets):
+        """Begin timing a training run over n_targets targets"""
+        self._start = time.perf_counter()
+        self._targets_left = n_targets
+        self.log = []
+        self.evaluated = {}
+
+    def elapsed(self):
+        return time.perf_counter() - self._start
+
+    def _target_allowance(self):
+        """Equal share of the remaining budget for the current target"""
+        remaining = self.time_budget - self.elapsed()
+        return max(remaining, 0.0) / max(self._targets_left, 1)
+
+    def _predict_cost(self, estimator, X, y):
+        """(predicted seconds for CV + final refit, seconds spent profiling)"""
+        rng = np.random.default_rng(self.random_state)
+        n = len(X)
+        sizes = [max(int(n * fraction), 10) for fraction in self.subsample_fractions]
+        sizes = [min(size, n) for size in sizes]
+
+        start = time.perf_counter()
+        seconds = []
+        for size in sizes:
+            rows = rng.choice(n, size=size, replace=False)
+            seconds.append(_fit_seconds(estimator, X[rows], np.asarray(y)[rows]))
+        profiling = time.perf_counter() - start
+
+        fold_rows = n * (self.cv - 1) / self.cv
+        cost = self.cv * extrapolate_fit_seconds(sizes, seconds, fold_rows)
+        cost += extrapolate_fit_seconds(sizes, seconds, n)
+        return cost, profiling
+
+    def _record(self, target, name, status, **details):
+        self.log.append({"target": target, "model": name, "status": status, **details})
+
+    def select(self, target, X, y, cv_predict=None):
+        """
+        Evaluate the candidates for one target and return the best (unfitted)
+        estimator. cv_predict(estimator, y) -> (fold scores, out-of-fold
+        predictions), e.g. FoldCache.cv_predict, defaults to 5-fold
+        cross_val_score on X without predictions. Predictions are kept in
+        oof_predictions by candidate name.
+        """
+        if cv_predict is None:
+            def cv_predict(estimator, y):
+                return cross_val_score(estimator, X, y, cv=self.cv, scoring="r2"), None
+
+        target_start = time.perf_counter()
+        allowance = None if self.time_budget is None else self._target_allowance()
+
+        best_model, best_score = None, -np.inf
+        for name, model in candidate_models(self.random_state).items():
+            predicted = None
+            if allowance is not None and name not in CHEAP_CANDIDATES:
+                predicted, profiling = self._predict_cost(model, X, y)
+                spent = time.perf_counter() - target_start
+                if spent + predicted * self.safety_factor > allowance:
+                    reason = (
+                        f"predicted {predicted:.1f}s would exceed the "
+                        f"{max(allowance - spent, 0.0):.1f}s left for {target}"
+                    )
+                    print(f"  {name}: skipped ({reason})")
+                    self._record(
+                        target,
+                        name,
+                        "skipped",
+                        predicted_seconds=predicted,
+                        profiling_seconds=profiling,
+                        reason=reason,
+                    )
+                    continue
+
+            start = time.perf_counter()
+            cv_scores, oof = cv_predict(model, y)
+            self.evaluated.setdefault(target, {})[name] = model
+            if oof is not None:
+                self.oof_predictions.setdefault(target, {})[name] = oof
+            seconds = time.perf_counter() - start
+            mean_cv_score = cv_scores.mean()
+
+            print(f"  {name}: CV R² = {mean_cv_score:.4f} (+/- {cv_scores.std() * 2:.4f})")
+            self._record(
+                target,
+                name,
+                "evaluated",
+                cv_r2=mean_cv_score,
+                seconds=seconds,
+                predicted_seconds=predicted,
+            )
+
+            if mean_cv_score > best_score:
+                best_score = mean_cv_score
+                best_model = model
+
+        self._targets_left -= 1
+        return best_model
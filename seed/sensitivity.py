@@ -0,0 +1,229 @@
+"""
+Partial-dependence (sensitivity) analysis for a trained SeedModel
+
+For every requested feature, crop and target the curve is the model's mean
+prediction over the training background with that feature swept across a
+grid and the crop held fixed. Tree ensembles use sklearn's tree-recursion
+method; everything else is evaluated with one batched predict per target.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.inspection import partial_dependence
+from sklearn.tree import DecisionTreeRegressor
+
+from seed.model import SeedModel
+from seed.packed_trees import PackedTreeEnsemble, source_class
+
+# Engineered features and the raw inputs they are computed from
+DERIVED_FEATURE_INPUTS = {
+    "rainfall_squared": ("rainfall_mm",),
+    "temperature_humidity_interaction": ("temperature_c", "humidity_percent"),
+    "fertilizer_irrigation_interaction": (
+        "fertilizer_use_kg_ha",
+        "irrigation_area_percent",
+    ),
+}
+
+# Sweeping these must also move their derived columns, which the recursion
+# over a fitted tree cannot do, so they are always evaluated by brute force
+COUPLED_FEATURES = {
+    raw for inputs in DERIVED_FEATURE_INPUTS.values() for raw in inputs
+}
+
+RECURSION_ESTIMATORS = (
+    RandomForestRegressor,
+    GradientBoostingRegressor,
+    DecisionTreeRegressor,
+)
+
+
+def feature_grid(values, grid_resolution=20, percentiles=(0.05, 0.95)):
+    """Evenly spaced grid between the given percentiles of a feature"""
+    values = np.asarray(values, dtype="float64")
+    unique = np.unique(values)
+    if len(unique) <= grid_resolution:
+        return unique
+    low, high = np.quantile(values, percentiles)
+    return np.linspace(low, high, grid_resolution)
+
+
+def _use_recursion(estimator, feature, method):
+    if method == "brute" or not issubclass(source_class(estimator), RECURSION_ESTIMATORS):
+        return False
+    if method == "recursion":
+        return True
+    return feature not in COUPLED_FEATURES
+
+
+def _recursion_curves(estimator, scaler, background, feature_index, crop_index, grid, codes):
+    """(n_crops, n_grid) partial dependence from the fitted trees"""
+    mean, scale = scaler.mean_, scaler.scale_
+    scaled_grid = (grid - mean[feature_index]) / scale[feature_index]
+    scaled_codes = (codes - mean[crop_index]) / scale[crop_index]
+    if isinstance(estimator, PackedTreeEnsemble):
+        # Loaded models keep only the flattened trees; the background is
+        # implicit in their per-node training weights, as for sklearn's
+        points = np.column_stack(
+            [
+                np.tile(scaled_grid, len(codes)),
+                np.repeat(scaled_codes, len(grid)),
+            ]
+        )
+        curves = estimator.partial_dependence(points, [feature_index, crop_index])
+        return curves.reshape(len(codes), len(grid))
+
+    X_background = scaler.transform(background)
+    result = partial_dependence(
+        estimator,
+        X_background,
+        features=[feature_index, crop_index],
+        custom_values={feature_index: scaled_grid, crop_index: scaled_codes},
+        method="recursion",
+        kind="average",
+    )
+    curves = result["average"][0].T
+
+    # sklearn's recursion leaves out the (constant) initial prediction of
+    # gradient boosting; add it back so curves are on the target's scale
+    if isinstance(estimator, GradientBoostingRegressor) and estimator.init_ != "zero":
+        curves = curves + estimator.init_.predict(X_background[:1])[0]
+    return curves
+
+
+def _brute_curves(model, estimator, scaler, background, sweeps, codes):
+    """
+    {feature: (n_crops, n_grid)} partial dependence for every (feature, grid)
+    in sweeps, evaluated with a single predict call.
+    """
+    feature_names = model.feature_names
+    crop_index = feature_names.index("crop_encoded")
+    base = background.to_numpy(dtype="float64")
+    n_rows = len(base)
+
+    blocks = []
+    for feature, grid in sweeps:
+        # (n_crops, n_grid, n_rows, n_features) copies of the background
+        block = np.broadcast_to(
+            base, (len(codes), len(grid), n_rows, base.shape[1])
+        ).copy()
+        block[..., crop_index] = codes[:, None, None]
+        block[..., feature_names.index(feature)] = grid[None, :, None]
+        block = pd.DataFrame(block.reshape(-1, base.shape[1]), columns=feature_names)
+        if feature in COUPLED_FEATURES:
+            SeedModel.add_derived_features(block)
+        blocks.append(block[feature_names])
+
+    predictions = estimator.predict(scaler.transform(pd.concat(blocks, ignore_index=True)))
+
+    curves = {}
+    offset = 0
+    for feature, grid in sweeps:
+        size = len(codes) * len(grid) * n_rows
+        chunk = predictions[offset : offset + size]
+        curves[feature] = chunk.reshape(len(codes), len(grid), n_rows).mean(axis=2)
+        offset += size
+    return curves
+
+
+def partial_dependence_table(
+    model,
+    features=None,
+    crops=None,
+    targets=None,
+    grid_resolution=20,
+    method="auto",
+    max_background=500,
+    random_state=0,
+):
+    """
+    Partial-dependence curves as a tidy DataFrame with columns
+    target, crop, feature, value, partial_dependence, method.
+
+    method: "auto" (recursion for tree ensembles where valid, else brute),
+    "recursion" or "brute".
+    """
+    if not model.is_trained or model.training_features is None:
+        raise ValueError("Models must be trained before computing partial dependence")
+
+    if features is None:
+        features = [f for f in model.feature_names if f != "crop_encoded"]
+    encoder = model.label_encoders["crop"]
+    if crops is None:
+        crops = list(encoder.classes_)
+    if targets is None:
+        targets = list(model.models)
+
+    background = model.training_features[model.feature_names]
+    if len(background) > max_background:
+        background = background.sample(max_background, random_state=random_state)
+
+    codes = encoder.transform(crops).astype("float64")
+    crop_index = model.feature_names.index("crop_encoded")
+    grids = {
+        feature: feature_grid(model.training_features[feature], grid_resolution)
+        for feature in features
+    }
+
+    frames = []
+    for target in targets:
+        estimator = model.models[target]
+        scaler = model.scalers[target]
+
+        curves, methods, brute_sweeps = {}, {}, []
+        for feature in features:
+            if _use_recursion(estimator, feature, method):
+                curves[feature] = _recursion_curves(
+                    estimator,
+                    scaler,
+                    background,
+                    model.feature_names.index(feature),
+                    crop_index,
+                    grids[feature],
+                    codes,
+                )
+                methods[feature] = "recursion"
+            else:
+                brute_sweeps.append((feature, grids[feature]))
+                methods[feature] = "brute"
+
+        if brute_sweeps:
+            curves.update(
+                _brute_curves(model, estimator, scaler, background, brute_sweeps, codes)
+            )
+
+        for feature in features:
+            grid = grids[feature]
+            values = curves[feature]  # (n_crops, n_grid)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "target": target,
+                        "crop": np.repeat(np.asarray(crops, dtype=object), len(grid)),
+                        "feature": feature,
+                        "value": np.tile(grid, len(crops)),
+                        "partial_dependence": values.ravel(),
+                        "method": methods[feature],
+                    }
+                )
+            )
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def sensitivity_ranking(pd_table):
+    """
+    Range of each partial-dependence curve, averaged over crops: a quick
+    ranking of how strongly each feature moves each target.
+    """
+    spread = pd_table.groupby(["target", "crop", "feature"])["partial_dependence"].agg(
+        lambda values: values.max() - values.min()
+    )
+    return (
+        spread.groupby(["target", "feature"])
+        .mean()
+        .rename("pd_range")
+        .reset_index()
+        .sort_values(["target", "pd_range"], ascending=[True, False], ignore_index=True)
+    )
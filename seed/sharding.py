@@ -0,0 +1,201 @@
+"""
+Per-crop sharded models
+
+Instead of one global model per target with crop_encoded as an ordinal
+feature, ShardedSeedModel fits a small model per (crop, target), training
+the crops in parallel. Batched predictions are routed with one stable sort
+by crop: every shard predicts its contiguous slice of the sorted rows and
+the results are scattered back to the input order.
+"""
+
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.metrics import r2_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from seed.model import SeedModel
+from seed.packed_trees import (
+    PACKED_FORMAT_VERSION,
+    PackedTreeEnsemble,
+    check_format_version,
+    is_packable,
+)
+
+
+def default_shard_estimator(random_state=42):
+    """A shallow boosted ensemble: each shard only has to model one crop"""
+    return GradientBoostingRegressor(
+        n_estimators=60, max_depth=2, learning_rate=0.1, random_state=random_state
+    )
+
+
+def _fit_shard(crop, X, targets, estimator):
+    """Fit the scaler and one model per target for a single crop"""
+    scaler = StandardScaler().fit(X)
+    X_scaled = scaler.transform(X)
+    models = {
+        target: clone(estimator).fit(X_scaled, y) for target, y in targets.items()
+    }
+    return crop, scaler, models
+
+
+class ShardedSeedModel:
+    """
+    One small model per crop and target, trained in parallel and served
+    through a single group-by scatter/gather.
+    """
+
+    def __init__(self, estimator=None, n_jobs=-1, random_state=42):
+        self.estimator = estimator
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.shards = {}  # crop -> {"scaler": ..., "models": {target: model}}
+        self.feature_names = []  # shard features: the model features minus crop
+        self.targets = []
+        self.test_scores = {}
+        self.is_trained = False
+
+    def train_models(self, df, test_size=0.2):
+        """
+        Train every crop shard in parallel and report held-out R² per target
+        on the same kind of random split SeedModel.train_models uses.
+        """
+        prep = SeedModel()
+        df = df.reset_index(drop=True)
+        targets = prep.build_targets(df)
+        X = prep.prepare_features(df.copy()).drop(columns="crop_encoded")
+        self.feature_names = list(X.columns)
+        self.targets = list(targets)
+        crops = df["crop"].to_numpy()
+
+        train_idx, test_idx = train_test_split(
+            np.arange(len(df)), test_size=test_size, random_state=self.random_state
+        )
+        estimator = self.estimator or default_shard_estimator(self.random_state)
+
+        start = time.perf_counter()
+        shards = Parallel(n_jobs=self.n_jobs)(
+            delayed(_fit_shard)(
+                crop,
+                X.iloc[rows].to_numpy(dtype=np.float64),
+                {target: np.asarray(y)[rows] for target, y in targets.items()},
+                estimator,
+            )
+            for crop in np.unique(crops)
+            for rows in [train_idx[crops[train_idx] == crop]]
+        )
+        self.shards = {
+            crop: {"scaler": scaler, "models": models} for crop, scaler, models in shards
+        }
+        self.is_trained = True
+        print(f"Trained {len(self.shards)} crop shards in {time.perf_counter() - start:.1f}s")
+
+        predictions = self.predict(df.iloc[test_idx])
+        for target, y in targets.items():
+            self.test_scores[target] = r2_score(np.asarray(y)[test_idx], predictions[target])
+            print(f"  {target}: Test R² = {self.test_scores[target]:.4f}")
+
+    def build_feature_matrix(self, input_data):
+        """(crops, unscaled shard feature matrix) for raw scenario rows"""
+        if isinstance(input_data, dict):
+            input_df = pd.DataFrame([input_data])
+        else:
+            input_df = input_data.copy()
+        SeedModel.add_derived_features(input_df)
+        return (
+            input_df["crop"].to_numpy(),
+            input_df[self.feature_names].to_numpy(dtype=np.float64),
+        )
+
+    def predict(self, input_data):
+        """
+        Predict every target, routing each row to its crop's shard.
+        Returns {target: array} in input order.
+        """
+        if not self.is_trained:
+            raise ValueError("Models must be trained before making predictions")
+
+        crops, X = self.build_feature_matrix(input_data)
+        unknown = set(crops) - set(self.shards)
+        if unknown:
+            raise ValueError(f"No shard for crops: {sorted(unknown)}")
+
+        # Group rows by crop with one stable sort, predict each contiguous
+        # slice, then scatter the slices back to the input positions
+        order = np.argsort(crops, kind="stable")
+        sorted_crops = crops[order]
+        groups, starts = np.unique(sorted_crops, return_index=True)
+        stops = np.append(starts[1:], len(order))
+
+        predictions = {target: np.empty(len(order)) for target in self.targets}
+        for crop, start, stop in zip(groups, starts, stops):
+            shard = self.shards[crop]
+            rows = order[start:stop]
+            X_scaled = shard["scaler"].transform(X[rows])
+            for target, model in shard["models"].items():
+                predictions[target][rows] = model.predict(X_scaled)
+        return predictions
+
+    def shard_summary(self):
+        """Trees and nodes per (crop, target) shard"""
+        records = []
+        for crop, shard in self.shards.items():
+            for target, model in shard["models"].items():
+                packed = model if isinstance(model, PackedTreeEnsemble) else (
+                    PackedTreeEnsemble.from_estimator(model) if is_packable(model) else None
+                )
+                records.append(
+                    {
+                        "crop": crop,
+                        "target": target,
+                        "n_trees": packed.n_trees if packed is not None else 0,
+                        "n_nodes": len(packed.value) if packed is not None else 0,
+                    }
+                )
+        return pd.DataFrame(records)
+
+    def save_model(self, filepath):
+        """
+        Save every shard in one artifact, with tree ensembles flattened so
+        the file can be memory-mapped like SeedModel's
+        """
+        shards = {
+            crop: {
+                "scaler": shard["scaler"],
+                "models": {
+                    target: PackedTreeEnsemble.from_estimator(model)
+                    if is_packable(model)
+                    else model
+                    for target, model in shard["models"].items()
+                },
+            }
+            for crop, shard in self.shards.items()
+        }
+        model_data = {
+            "format_version": PACKED_FORMAT_VERSION,
+            "shards": shards,
+            "feature_names": self.feature_names,
+            "targets": self.targets,
+            "test_scores": self.test_scores,
+            "is_trained": self.is_trained,
+        }
+        joblib.dump(model_data, filepath, compress=0)
+        print(f"Sharded model saved to {filepath}")
+
+    def load_model(self, filepath, mmap_mode=None):
+        """Load a sharded artifact; mmap_mode="r" memory-maps the tree arrays"""
+        model_data = joblib.load(filepath, mmap_mode=mmap_mode)
+        check_format_version(model_data, filepath)
+        self.shards = model_data["shards"]
+        self.feature_names = model_data["feature_names"]
+        self.targets = model_data["targets"]
+        self.test_scores = model_data.get("test_scores", {})
+        self.is_trained = model_data["is_trained"]
+        print(f"Sharded model loaded from {filepath}")
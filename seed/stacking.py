@@ -0,0 +1,127 @@
+"""
+Stacked ensembles built from the model-selection CV pass
+
+Model selection already cross-validates every candidate on the shared
+folds; the validation predictions it scores are the candidates'
+out-of-fold (OOF) predictions. Instead of keeping only the winner, a stack
+fits a non-negative linear meta-learner on those OOF columns and refits the
+candidates it gives weight on the full training split in parallel, so
+stacking costs at most one refit per candidate and a tiny least-squares fit.
+
+Both levels are linear in the base predictions, so a stack's prediction
+decomposes exactly into per-feature contributions:
+
+    prediction = intercept + sum_i w_i * (bias_i + sum(contributions_i))
+"""
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import r2_score
+
+from seed.packed_trees import PackedTreeEnsemble, is_packable, linear_contributions
+
+
+def _fit(estimator, X, y):
+    return clone(estimator).fit(X, y)
+
+
+class StackedRegressor:
+    """
+    Fitted base regressors combined by a non-negative linear meta-learner.
+    Predicts, explains and reports feature importances like a single model.
+    """
+
+    def __init__(self, names, estimators, weights, intercept):
+        self.names = list(names)
+        self.estimators = list(estimators)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.intercept = float(intercept)
+
+    def base_predictions(self, X):
+        """(n_samples, n_estimators) predictions of the base models"""
+        return np.column_stack([estimator.predict(X) for estimator in self.estimators])
+
+    def predict(self, X):
+        return self.intercept + self.base_predictions(X) @ self.weights
+
+    @property
+    def feature_importances_(self):
+        """Base importances (normalized |coef| for linear models) mixed by weight"""
+        total = np.zeros(len(self._importance(self.estimators[0])))
+        for weight, estimator in zip(self.weights, self.estimators):
+            total += weight * self._importance(estimator)
+        return total / total.sum() if total.sum() > 0 else total
+
+    @staticmethod
+    def _importance(estimator):
+        if hasattr(estimator, "feature_importances_"):
+            importance = np.asarray(estimator.feature_importances_, dtype=np.float64)
+        else:
+            importance = np.abs(np.asarray(estimator.coef_, dtype=np.float64))
+        return importance / importance.sum() if importance.sum() > 0 else importance
+
+    def contributions(self, X):
+        """
+        (bias, contributions) with bias + contributions.sum(axis=1) equal to
+        predict(X), combining each base model's own exact attribution
+        """
+        bias = self.intercept
+        contributions = np.zeros(np.shape(X))
+        for weight, estimator in zip(self.weights, self.estimators):
+            if weight == 0:
+                continue
+            if isinstance(estimator, PackedTreeEnsemble):
+                base_bias, base_contributions = estimator.contributions(X)
+            elif is_packable(estimator):
+                base_bias, base_contributions = PackedTreeEnsemble.from_estimator(
+                    estimator
+                ).contributions(X)
+            else:
+                base_bias, base_contributions = linear_contributions(estimator, X)
+            bias += weight * base_bias
+            contributions += weight * base_contributions
+        return bias, contributions
+
+    def packed(self):
+        """A copy with tree base models flattened, for memory-mapped artifacts"""
+        return StackedRegressor(
+            self.names,
+            [
+                PackedTreeEnsemble.from_estimator(estimator) if is_packable(estimator) else estimator
+                for estimator in self.estimators
+            ],
+            self.weights,
+            self.intercept,
+        )
+
+    def report(self):
+        """Meta-learner weight per base model, plus the intercept"""
+        return {**dict(zip(self.names, self.weights.tolist())), "intercept": self.intercept}
+
+
+def fit_stack(candidates, oof, X, y, n_jobs=-1):
+    """
+    Stack the candidates {name: unfitted estimator} given their out-of-fold
+    predictions {name: array}. The meta-learner is a non-negative linear
+    regression on the OOF columns; the base models are refitted on X, y in
+    parallel. Returns (StackedRegressor, OOF R² of the meta-learner).
+    """
+    names = list(candidates)
+    Z = np.column_stack([oof[name] for name in names])
+    meta = LinearRegression(positive=True).fit(Z, y)
+
+    # Only base models with a non-zero weight need refitting
+    keep = [i for i, weight in enumerate(meta.coef_) if weight > 0] or [
+        int(np.argmax([r2_score(y, Z[:, i]) for i in range(len(names))]))
+    ]
+    if len(keep) < len(names):
+        meta = LinearRegression(positive=True).fit(Z[:, keep], y)
+    names = [names[i] for i in keep]
+
+    fitted = Parallel(n_jobs=n_jobs)(
+        delayed(_fit)(candidates[name], X, y) for name in names
+    )
+    stack = StackedRegressor(names, fitted, meta.coef_, meta.intercept_)
+    return stack, r2_score(y, meta.predict(Z[:, keep]))
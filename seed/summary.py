@@ -0,0 +1,104 @@
+"""
+Vectorized cross-category summaries of the annual agricultural datasets
+"""
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+# Column naming the item (crop, fish type, ...) in each category's dataset
+CATEGORY_ITEM_COLUMNS = {
+    "crops": "crop",
+    "fisheries": "fish_type",
+    "sales": "product_category",
+    "livestock": "animal_type",
+    "practices": "practice",
+    "tenure": "tenure_type",
+}
+
+# Ratios and percentages are averaged instead of summed
+NON_ADDITIVE_METRICS = {
+    "yield_per_hectare",
+    "percentage_of_total",
+    "percentage_of_farmers",
+}
+
+LONG_COLUMNS = ["year", "category", "item", "metric", "value"]
+
+
+def partition_to_long(df: pd.DataFrame, year: int, category: str) -> pd.DataFrame:
+    """
+    Melt one category dataset into (year, category, item, metric, value) rows.
+    """
+    item_column = CATEGORY_ITEM_COLUMNS[category]
+    measures = [col for col in df.columns if col not in (item_column, "year")]
+    n_items = len(df)
+
+    # Column-major ravel lays the rows out metric by metric, like DataFrame.melt
+    values = df[measures].to_numpy(dtype="float64").ravel(order="F")
+    return pd.DataFrame(
+        {
+            "year": np.full(len(values), int(year), dtype="int64"),
+            "category": np.full(len(values), category, dtype=object),
+            "item": np.tile(df[item_column].to_numpy(dtype=object), len(measures)),
+            "metric": np.repeat(np.array(measures, dtype=object), n_items),
+            "value": values,
+        }
+    )
+
+
+def to_long_format(annual_datasets: Dict[int, Dict[str, pd.DataFrame]]) -> pd.DataFrame:
+    """
+    Concatenate every year/category partition into one long table.
+    """
+    frames = [
+        partition_to_long(df, year, category)
+        for year, categories in annual_datasets.items()
+        for category, df in categories.items()
+        if category in CATEGORY_ITEM_COLUMNS
+    ]
+    if not frames:
+        return pd.DataFrame(columns=LONG_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def summarize_long_table(long_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-year/per-category totals and item counts from a long table, computed
+    with one grouped aggregation. Additive metrics are reported as
+    total_<metric>, ratios as mean_<metric>.
+    """
+    keys = ["year", "category"]
+    # Accumulate in float64 even when the values are stored as float32
+    long_df = long_df.assign(value=long_df["value"].astype("float64"))
+    agg = (
+        long_df.groupby(keys + ["metric"], observed=True, sort=False)["value"]
+        .agg(["sum", "mean", "count"])
+        .reset_index()
+    )
+
+    metric_names = agg["metric"].astype(str)
+    additive = ~metric_names.isin(NON_ADDITIVE_METRICS)
+    agg["column"] = np.where(additive, "total_", "mean_") + metric_names
+    agg["statistic"] = np.where(additive, agg["sum"], agg["mean"])
+
+    summary = agg.pivot_table(
+        index=keys, columns="column", values="statistic", aggfunc="first", observed=True
+    )
+    summary.columns.name = None
+    summary["num_items"] = agg.groupby(keys, observed=True)["count"].max().astype("int64")
+    ordered = sorted(c for c in summary.columns if c.startswith("total_")) + sorted(
+        c for c in summary.columns if c.startswith("mean_")
+    )
+    summary = summary[["num_items"] + ordered]
+    summary = summary.reset_index().sort_values(keys, ignore_index=True)
+    summary["category"] = summary["category"].astype(str)
+    return summary
+
+
+def summarize_datasets(annual_datasets: Dict[int, Dict[str, pd.DataFrame]]) -> pd.DataFrame:
+    """
+    Summary table covering all six categories of annual_datasets.
+    """
+    return summarize_long_table(to_long_format(annual_datasets))
@@ -0,0 +1,41 @@
+"""
+Tests for the rolling-origin backtest
+"""
+
+import numpy as np
+
+from seed.backtest import backtest, backtest_summary, rolling_origins
+from seed.model import SeedModel
+from seed.selection import candidate_models
+
+
+def test_rolling_origins_need_enough_history():
+    years = np.repeat(np.arange(2001, 2022), 8)
+    assert rolling_origins(years, first_origin=2015) == list(range(2015, 2022))
+    assert rolling_origins(years, min_train_years=18) == [2019, 2020, 2021]
+
+
+def test_backtest_reports_every_year_crop_and_target():
+    data = SeedModel().load_real_data(years=range(2001, 2011))
+    candidates = candidate_models()
+    errors = backtest(
+        data,
+        estimators={
+            "yield": candidates["Gradient Boosting"],  # warm-started chain
+            "price": candidates["Ridge Regression"],  # refitted per origin
+        },
+        first_origin=2008,
+        n_jobs=1,
+    )
+
+    assert len(errors) == 2 * 3 * data["crop"].nunique()
+    assert set(errors["year"]) == {2008, 2009, 2010}
+    np.testing.assert_allclose(errors["error"], errors["predicted"] - errors["actual"])
+
+    expected = data[data["year"] == 2009].set_index("crop")["yield_per_hectare"]
+    actual = errors.query("target == 'yield' and year == 2009").set_index("crop")["actual"]
+    np.testing.assert_allclose(actual, expected.loc[actual.index])
+
+    summary = backtest_summary(errors)
+    assert list(summary.columns) == ["target", "year", "mae", "rmse", "mape"]
+    assert len(summary) == 6
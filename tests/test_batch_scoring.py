@@ -0,0 +1,109 @@
+"""
+Tests for the shared-memory process-pool scorer and bulk file scoring
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from seed.batch_scoring import BatchScorer
+from seed.file_scoring import input_columns, score_file
+from seed.model import SeedModel
+
+
+@pytest.fixture(scope="module")
+def trained(tmp_path_factory):
+    model = SeedModel()
+    data = model.load_real_data(years=range(2001, 2011))
+    model.train_models(data)
+    model_path = tmp_path_factory.mktemp("model") / "model.pkl"
+    model.save_model(model_path)
+    scenarios = data.sample(500, replace=True, random_state=0).reset_index(drop=True)
+    return model, model_path, scenarios[input_columns(model)]
+
+
+def test_parallel_scores_match_serial_predictions(trained):
+    model, model_path, scenarios = trained
+
+    with BatchScorer(model_path, n_workers=2, chunk_rows=100) as scorer:
+        scores = scorer.score(scenarios)
+
+    for target, expected in model.predict(scenarios).items():
+        np.testing.assert_allclose(scores[target], expected)
+
+
+def test_score_file_streams_chunks_and_rejects_bad_rows(trained, tmp_path):
+    model, model_path, scenarios = trained
+    scenarios = scenarios.copy()
+    scenarios.loc[3, "crop"] = "Banana"
+    scenarios.loc[250, "soil_ph"] = np.nan
+    scenarios.to_csv(tmp_path / "scenarios.csv", index=False)
+
+    stats = score_file(
+        model_path, tmp_path / "scenarios.csv", tmp_path / "scored.csv", chunk_rows=64
+    )
+
+    assert (stats.rows, stats.scored, stats.rejected) == (500, 498, 2)
+    assert stats.chunks == 8
+    rejects = pd.read_csv(tmp_path / "scored.rejects.csv")
+    assert rejects["row"].tolist() == [3, 250]
+    assert rejects["error"].tolist() == ["unknown crop", "invalid soil_ph"]
+
+    scored = pd.read_csv(tmp_path / "scored.csv")
+    expected = model.predict(scenarios.drop(index=[3, 250]))
+    np.testing.assert_allclose(scored["predicted_yield"], expected["yield"])
+
+
+def test_score_file_rejects_malformed_lines_and_keeps_scoring(trained, tmp_path):
+    model, model_path, scenarios = trained
+    scenarios.to_csv(tmp_path / "scenarios.csv", index=False)
+    lines = (tmp_path / "scenarios.csv").read_text().splitlines(keepends=True)
+    # A line with two extra fields as data row 300, in the fifth 64-row chunk
+    lines.insert(301, lines[301].rstrip("\n") + ",1,2\n")
+    (tmp_path / "scenarios.csv").write_text("".join(lines))
+
+    stats = score_file(
+        model_path, tmp_path / "scenarios.csv", tmp_path / "scored.csv", chunk_rows=64
+    )
+
+    assert (stats.rows, stats.scored, stats.rejected) == (501, 500, 1)
+    rejects = pd.read_csv(tmp_path / "scored.rejects.csv")
+    assert rejects["row"].tolist() == [300]
+    assert rejects["error"].iloc[0].startswith("malformed line")
+
+    scored = pd.read_csv(tmp_path / "scored.csv")
+    expected = model.predict(scenarios)
+    np.testing.assert_allclose(scored["predicted_yield"], expected["yield"])
+
+
+def test_parquet_output_keeps_numeric_inputs_numeric(trained, tmp_path):
+    pytest.importorskip("pyarrow")
+    model, model_path, scenarios = trained
+    scenarios.assign(note="scenario").to_csv(tmp_path / "scenarios.csv", index=False)
+
+    score_file(model_path, tmp_path / "scenarios.csv", tmp_path / "scored.parquet", chunk_rows=64)
+
+    scored = pd.read_parquet(tmp_path / "scored.parquet")
+    for col in input_columns(model)[1:] + ["predicted_yield", "predicted_price"]:
+        assert scored[col].dtype == np.float64, col
+    assert pd.api.types.is_string_dtype(scored["crop"])
+    assert (scored["note"] == "scenario").all()
+    np.testing.assert_allclose(scored["soil_ph"], scenarios["soil_ph"])
+
+
+def test_parallel_fast_scores_use_students_and_are_drift_monitored(tmp_path):
+    model = SeedModel()
+    data = model.load_real_data(years=range(2001, 2007))
+    model.train_models(data, time_budget=1)
+    model.distill(targets=["price"], n_samples=2000)
+    model.save_model(tmp_path / "model.pkl")
+    scenarios = data[input_columns(model)]
+
+    with BatchScorer(tmp_path / "model.pkl", n_workers=2, fast=True) as scorer:
+        monitor = scorer.model.monitor_drift()
+        scores = scorer.score(scenarios)
+
+    for target, expected in model.predict(scenarios, fast=True).items():
+        np.testing.assert_allclose(scores[target], expected)
+    assert not np.allclose(scores["price"], model.predict(scenarios)["price"])
+    assert monitor.batches == 1 and monitor.running.n == len(scenarios)
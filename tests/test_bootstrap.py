@@ -0,0 +1,40 @@
+"""
+Tests for bootstrap confidence intervals of held-out metrics
+"""
+
+import numpy as np
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+from seed.bootstrap import bootstrap_indices, bootstrap_metrics
+
+
+def test_intervals_for_all_targets_from_one_index_matrix():
+    rng = np.random.default_rng(0)
+    y = {"yield": rng.normal(2, 0.5, 40), "price": rng.normal(300, 80, 40)}
+    pred = {target: values + rng.normal(0, values.std() / 3, 40) for target, values in y.items()}
+
+    intervals = bootstrap_metrics(y, pred, n_resamples=3000, chunk_size=400, n_jobs=2)
+    table = intervals.set_index(["target", "metric"])
+
+    for target in y:
+        assert np.isclose(table.loc[(target, "r2"), "estimate"], r2_score(y[target], pred[target]))
+        assert np.isclose(
+            table.loc[(target, "rmse"), "estimate"],
+            np.sqrt(mean_squared_error(y[target], pred[target])),
+        )
+        assert np.isclose(
+            table.loc[(target, "mae"), "estimate"], mean_absolute_error(y[target], pred[target])
+        )
+    assert (intervals["lower"] <= intervals["estimate"]).all()
+    assert (intervals["estimate"] <= intervals["upper"]).all()
+
+    # Chunking and threading do not change the resamples
+    again = bootstrap_metrics(y, pred, n_resamples=3000, chunk_size=1000, n_jobs=1)
+    np.testing.assert_allclose(again[["lower", "upper"]], intervals[["lower", "upper"]])
+
+    # The first resample's R² is the R² of those rows, for every target
+    rows = bootstrap_indices(40, 3000)[0]
+    single = bootstrap_metrics(y, pred, n_resamples=1, n_jobs=1)
+    for target in y:
+        expected = r2_score(y[target][rows], pred[target][rows])
+        assert np.isclose(single.set_index(["target", "metric"]).loc[(target, "r2"), "lower"], expected)
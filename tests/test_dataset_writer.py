@@ -0,0 +1,57 @@
+"""
+Tests for the atomic, parallel partition writer
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from seed import dataset_writer
+from seed.dataset_writer import ParallelDatasetWriter, WriteStats, atomic_write_bytes
+
+
+def test_atomic_write_replaces_file_and_keeps_its_mode(tmp_path):
+    target = tmp_path / "crop_production_2020.csv"
+    target.write_bytes(b"old\n")
+    target.chmod(0o640)
+
+    atomic_write_bytes(target, b"new\n")
+    assert target.read_bytes() == b"new\n"
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == [target.name]
+
+
+def test_failed_atomic_write_leaves_original_untouched(tmp_path, monkeypatch):
+    target = tmp_path / "crop_production_2020.csv"
+    target.write_bytes(b"old\n")
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(dataset_writer.os, "replace", fail)
+    with pytest.raises(OSError):
+        atomic_write_bytes(target, b"new\n")
+    assert target.read_bytes() == b"old\n"
+    assert os.listdir(tmp_path) == [target.name]
+
+
+def test_write_stats_count_files_and_bytes(tmp_path):
+    frame = pd.DataFrame({"crop": ["Rice", "Maize"], "production_tonnes": [51000, 34000]})
+    annual_datasets = {
+        year: {"crop_production": frame.assign(year=year)} for year in (2019, 2020, 2021)
+    }
+
+    stats = ParallelDatasetWriter(tmp_path, max_workers=2).write(annual_datasets)
+    sizes = [p.stat().st_size for p in tmp_path.glob("*/crop_production_*.csv")]
+    assert stats.files == 3 and stats.skipped == 0
+    assert stats.bytes_written == sum(sizes)
+    assert [p.rows for p in stats.partitions] == [2, 2, 2]
+
+
+def test_throughput_is_in_decimal_megabytes():
+    stats = WriteStats(files=4, bytes_written=3_000_000, seconds=2.0)
+    assert stats.mb_per_second == pytest.approx(1.5)
+    assert stats.files_per_second == pytest.approx(2.0)
+    assert "1.50 MB/s" in stats.summary()
+    assert WriteStats().mb_per_second == 0.0
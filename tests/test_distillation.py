@@ -0,0 +1,22 @@
+"""
+Tests for distilling the full models into compact students
+"""
+
+import numpy as np
+
+from seed.model import SeedModel
+
+
+def test_student_tracks_teacher_and_serves_fast_predictions():
+    model = SeedModel()
+    data = model.load_real_data(years=range(2001, 2011))
+    model.train_models(data, distill=False)
+
+    report = model.distill(targets=["price"], n_samples=4000)["price"]
+
+    assert report["fidelity_r2"] > 0.9
+    assert set(model.students) == {"price"}
+    full = model.predict(data)
+    fast = model.predict(data, fast=True)
+    np.testing.assert_allclose(fast["yield"], full["yield"])
+    assert np.corrcoef(fast["price"], full["price"])[0, 1] > 0.95
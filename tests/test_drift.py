@@ -0,0 +1,63 @@
+"""
+Tests for streaming input drift monitoring
+"""
+
+import numpy as np
+import pandas as pd
+
+from seed.drift import DriftMonitor, DriftReference, RunningStats, bin_counts
+from seed.model import SeedModel
+
+
+def test_running_stats_match_the_full_data_and_flag_shifted_features():
+    rng = np.random.default_rng(0)
+    training = pd.DataFrame(
+        {"fuel_price": rng.normal(1.5, 0.3, 5000), "soil_ph": rng.normal(6.5, 0.5, 5000)}
+    )
+    reference = DriftReference.from_frame(training)
+    np.testing.assert_allclose(reference.proportions[:, 1:-1].sum(axis=1), 1.0)
+
+    monitor = DriftMonitor(reference)
+    live = pd.DataFrame(
+        {"fuel_price": rng.normal(2.5, 0.3, 3000), "soil_ph": rng.normal(6.5, 0.5, 3000)}
+    )
+    for start in range(0, len(live), 500):
+        report = monitor.update(live.iloc[start : start + 500]).set_index("feature")
+        assert report.loc["fuel_price", "drifted"] and not report.loc["soil_ph", "drifted"]
+
+    summary = monitor.summary().set_index("feature")
+    np.testing.assert_allclose(summary["mean"], live.mean(), rtol=1e-12)
+    np.testing.assert_allclose(summary["std"], live.std(ddof=0), rtol=1e-10)
+    assert summary.loc["fuel_price", "out_of_range"] > 0.5
+    assert summary.loc["soil_ph", "psi"] < 0.05 < summary.loc["fuel_price", "psi"]
+    assert (summary["n"] == len(live)).all()
+
+    # Memory is fixed: only the moments and one count per bin are kept
+    assert monitor.running.counts.shape == (2, reference.edges.shape[1] + 1)
+
+
+def test_bin_counts_put_the_training_extremes_in_range():
+    edges = np.array([[0.0, 1.0, 2.0]])
+    counts = bin_counts(np.array([[-1.0], [0.0], [1.5], [2.0], [3.0]]), edges)
+    assert counts.tolist() == [[1, 1, 2, 1]]
+
+    stats = RunningStats(1, 4)
+    stats.merge(RunningStats.from_batch(np.zeros((0, 1)), np.zeros((1, 4), dtype=np.int64)))
+    assert stats.n == 0
+
+
+def test_predict_is_monitored_against_statistics_saved_with_the_model(tmp_path):
+    model = SeedModel()
+    data = model.load_real_data(years=range(2001, 2007))
+    model.train_models(data, distill=False, time_budget=1)
+    model.save_model(tmp_path / "model.pkl")
+
+    loaded = SeedModel()
+    loaded.load_model(tmp_path / "model.pkl")
+    monitor = loaded.monitor_drift()
+    loaded.predict(data.assign(fuel_price_usd_liter=data["fuel_price_usd_liter"] * 3))
+
+    report = monitor.last_report.set_index("feature")
+    assert list(report.index) == loaded.raw_input_features()
+    assert report.loc["fuel_price_usd_liter", "drifted"]
+    assert not report.loc["soil_ph", "drifted"]
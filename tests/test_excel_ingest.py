@@ -0,0 +1,75 @@
+"""
+Tests for the cached Excel workbook ingestion
+"""
+
+import json
+
+import pandas as pd
+
+from seed import excel_ingest
+from seed.excel_ingest import ExcelSheetCache
+
+
+def write_workbook(path, sheets):
+    with pd.ExcelWriter(path) as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+
+
+def count_parses(monkeypatch):
+    calls = []
+    excel_file = pd.ExcelFile
+    monkeypatch.setattr(
+        excel_ingest.pd, "ExcelFile", lambda *args: calls.append(1) or excel_file(*args)
+    )
+    return calls
+
+
+SHEETS = {
+    "Production": pd.DataFrame({"crop": ["Rice", "Maize"], "tonnes": [51000, 34000]}),
+    "Prices": pd.DataFrame({"crop": ["Rice", "Maize"], "dalasi_kg": [45.5, 30.0]}),
+}
+
+
+def test_unchanged_workbook_loads_from_cache(tmp_path, monkeypatch):
+    workbook = tmp_path / "accounts.xlsx"
+    write_workbook(workbook, SHEETS)
+    calls = count_parses(monkeypatch)
+
+    first = ExcelSheetCache(workbook, tmp_path / "cache").load()
+    again = ExcelSheetCache(workbook, tmp_path / "cache").load()
+    assert len(calls) == 1
+    assert list(again) == list(SHEETS)
+    for name, df in SHEETS.items():
+        pd.testing.assert_frame_equal(again[name], df)
+        pd.testing.assert_frame_equal(again[name], first[name])
+
+
+def test_changed_workbook_is_parsed_again(tmp_path, monkeypatch):
+    workbook = tmp_path / "accounts.xlsx"
+    write_workbook(workbook, SHEETS)
+    calls = count_parses(monkeypatch)
+    ExcelSheetCache(workbook, tmp_path / "cache").load()
+
+    changed = {**SHEETS, "Prices": SHEETS["Prices"].assign(dalasi_kg=[47.0, 31.5])}
+    write_workbook(workbook, changed)
+    sheets = ExcelSheetCache(workbook, tmp_path / "cache").load()
+    assert len(calls) == 2
+    pd.testing.assert_frame_equal(sheets["Prices"], changed["Prices"])
+
+
+def test_sheets_fall_back_to_pickle_without_parquet(tmp_path, monkeypatch):
+    workbook = tmp_path / "accounts.xlsx"
+    write_workbook(workbook, SHEETS)
+    monkeypatch.setattr(excel_ingest, "HAS_PYARROW", False)
+    calls = count_parses(monkeypatch)
+
+    cache = ExcelSheetCache(workbook, tmp_path / "cache")
+    cache.load()
+    manifest = json.loads(cache.manifest_path.read_text())
+    assert {entry["format"] for entry in manifest["sheets"].values()} == {"pickle"}
+
+    sheets = ExcelSheetCache(workbook, tmp_path / "cache").load()
+    assert len(calls) == 1
+    for name, df in SHEETS.items():
+        pd.testing.assert_frame_equal(sheets[name], df)
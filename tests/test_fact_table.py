@@ -0,0 +1,40 @@
+"""
+Tests for the long-format fact table and the vectorized summary
+"""
+
+import pandas as pd
+import pytest
+
+from seed.fact_table import load_fact_table, pivot_category
+from seed.summary import summarize_long_table
+
+
+def test_fact_table_is_compact_and_complete():
+    facts = load_fact_table("data", years=[2001, 2002])
+
+    assert list(facts.columns) == ["year", "category", "item", "metric", "value"]
+    assert str(facts["year"].dtype) == "int16"
+    assert str(facts["value"].dtype) == "float32"
+    for col in ["category", "item", "metric"]:
+        assert isinstance(facts[col].dtype, pd.CategoricalDtype)
+    assert set(facts["category"].cat.categories) == {
+        "crops", "fisheries", "sales", "livestock", "practices", "tenure"
+    }
+
+    crops = pivot_category(facts, "crops")
+    original = pd.read_csv("data/2001/crops_2001.csv")
+    rice = crops[(crops["year"] == 2001) & (crops["crop"] == "Rice")].iloc[0]
+    assert rice["area_hectares"] == original.loc[0, "area_hectares"]
+
+
+def test_summary_covers_every_category():
+    summary = summarize_long_table(load_fact_table("data", years=[2001]))
+
+    assert len(summary) == 6
+    crops = summary[summary["category"] == "crops"].iloc[0]
+    original = pd.read_csv("data/2001/crops_2001.csv")
+    assert crops["num_items"] == len(original)
+    assert crops["total_production_tons"] == original["production_tons"].sum()
+    assert crops["mean_yield_per_hectare"] == pytest.approx(
+        original["yield_per_hectare"].mean()
+    )
@@ -0,0 +1,40 @@
+"""
+Tests for the batched polynomial trend forecaster
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from seed.forecast import TrendForecaster
+
+CROPS = ["Rice", "Maize", "Groundnuts", "Millet"]
+YEARS = np.arange(2004, 2022)
+
+
+def crop_facts(drop_every=None):
+    rng = np.random.default_rng(0)
+    rows = []
+    for c, crop in enumerate(CROPS):
+        for metric in ("yield_per_hectare", "production_tonnes"):
+            values = 1.0 + c + 0.05 * (YEARS - 2004) + 0.01 * (YEARS - 2012) ** 2
+            values = values + rng.normal(scale=0.2, size=len(YEARS))
+            for i, (year, value) in enumerate(zip(YEARS, values)):
+                if drop_every and (i + c) % drop_every == 0:
+                    continue
+                rows.append(("crops", crop, metric, year, value))
+    return pd.DataFrame(rows, columns=["category", "item", "metric", "year", "value"])
+
+
+@pytest.mark.parametrize("drop_every", [None, 4])
+def test_batched_fit_matches_per_crop_polyfit(drop_every):
+    facts = crop_facts(drop_every)
+    forecaster = TrendForecaster(degree=2).fit(facts)
+    forecast = forecaster.forecast(horizon=3).set_index(["item", "metric", "year"])
+
+    for (crop, metric), series in facts.groupby(["item", "metric"]):
+        coefficients = np.polyfit(series["year"], series["value"], deg=2)
+        for year in (2022, 2023, 2024):
+            assert forecast.loc[(crop, metric, year), "forecast"] == pytest.approx(
+                np.polyval(coefficients, year), rel=1e-6
+            )
@@ -0,0 +1,72 @@
+"""
+Tests for the parallel dataset writer and the content-hash manifest
+"""
+
+import pandas as pd
+
+from seed.dataset_writer import ParallelDatasetWriter
+from seed.manifest import DatasetManifest, scan_csv, verify_data_tree
+
+
+def make_datasets(rice_area=45000):
+    crops = pd.DataFrame(
+        {"crop": ["Rice", "Millet"], "area_hectares": [rice_area, 35000]}
+    )
+    fisheries = pd.DataFrame(
+        {"fish_type": ["Fresh Fish"], "production_tons": [25000.5]}
+    )
+    return {
+        2001: {"crops": crops, "fisheries": fisheries},
+        2002: {"crops": crops.copy()},
+    }
+
+
+def test_writer_records_and_skips_unchanged_partitions(tmp_path):
+    manifest = DatasetManifest(tmp_path)
+    writer = ParallelDatasetWriter(tmp_path, max_workers=2)
+
+    stats = writer.write(make_datasets(), manifest=manifest)
+    assert stats.files == 3 and stats.skipped == 0
+    assert not list(tmp_path.rglob("*.tmp"))
+
+    entry = manifest.get(2001, "crops")
+    assert entry["rows"] == 2
+    assert entry["schema"] == {"crop": "str", "area_hectares": "int"}
+    assert scan_csv(tmp_path / "2001" / "crops_2001.csv")[0] == entry["sha256"]
+
+    manifest.save()
+    previous = manifest.year_digests()
+
+    reloaded = DatasetManifest.load(tmp_path)
+    assert reloaded.refresh() == []
+    stats = writer.write(make_datasets(rice_area=46000), manifest=reloaded)
+    assert stats.files == 2 and stats.skipped == 1
+    assert reloaded.changed_years(previous) == [2001, 2002]
+
+
+def test_refresh_detects_external_edits(tmp_path):
+    ParallelDatasetWriter(tmp_path).write(make_datasets())
+    manifest = DatasetManifest(tmp_path)
+    assert sorted(manifest.refresh()) == ["2001/crops", "2001/fisheries", "2002/crops"]
+    previous = manifest.year_digests()
+
+    with open(tmp_path / "2002" / "crops_2002.csv", "a") as f:
+        f.write("Maize,15000\n")
+    assert manifest.refresh() == ["2002/crops"]
+    assert manifest.get(2002, "crops")["rows"] == 3
+    assert manifest.changed_years(previous) == [2002]
+
+
+def test_verify_reports_changed_column_kinds(tmp_path):
+    manifest = DatasetManifest(tmp_path)
+    ParallelDatasetWriter(tmp_path).write(make_datasets(), manifest=manifest)
+    assert not any(result["problems"] for result in verify_data_tree(manifest))
+
+    (tmp_path / "2002" / "crops_2002.csv").write_text(
+        "crop,area_hectares\nRice,unknown\nMillet,35000\n"
+    )
+    problems = {
+        result["key"]: result["problems"] for result in verify_data_tree(manifest)
+    }
+    assert problems["2002/crops"][0] == "area_hectares is str, expected int"
+    assert problems["2001/crops"] == []
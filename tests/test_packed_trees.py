@@ -0,0 +1,88 @@
+"""
+Tests for the flattened tree ensembles and path attribution
+"""
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import Ridge
+
+from seed.distillation import is_distillable
+from seed.model import SeedModel
+from seed.packed_trees import PackedTreeEnsemble, linear_contributions, source_class
+
+
+def _regression_data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 4))
+    y = 3 * X[:, 0] - 2 * X[:, 1] ** 2 + rng.normal(scale=0.1, size=200)
+    return X, y
+
+
+def test_packed_ensembles_match_sklearn_and_decompose_exactly():
+    X, y = _regression_data()
+    for estimator in [
+        RandomForestRegressor(n_estimators=20, random_state=0),
+        GradientBoostingRegressor(n_estimators=30, random_state=0),
+    ]:
+        estimator.fit(X, y)
+        packed = PackedTreeEnsemble.from_estimator(estimator)
+
+        np.testing.assert_allclose(packed.predict(X), estimator.predict(X))
+        bias, contributions = packed.contributions(X)
+        assert contributions.shape == X.shape
+        np.testing.assert_allclose(bias + contributions.sum(axis=1), estimator.predict(X))
+        # The unused features barely move the prediction
+        assert np.abs(contributions[:, :2]).mean() > 10 * np.abs(contributions[:, 2:]).mean()
+
+
+def test_linear_contributions_are_exact():
+    X, y = _regression_data()
+    model = Ridge().fit(X, y)
+    bias, contributions = linear_contributions(model, X)
+    np.testing.assert_allclose(bias + contributions.sum(axis=1), model.predict(X))
+
+
+def test_saved_model_loads_memory_mapped(tmp_path):
+    model = SeedModel()
+    data = model.load_real_data(years=range(2001, 2011))
+    model.train_models(data)
+    expected = model.predict(data)
+
+    model.save_model(tmp_path / "model.pkl")
+    loaded = SeedModel()
+    loaded.load_model(tmp_path / "model.pkl", mmap_mode="r")
+
+    for target, predictions in loaded.predict(data).items():
+        np.testing.assert_allclose(predictions, expected[target])
+        packed = loaded.packed_model(target)
+        if packed is not None:
+            assert isinstance(packed.value, np.memmap)
+            assert not packed.value.flags.writeable
+
+
+def test_packed_models_keep_their_source_class():
+    X, y = _regression_data()
+    forest = PackedTreeEnsemble.from_estimator(
+        RandomForestRegressor(n_estimators=5, random_state=0).fit(X, y)
+    )
+    boosted = PackedTreeEnsemble.from_estimator(
+        GradientBoostingRegressor(n_estimators=5, random_state=0).fit(X, y)
+    )
+    assert source_class(forest) is RandomForestRegressor
+    assert source_class(boosted) is GradientBoostingRegressor
+    assert is_distillable(forest) and not is_distillable(boosted)
+
+
+def test_artifacts_from_another_format_version_are_rejected(tmp_path):
+    model = SeedModel()
+    data = model.load_real_data(years=range(2001, 2007))
+    model.train_models(data, distill=False, time_budget=1)
+    model.save_model(tmp_path / "model.pkl")
+
+    artifact = joblib.load(tmp_path / "model.pkl")
+    artifact["format_version"] = None
+    joblib.dump(artifact, tmp_path / "old.pkl")
+    with pytest.raises(ValueError, match="format version"):
+        SeedModel().load_model(tmp_path / "old.pkl")
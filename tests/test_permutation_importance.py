@@ -0,0 +1,35 @@
+"""
+Tests for held-out permutation importance
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from seed.model import SeedModel
+
+
+def test_permutation_importances_survive_save_and_load(tmp_path, monkeypatch):
+    model = SeedModel()
+    data = model.load_real_data(years=range(2001, 2011))
+    model.train_models(data)
+    importances = model.compute_permutation_importance(n_repeats=3, n_jobs=1)
+
+    for target, table in importances.items():
+        assert list(table["feature"].sort_values()) == sorted(model.feature_names)
+        assert np.isfinite(table[["importance", "importance_std"]].to_numpy()).all()
+        assert table["importance"].is_monotonic_decreasing
+
+    model_path = tmp_path / "model.pkl"
+    model.save_model(model_path)
+    loaded = SeedModel()
+    loaded.load_model(model_path)
+
+    def recompute(*args, **kwargs):
+        pytest.fail("permutation importance was recomputed after loading")
+
+    monkeypatch.setattr(SeedModel, "compute_permutation_importance", recompute)
+    for target, table in importances.items():
+        pd.testing.assert_frame_equal(
+            loaded.get_feature_importance(target, method="permutation"), table
+        )
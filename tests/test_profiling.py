@@ -0,0 +1,46 @@
+"""
+Tests for the memory profiling mode
+"""
+
+from seed.model import SeedModel
+from seed.profiling import MemoryProfiler
+
+
+def test_stages_record_peaks_and_allocation_sites():
+    profiler = MemoryProfiler().start()
+    try:
+        with profiler.stage("outer"):
+            kept = bytearray(4 * 1024 * 1024)
+            with profiler.stage("inner"):
+                transient = bytearray(16 * 1024 * 1024)
+                del transient
+    finally:
+        profiler.stop()
+
+    report = profiler.report().set_index("stage")
+    assert list(report.index) == ["inner", "outer"]
+    assert report.loc["inner", "traced_peak_mb"] >= 16
+    assert report.loc["outer", "traced_peak_mb"] >= 16
+    assert 3.9 < report.loc["outer", "traced_delta_mb"] < 5
+    assert report.loc["outer", "rss_after_mb"] > 0
+
+    sites = profiler.top_allocations("outer")
+    assert sites["site"].iloc[0].startswith(__file__)
+    assert len(kept) and "outer:" in profiler.format_report()
+
+
+def test_model_pipeline_stages_are_profiled_when_enabled():
+    model = SeedModel()
+    profiler = model.profile_memory()
+    try:
+        data = model.load_real_data(years=range(2001, 2005))
+        model.train_models(data, distill=False, time_budget=1)
+        model.predict(data.head(5))
+    finally:
+        profiler.stop()
+
+    stages = list(profiler.report()["stage"])
+    assert stages[:4] == ["load_real_data", "prepare_features", "split", "scale"]
+    for target in ["yield", "price", "production"]:
+        assert f"{target}: cv" in stages and f"{target}: fit" in stages
+    assert stages[-1] == "predict"
@@ -0,0 +1,89 @@
+"""
+Tests for the regional data layout and per-region models
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from seed.model import SeedModel
+from seed.regional_model import RegionalSeedModel, aggregate_to_national
+from seed.regions import (
+    METADATA_FILENAME,
+    REGIONS,
+    load_annual_datasets,
+    region_dir,
+    split_annual_datasets,
+    write_regional_datasets,
+)
+
+
+def test_regional_split_sums_to_national_and_trains_per_region(tmp_path):
+    national = load_annual_datasets("data", years=range(2001, 2011))
+    regional = split_annual_datasets(national)
+    assert set(regional) == set(REGIONS)
+
+    crops = national[2005]["crops"]
+    parts = [regional[region][2005]["crops"] for region in REGIONS]
+    for col in ["area_hectares", "production_tons", "farmers_count"]:
+        assert sum(part[col] for part in parts).tolist() == crops[col].tolist()
+    np.testing.assert_array_equal(parts[0]["yield_per_hectare"], crops["yield_per_hectare"])
+    rice = [part.loc[part["crop"] == "Rice", "production_tons"].item() for part in parts]
+    assert rice[REGIONS.index("Janjanbureh")] > rice[REGIONS.index("Brikama")]
+
+    write_regional_datasets(regional, tmp_path)
+    assert (region_dir(tmp_path, "Basse") / "2005" / "crops_2005.csv").exists()
+    assert (region_dir(tmp_path, "Basse") / "manifest.json").exists()
+    metadata = json.loads((region_dir(tmp_path, "Basse").parent / METADATA_FILENAME).read_text())
+    assert metadata["synthetic"] and "yield_per_hectare" in metadata["copied_unchanged"]
+
+    loader = SeedModel()
+    loader.data_dir = tmp_path
+    data = loader.load_real_data(range(2001, 2011), regions=["Basse", "Kerewan"])
+    assert set(data["region"]) == {"Basse", "Kerewan"}
+
+    model = RegionalSeedModel(regions=["Basse", "Kerewan"], data_dir=tmp_path, max_workers=2)
+    model.train_models(range(2001, 2011), distill=False)
+    scenarios = data.drop(columns=["yield_per_hectare", "production_tons"])
+    predictions = model.predict(scenarios)
+    basse = (scenarios["region"] == "Basse").to_numpy()
+    expected = model.models["Basse"].predict(scenarios[basse])["yield"]
+    np.testing.assert_allclose(predictions["yield"][basse], expected)
+
+    national_forecast = model.predict_national(scenarios)
+    assert len(national_forecast) == scenarios.groupby(["year", "crop"]).ngroups
+    assert (national_forecast["regions"] == 2).all()
+
+
+def test_aggregate_to_national_weights_yield_by_area_and_price_by_production():
+    scenarios = pd.DataFrame({"region": ["A", "B", "A"], "crop": ["Rice", "Rice", "Maize"]})
+    predictions = {
+        "production": np.array([100.0, 300.0, 50.0]),
+        "yield": np.array([2.0, 3.0, 5.0]),
+        "price": np.array([10.0, 20.0, 7.0]),
+    }
+    national = aggregate_to_national(scenarios, predictions, by=("crop",))
+    rice = national.set_index("crop").loc["Rice"]
+    assert rice["production"] == 400.0
+    assert rice["yield"] == 400.0 / (50.0 + 100.0)
+    assert rice["price"] == (100 * 10 + 300 * 20) / 400
+    assert national.set_index("crop").loc["Maize", "yield"] == 5.0
+
+
+def test_aggregate_to_national_keeps_rows_with_missing_keys():
+    scenarios = pd.DataFrame(
+        {
+            "region": ["A", "B", "A", "B"],
+            "year": [2020, 2020, 2020, 2021],
+            "crop": ["Rice", None, None, "Rice"],
+        }
+    )
+    predictions = {
+        "production": np.array([100.0, 300.0, 50.0, 10.0]),
+        "yield": np.array([2.0, 3.0, 5.0, 1.0]),
+    }
+    national = aggregate_to_national(scenarios, predictions)
+    assert national["production"].tolist() == [100.0, 350.0, 10.0]
+    assert national["crop"].isna().tolist() == [False, True, False]
+    assert national["regions"].tolist() == [1, 2, 1]
@@ -0,0 +1,37 @@
+"""
+Tests for the cached report sections
+"""
+
+import pandas as pd
+import pytest
+
+from seed.report_cache import ReportCache
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json"])
+def test_sections_are_recomputed_only_when_their_key_changes(tmp_path, fmt):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return pd.DataFrame({"crop": ["Rice", "Maize"], "yield": [3.75, 2.07]})
+
+    inputs = pd.DataFrame({"crop": ["Rice", "Maize"], "rainfall_mm": [800.0, 800.0]})
+    cache = ReportCache(tmp_path, fmt=fmt)
+    first = cache.get_or_compute("rainfall_2026", "v1", inputs, compute)
+
+    # A new process sees the stored table through the index
+    cache = ReportCache(tmp_path, fmt=fmt)
+    again = cache.get_or_compute("rainfall_2026", "v1", inputs.copy(), compute)
+    pd.testing.assert_frame_equal(first, again)
+    assert len(calls) == 1 and cache.hits == ["rainfall_2026"]
+
+    cache.get_or_compute("rainfall_2026", "v1", inputs.assign(rainfall_mm=900.0), compute)
+    cache.get_or_compute("rainfall_2026", "v2", inputs.assign(rainfall_mm=900.0), compute)
+    assert len(calls) == 3
+    # Only the current version of a section is kept
+    assert len(list(tmp_path.glob(f"rainfall_2026-*.{fmt}"))) == 1
+
+    cache.get_or_compute("sensitivity", None, None, compute)
+    cache.get_or_compute("sensitivity", None, None, compute)
+    assert len(calls) == 5 and "sensitivity" not in cache.index
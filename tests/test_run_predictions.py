@@ -0,0 +1,71 @@
+"""
+Tests for the JSON-line prediction daemon
+"""
+
+import json
+
+import pytest
+
+from scripts.run_predictions import predict_requests, serve_stream
+from seed.model import SeedModel
+
+
+def strict_loads(line):
+    def reject(constant):
+        raise ValueError(f"{constant} is not valid JSON")
+
+    return json.loads(line, parse_constant=reject)
+
+
+@pytest.fixture(scope="module")
+def model():
+    model = SeedModel()
+    data = model.load_real_data(years=range(2001, 2007))
+    model.train_models(data, distill=False, time_budget=1)
+    return model
+
+
+def scenario(**overrides):
+    request = {
+        "crop": "Rice",
+        "rainfall_mm": 850,
+        "temperature_c": 28,
+        "humidity_percent": 75,
+        "soil_ph": 6.8,
+        "fertilizer_use_kg_ha": 70,
+        "irrigation_area_percent": 25,
+        "fuel_price_usd_liter": 1.3,
+        "labor_cost_usd_day": 16,
+        "market_demand_index": 110,
+    }
+    return json.dumps({**request, **overrides})
+
+
+def test_invalid_inputs_get_error_responses_and_valid_ones_are_predicted(model):
+    lines = [
+        scenario(id=1),
+        scenario(id=2, soil_ph=None),
+        scenario(id=3, rainfall_mm="lots"),
+        scenario(id=4, rainfall_mm="850"),
+        '{"id": 5, "crop": "Rice"}',
+        "not json",
+    ]
+    responses = [strict_loads(line) for line in predict_requests(model, lines)]
+
+    assert [response.get("id") for response in responses] == [1, 2, 3, 4, 5, None]
+    assert responses[1]["error"] == "missing input 'soil_ph'"
+    assert responses[2]["error"] == 'invalid rainfall_mm: "lots"'
+    assert responses[4]["error"].startswith("missing input")
+    assert responses[5]["error"].startswith("invalid JSON")
+    # A numeric string is read as the number
+    assert responses[3]["yield"] == responses[0]["yield"]
+
+
+def test_non_finite_predictions_become_errors(model, monkeypatch):
+    monkeypatch.setattr(model, "predict", lambda *_, **__: {"yield": [float("nan")]})
+    written = []
+    chunks = iter([(scenario(id=7) + "\n").encode(), b""])
+    serve_stream(model, lambda: next(chunks), written.append)
+
+    response = strict_loads(b"".join(written))
+    assert response == {"id": 7, "error": "prediction is not a finite number"}
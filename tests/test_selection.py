@@ -0,0 +1,92 @@
+"""
+Tests for budgeted model selection
+"""
+
+import numpy as np
+import pytest
+from joblib import Memory
+
+from sklearn.linear_model import Ridge
+from sklearn.model_selection import KFold, cross_val_score
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from seed import selection
+from seed.selection import FoldCache, ModelSelector, extrapolate_fit_seconds
+
+
+def test_fit_time_extrapolation_is_linear_in_rows():
+    assert extrapolate_fit_seconds((100, 200), (1.0, 1.5), 400) == pytest.approx(2.5)
+    # Noisy timings never extrapolate to a shrinking cost
+    assert extrapolate_fit_seconds((100, 200), (1.5, 1.0), 400) == pytest.approx(1.0)
+
+
+def test_exhausted_budget_skips_expensive_candidates_and_logs_why():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(150, 4))
+    y = X[:, 0] + rng.normal(scale=0.1, size=150)
+
+    selector = ModelSelector(time_budget=0.0)
+    selector.start(n_targets=1)
+    best = selector.select("yield", X, y)
+
+    statuses = {entry["model"]: entry["status"] for entry in selector.log}
+    assert statuses == {
+        "Ridge Regression": "evaluated",
+        "Linear Regression": "evaluated",
+        "Gradient Boosting": "skipped",
+        "Random Forest": "skipped",
+    }
+    assert all("reason" in entry for entry in selector.log if entry["status"] == "skipped")
+    assert type(best).__name__ in ("Ridge", "LinearRegression")
+
+
+def test_fold_cache_scales_each_fold_once_without_leakage(tmp_path, monkeypatch):
+    rng = np.random.default_rng(1)
+    X = rng.normal(loc=5.0, scale=3.0, size=(100, 3))
+    y_a, y_b = X @ [1.0, 2.0, 0.0], X @ [0.0, 1.0, -1.0]
+
+    calls = []
+    scale_fold = selection.scale_fold
+    monkeypatch.setattr(
+        selection, "scale_fold", lambda *args: calls.append(1) or scale_fold(*args)
+    )
+    folds = FoldCache(X, n_splits=5)
+    scores_a = folds.cv_score(Ridge(), y_a)
+    folds.cv_score(Ridge(alpha=10.0), y_b)
+    assert len(calls) == 5
+
+    # Same scores as a scaler fitted inside each fold by a Pipeline
+    expected = cross_val_score(
+        make_pipeline(StandardScaler(), Ridge()), X, y_a, cv=KFold(5), scoring="r2"
+    )
+    np.testing.assert_allclose(scores_a, expected)
+
+
+def test_fold_cache_persists_scaled_folds_on_disk(tmp_path):
+    X = np.random.default_rng(2).normal(size=(60, 3))
+    folds = FoldCache(X, n_splits=3, cache_dir=tmp_path)
+    folds.cv_score(Ridge(), X[:, 0])
+
+    # A later run on the same data finds every fold already scaled
+    memory = Memory(tmp_path, verbose=0)
+    for train_rows, valid_rows in FoldCache(X, n_splits=3).folds:
+        assert memory.cache(selection.scale_fold).check_call_in_cache(
+            X, train_rows, valid_rows
+        )
+
+
+def test_selector_keeps_out_of_fold_predictions_by_candidate_name():
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(120, 3))
+    y = X[:, 0] - X[:, 2] + rng.normal(scale=0.1, size=120)
+
+    folds = FoldCache(X, n_splits=5)
+    selector = ModelSelector(time_budget=0.0)
+    selector.start(n_targets=1)
+    selector.select("yield", X, y, cv_predict=folds.cv_predict)
+
+    oof = selector.oof_predictions["yield"]
+    assert set(oof) == set(selector.evaluated["yield"])
+    ridge = selector.evaluated["yield"]["Ridge Regression"]
+    np.testing.assert_allclose(oof["Ridge Regression"], folds.cv_predict(ridge, y)[1])
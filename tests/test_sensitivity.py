@@ -0,0 +1,57 @@
+"""
+Tests for the partial-dependence (sensitivity) analysis
+"""
+
+import numpy as np
+import pytest
+
+from seed.model import SeedModel
+from seed.packed_trees import is_packable
+from seed.sensitivity import partial_dependence_table
+
+FEATURES = ["soil_ph", "market_demand_index", "fuel_price_usd_liter"]
+
+
+@pytest.fixture(scope="module")
+def models(tmp_path_factory):
+    model = SeedModel()
+    data = model.load_real_data(years=range(2001, 2011))
+    model.train_models(data, distill=False)
+    model_path = tmp_path_factory.mktemp("model") / "model.pkl"
+    model.save_model(model_path)
+    loaded = SeedModel()
+    loaded.load_model(model_path)
+    return model, loaded
+
+
+def curve(table, target):
+    return table.loc[table["target"] == target, "partial_dependence"].to_numpy()
+
+
+def test_recursion_matches_brute_for_fitted_and_loaded_trees(models):
+    model, loaded = models
+    brute = partial_dependence_table(model, features=FEATURES, method="brute")
+    fitted = partial_dependence_table(model, features=FEATURES, method="recursion")
+    packed = partial_dependence_table(loaded, features=FEATURES, method="recursion")
+
+    trees = [target for target, estimator in model.models.items() if is_packable(estimator)]
+    assert trees
+    for target in trees:
+        # The flattened trees reproduce sklearn's recursion exactly
+        np.testing.assert_allclose(curve(packed, target), curve(fitted, target), rtol=1e-9)
+        # Recursion weights by training samples per node, brute averages the
+        # background rows: the same curves up to that difference
+        recursion, expected = curve(packed, target), curve(brute, target)
+        assert np.corrcoef(recursion, expected)[0, 1] > 0.99
+        assert np.abs(recursion - expected).mean() < 0.1 * np.abs(expected).mean()
+
+
+def test_loaded_models_use_recursion_where_valid(models):
+    model, loaded = models
+    table = partial_dependence_table(loaded, features=FEATURES + ["rainfall_mm"])
+    methods = table.groupby(["target", "feature"])["method"].first()
+    for target, estimator in model.models.items():
+        expected = "recursion" if is_packable(estimator) else "brute"
+        assert methods[(target, "soil_ph")] == expected
+        # Sweeping a raw input of a derived feature always needs brute force
+        assert methods[(target, "rainfall_mm")] == "brute"
@@ -0,0 +1,34 @@
+"""
+Tests for per-crop sharded models
+"""
+
+import numpy as np
+import pytest
+
+from seed.model import SeedModel
+from seed.sharding import ShardedSeedModel
+
+
+def test_predictions_are_routed_to_each_crops_shard(tmp_path):
+    data = SeedModel().load_real_data(years=range(2001, 2011))
+    model = ShardedSeedModel(n_jobs=1)
+    model.train_models(data)
+    assert set(model.shards) == set(data["crop"])
+
+    scenarios = data.sample(200, replace=True, random_state=0).reset_index(drop=True)
+    predictions = model.predict(scenarios)
+
+    _, X = model.build_feature_matrix(scenarios)
+    for crop in ["Rice", "Cotton"]:
+        rows = np.flatnonzero(scenarios["crop"] == crop)
+        shard = model.shards[crop]
+        expected = shard["models"]["yield"].predict(shard["scaler"].transform(X[rows]))
+        np.testing.assert_allclose(predictions["yield"][rows], expected)
+
+    model.save_model(tmp_path / "sharded.pkl")
+    loaded = ShardedSeedModel()
+    loaded.load_model(tmp_path / "sharded.pkl", mmap_mode="r")
+    np.testing.assert_allclose(loaded.predict(scenarios)["price"], predictions["price"])
+
+    with pytest.raises(ValueError, match="Banana"):
+        model.predict(scenarios.assign(crop="Banana"))
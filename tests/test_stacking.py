@@ -0,0 +1,56 @@
+"""
+Tests for stacked ensembles built from the selection CV pass
+"""
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.linear_model import Ridge
+
+from seed.model import SeedModel
+from seed.selection import FoldCache
+from seed.stacking import StackedRegressor, fit_stack
+
+
+def test_stack_is_fitted_from_out_of_fold_predictions():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 4))
+    y = 3 * X[:, 0] + np.sin(3 * X[:, 1]) + rng.normal(scale=0.1, size=300)
+
+    folds = FoldCache(X, n_splits=5)
+    candidates = {
+        "Ridge Regression": Ridge(alpha=1.0),
+        "Gradient Boosting": GradientBoostingRegressor(n_estimators=50, random_state=0),
+    }
+    oof = {}
+    for name, estimator in candidates.items():
+        scores, oof[name] = folds.cv_predict(estimator, y)
+        np.testing.assert_allclose(scores, folds.cv_score(estimator, y))
+
+    stack, oof_r2 = fit_stack(candidates, oof, X, y, n_jobs=1)
+    assert (stack.weights >= 0).all()
+    assert oof_r2 > max(1 - np.var(y - oof[name]) / np.var(y) for name in oof) - 1e-9
+
+    bias, contributions = stack.contributions(X[:20])
+    np.testing.assert_allclose(bias + contributions.sum(axis=1), stack.predict(X[:20]))
+    np.testing.assert_allclose(stack.packed().predict(X[:20]), stack.predict(X[:20]), rtol=1e-5)
+
+
+def test_train_models_stack_mode(tmp_path):
+    model = SeedModel()
+    data = model.load_real_data(years=range(2001, 2011))
+    model.train_models(data, distill=False, stack=True, n_jobs=1)
+
+    assert all(isinstance(m, StackedRegressor) for m in model.models.values())
+    assert set(model.stacking_report) == {"yield", "price", "production"}
+
+    scenarios = data.head(10)
+    explanation = model.explain(scenarios)["price"]
+    np.testing.assert_allclose(explanation["prediction"], model.predict(scenarios)["price"])
+    assert model.get_feature_importance("yield")["importance"].sum() > 0
+
+    model.save_model(tmp_path / "stacked.pkl")
+    loaded = SeedModel()
+    loaded.load_model(tmp_path / "stacked.pkl", mmap_mode="r")
+    np.testing.assert_allclose(
+        loaded.predict(scenarios)["yield"], model.predict(scenarios)["yield"], rtol=1e-5
+    )